@@ -0,0 +1,279 @@
+"""Module docstring"""
+
+import argparse
+import functools
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from game.board import Board
+from game.tictactoe import (is_symmetric, is_winning_move, iter_move_win_stats,
+                            move_win_stats, move_win_stats_fast)
+
+
+FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.2
+
+N = None
+
+# (name, side, total_player, cur_player, win_len, values)
+BOARDS = [
+    ("3x3-2p-empty", 3, 2, 0, None, [N, N, N, N, N, N, N, N, N]),
+    ("3x3-2p-center", 3, 2, 1, None, [N, N, N, N, 0, N, N, N, N]),
+    ("3x3-3p-corner", 3, 3, 1, None, [0, N, N, N, N, N, N, N, N]),
+    ("4x4-2p-filled8", 4, 2, 0, None, [0, 1, 0, 1, 1, 0, 1, 0, N, N, N, N, N, N, N, N]),
+    ("4x4-2p-k3-filled10", 4, 2, 0, 3, [0, 1, N, N, 1, 0, N, 0, N, 1, 0, 1, N, 0, N, 1]),
+    ("5x5-3p-k4-filled17", 5, 3, 1, 4, [0, 1, 2, 0, N, 2, 0, 1, N, 1, N, 2, 0,
+                                        1, 2, 1, N, 2, 0, N, 0, 1, N, 2, N])
+]
+
+# Functions searched on every board. The flag tells whether the search
+# collates symmetric moves, which decides how its nodes are counted.
+SEARCHES = [
+    ("move_win_stats", move_win_stats, False),
+    ("move_win_stats_fast", move_win_stats_fast, True),
+    ("move_win_stats_fast-iterative",
+     functools.partial(move_win_stats_fast, engine="iterative"), True)
+]
+
+# Boards too large for the plain search to finish quickly.
+_SKIP = {("move_win_stats", "3x3-3p-corner")}
+
+
+def _board(values, side):
+    """Returns a new Board holding the values."""
+    return Board(side, list(values))
+
+
+def _count_nodes(board, cur_player, total_player, win_len, symmetric):
+    """Returns the number of moves played by a search of the position."""
+    nodes = [0]
+
+    def record(count, remaining):
+        nodes[0] = count
+
+    for result in iter_move_win_stats(board, cur_player, total_player, win_len=win_len,
+                                      symmetric=symmetric, progress_fn=record,
+                                      progress_interval=1 << 62):
+        pass
+
+    return nodes[0]
+
+
+def _measure(fn, repeat):
+    """Returns the best wall time of repeat calls to fn and the peak
+    memory allocated by one more call."""
+    best = None
+    for i in range(repeat):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return (best, peak)
+
+
+def _search_cases():
+    """Yields (name, fn, nodes_fn) for every search benchmark."""
+    for (board_name, side, total_player, cur_player, win_len, values) in BOARDS:
+        for (search_name, search_fn, symmetric) in SEARCHES:
+            if (search_name, board_name) in _SKIP:
+                continue
+
+            def run(search_fn=search_fn, side=side, values=values, cur_player=cur_player,
+                    total_player=total_player, win_len=win_len):
+                search_fn(_board(values, side), cur_player, total_player, win_len=win_len)
+
+            def nodes(side=side, values=values, cur_player=cur_player,
+                      total_player=total_player, win_len=win_len, symmetric=symmetric):
+                return _count_nodes(_board(values, side), cur_player, total_player,
+                                    win_len, symmetric)
+
+            yield ("{}/{}".format(search_name, board_name), run, nodes)
+
+
+def _hot_path_cases():
+    """Yields (name, fn, ops) for the Board and move check benchmarks.
+    Each fn performs ops operations."""
+    for side in (3, 8):
+        # Alternating values so no line is complete and the board is
+        # symmetric about its main diagonal.
+        values = [(idx // side + idx % side) % 2 for idx in range(side*side)]
+        board = Board(side, values)
+        positions = [(row, col) for row in range(side) for col in range(side)]
+        rounds = 20000 // len(positions) + 1
+        ops = rounds * len(positions)
+
+        def board_set(side=side, values=values, positions=positions, rounds=rounds):
+            board = Board(side, list(values))
+            for i in range(rounds):
+                for (row, col) in positions:
+                    board.set(row, col, values[row*side + col])
+
+        def winning_move(board=board, positions=positions, rounds=rounds):
+            for i in range(rounds):
+                for (row, col) in positions:
+                    is_winning_move(board, row, col)
+
+        def symmetric(board=board, rounds=ops // 8):
+            for i in range(rounds):
+                is_symmetric(board, lambda pos: (pos[1], pos[0]))
+
+        yield ("Board.set/{}x{}".format(side, side), board_set, ops)
+        yield ("is_winning_move/{}x{}".format(side, side), winning_move, ops)
+        yield ("is_symmetric/{}x{}".format(side, side), symmetric, ops // 8)
+
+
+def run_benchmarks(name_filter=None, repeat=3, out=None):
+    """Runs the benchmark suite and returns its report.
+
+    Search benchmarks report the moves played per second of wall time.
+    Hot path benchmarks report the calls per second.
+
+    Args:
+        name_filter (str): Only benchmarks whose name contains this
+            string are run. Defaults to None, which runs all of them.
+        repeat (int): Number of timed runs of each benchmark. The best
+            time is reported. Defaults to 3.
+        out: Stream to print one line per benchmark to as it finishes.
+            Defaults to None, which prints nothing.
+
+    Returns:
+        A dictionary with the format version, the platform and a results
+        dictionary keyed by benchmark name. Each result holds wall_time
+        in seconds, peak_memory in bytes, and either nodes and
+        nodes_per_sec or ops and ops_per_sec.
+
+    Raises:
+        ValueError: repeat must be greater than 0.
+    """
+    if repeat <= 0:
+        raise ValueError("repeat must be greater than 0.")
+
+    results = {}
+
+    def selected(name):
+        return name_filter is None or name_filter in name
+
+    for (name, fn, nodes_fn) in _search_cases():
+        if not selected(name):
+            continue
+        (wall_time, peak) = _measure(fn, repeat)
+        nodes = nodes_fn()
+        results[name] = {"wall_time": wall_time, "peak_memory": peak,
+                         "nodes": nodes, "nodes_per_sec": nodes / wall_time}
+        _report(out, name, results[name])
+
+    for (name, fn, ops) in _hot_path_cases():
+        if not selected(name):
+            continue
+        (wall_time, peak) = _measure(fn, repeat)
+        results[name] = {"wall_time": wall_time, "peak_memory": peak,
+                         "ops": ops, "ops_per_sec": ops / wall_time}
+        _report(out, name, results[name])
+
+    return {"version": FORMAT_VERSION,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results}
+
+
+def _report(out, name, result):
+    """Prints a benchmark result line."""
+    if out is None:
+        return
+
+    if "nodes" in result:
+        rate = "{:.0f} nodes/s".format(result["nodes_per_sec"])
+    else:
+        rate = "{:.0f} ops/s".format(result["ops_per_sec"])
+    print("{:<45} {:>10.4f} s {:>18} {:>10.1f} KiB".format(
+        name, result["wall_time"], rate, result["peak_memory"] / 1024), file=out, flush=True)
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Returns the benchmarks of a report that regressed against a
+    baseline report.
+
+    A benchmark regresses when its wall time is more than threshold
+    times slower than the baseline wall time. Benchmarks missing from
+    either report are ignored.
+
+    Args:
+        report (dict): Report returned by run_benchmarks.
+        baseline (dict): Earlier report to compare against.
+        threshold (float): Allowed relative slow down. Defaults to 0.2.
+
+    Returns:
+        A list of (name, baseline wall time, wall time) tuples sorted by
+        name.
+
+    Raises:
+        ValueError: threshold must be 0 or greater.
+        ValueError: report versions do not match.
+    """
+    if threshold < 0:
+        raise ValueError("threshold must be 0 or greater.")
+    if report.get("version") != baseline.get("version"):
+        raise ValueError("report versions do not match.")
+
+    regressions = []
+    for name in sorted(report["results"]):
+        if name not in baseline["results"]:
+            continue
+        old = baseline["results"][name]["wall_time"]
+        new = report["results"][name]["wall_time"]
+        if new > old * (1 + threshold):
+            regressions.append((name, old, new))
+
+    return regressions
+
+
+def _main(argv=None):
+    """Runs the benchmark suite from the command line. Returns 1 if any
+    benchmark regressed against the baseline and 0 otherwise."""
+    parser = argparse.ArgumentParser(description="Benchmarks the Tic Tac Toe solver.")
+    parser.add_argument("--filter", default=None,
+                        help="only run benchmarks whose name contains this string")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs of each benchmark, the best is kept (default: 3)")
+    parser.add_argument("--output", default=None,
+                        help="write the JSON report to this path")
+    parser.add_argument("--baseline", default=None,
+                        help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slow down against the baseline (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.filter, args.repeat, sys.stdout)
+
+    if args.output is not None:
+        with open(args.output, "w") as out:
+            json.dump(report, out, indent=2, sort_keys=True)
+            out.write("\n")
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+
+    regressions = compare(report, baseline, args.threshold)
+    for (name, old, new) in regressions:
+        print("REGRESSION {}: {:.4f} s -> {:.4f} s ({:+.0%})".format(
+            name, old, new, new / old - 1))
+
+    return 1 if len(regressions) > 0 else 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -0,0 +1,112 @@
+"""Module docstring"""
+
+from .board import Board
+from .lines import line_cells
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+OPEN = -1
+
+
+def _require_numpy():
+    """Raises ImportError if NumPy is not installed."""
+    if np is None:
+        raise ImportError("numpy is required for batch win detection.")
+
+
+def boards_to_array(boards):
+    """Returns an (N, side, side) integer array holding the values of the
+    given boards.
+
+    Open locations are stored as OPEN (-1). All boards must have the same
+    side length and hold only None and non-negative integer values.
+
+    Args:
+        boards: Sequence of Board objects.
+
+    Raises:
+        ImportError: numpy is required for batch win detection.
+        TypeError: boards must be Board objects.
+        ValueError: boards must have the same side length.
+        ValueError: board values must be None or non-negative integers.
+    """
+    _require_numpy()
+
+    boards = list(boards)
+    if not all(isinstance(board, Board) for board in boards):
+        raise TypeError("boards must be Board objects.")
+    if len(boards) == 0:
+        return np.zeros((0, 0, 0), dtype=np.int64)
+
+    side = boards[0].side_len()
+    if any(board.side_len() != side for board in boards):
+        raise ValueError("boards must have the same side length.")
+
+    cells = []
+    for board in boards:
+        for val in board._values():
+            if val is None:
+                cells.append(OPEN)
+            elif isinstance(val, int) and val >= 0:
+                cells.append(val)
+            else:
+                raise ValueError("board values must be None or non-negative integers.")
+
+    return np.array(cells, dtype=np.int64).reshape(len(boards), side, side)
+
+
+def batch_winners(boards, win_len=None):
+    """Returns the winning player of each board in a batch.
+
+    A player wins a board when they hold every location of a horizontal,
+    vertical or diagonal line of win_len locations. Every line of every
+    board is checked at once with array reductions over the precomputed
+    line table.
+
+    Args:
+        boards: (N, side, side) integer array of any integer dtype with
+            OPEN (-1) for open locations and player numbers elsewhere, or
+            a sequence of Board objects.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Returns:
+        An integer array of length N holding the winning player number of
+        each board, or OPEN (-1) if no player has a line. If several
+        players have a line the smallest player number is returned.
+
+    Raises:
+        ImportError: numpy is required for batch win detection.
+        TypeError: boards must be an integer array.
+        ValueError: boards must be an (N, side, side) array.
+        ValueError: win_len must be between 1 and side.
+    """
+    _require_numpy()
+
+    if not isinstance(boards, np.ndarray):
+        boards = boards_to_array(boards)
+    if not np.issubdtype(boards.dtype, np.integer):
+        raise TypeError("boards must be an integer array.")
+    boards = boards.astype(np.int64, copy=False)
+    if boards.ndim != 3 or boards.shape[1] != boards.shape[2]:
+        raise ValueError("boards must be an (N, side, side) array.")
+    if boards.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    side = boards.shape[1]
+    lines = np.array(line_cells(side, win_len), dtype=np.intp)
+
+    flat = boards.reshape(boards.shape[0], side*side)
+    vals = flat[:, lines]
+    first = vals[:, :, 0]
+    is_line = (first != OPEN) & np.all(vals == first[:, :, np.newaxis], axis=2)
+
+    limit = np.iinfo(np.int64).max
+    owners = np.where(is_line, first, limit)
+    winners = owners.min(axis=1)
+    winners[winners == limit] = OPEN
+    return winners
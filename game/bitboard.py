@@ -0,0 +1,331 @@
+"""Module docstring"""
+
+from .board import Board
+from .lines import cell_lines, line_cells, validate_win_len
+
+
+_LINE_MASKS = {}
+
+
+def line_masks(side, win_len=None):
+    """Returns a tuple of bit masks for every winning line on a board
+    of the given side length.
+
+    Bit row*side + col of a mask is set when location (row,col) is part
+    of the line. Lines are listed in the order of lines.line_cells.
+    Masks are computed once per side length and win length.
+
+    Args:
+        side (int): Length of board on one side. Must be greater than 0.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Raises:
+        ValueError: game board side must be greater than 0.
+        ValueError: win_len must be between 1 and side.
+    """
+    lines = line_cells(side, win_len)
+    key = (side, validate_win_len(side, win_len))
+
+    if key not in _LINE_MASKS:
+        masks = tuple(sum(1 << idx for idx in line) for line in lines)
+        _LINE_MASKS[key] = (masks, tuple(tuple(masks[line_id] for line_id in line_ids)
+                                         for line_ids in cell_lines(side, win_len)))
+
+    return _LINE_MASKS[key][0]
+
+
+def cell_line_masks(side, win_len=None):
+    """Returns a tuple indexed by location index holding the tuple of
+    line masks passing through each location.
+
+    Args:
+        side (int): Length of board on one side. Must be greater than 0.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Raises:
+        ValueError: game board side must be greater than 0.
+        ValueError: win_len must be between 1 and side.
+    """
+    line_masks(side, win_len)
+    return _LINE_MASKS[(side, validate_win_len(side, win_len))][1]
+
+
+class BitBoard(object):
+    """Class used to represent a square Tic Tac Toe board with one
+    integer bit mask per player.
+
+    The board is immutable. Location (row,col) maps to bit row*side + col
+    of a mask and is open when no player's mask has that bit set. Placing
+    a value is a bitwise OR and checking a line is a bitwise AND followed
+    by a compare against a precomputed line mask.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, side, total_player, masks=None):
+        """Initializes a bit board of the given side length, number of
+        players and player masks.
+
+        Args:
+            side (int): Length of board on one side. Must be greater
+                than 0.
+            total_player (int): Total number of players. Must be greater
+                than 0.
+            masks: Sequence of integer bit masks, one per player, with
+                no bit set at or above side*side and no bit set in more
+                than one mask. Defaults to None, which creates an empty
+                board.
+
+        Raises:
+            ValueError: game board side must be greater than 0.
+            ValueError: total_player must be greater than 0.
+            ValueError: game board masks must have one mask per player.
+            ValueError: game board masks must only hold locations of the board.
+            ValueError: game board masks must not overlap.
+        """
+        if side <= 0:
+            raise ValueError("game board side must be greater than 0.")
+        if total_player <= 0:
+            raise ValueError("total_player must be greater than 0.")
+
+        self._side = side
+
+        if masks is None:
+            self._masks = (0,) * total_player
+        else:
+            if len(masks) != total_player:
+                raise ValueError("game board masks must have one mask per player.")
+            self._masks = tuple(masks)
+
+        self._occupied = 0
+        for mask in self._masks:
+            if mask < 0 or mask >> (side*side):
+                raise ValueError("game board masks must only hold locations of the board.")
+            if self._occupied & mask:
+                raise ValueError("game board masks must not overlap.")
+            self._occupied |= mask
+
+        self._cells = None
+
+    @classmethod
+    def from_board(cls, board, total_player):
+        """Returns a bit board with the same values as the given board.
+
+        Args:
+            board (Board): Game board. Locations must have the value None
+                or a player number between 0 and total_player-1.
+            total_player (int): Total number of players.
+
+        Raises:
+            TypeError: board must be a Board object.
+            ValueError: game board values must be None or a player number.
+        """
+        if not isinstance(board, Board):
+            raise TypeError("board must be a Board object.")
+
+        side = board.side_len()
+        masks = [0 for i in range(total_player)]
+
+        for idx, val in enumerate(board._values()):
+            if val is None:
+                continue
+            if not isinstance(val, int) or val < 0 or val >= total_player:
+                raise ValueError("game board values must be None or a player number.")
+            masks[val] |= 1 << idx
+
+        return cls(side, total_player, masks)
+
+    def __str__(self):
+        """Retuns a string representation of the board."""
+        return str(self.to_board())
+
+    def _validate_row(self, row):
+        """Raises ValueError if row location value is invalid.
+
+        Args:
+            row (int): Row location.
+        """
+        if row < 0 or row >= self._side:
+            raise ValueError("game board row must be between 0 and side-1.")
+
+    def _validate_col(self, col):
+        """Raises ValueError if column location value is invalid.
+
+        Args:
+            col (int): Column location.
+        """
+        if col < 0 or col >= self._side:
+            raise ValueError("game board column must be between 0 and side-1.")
+
+    def _value(self, idx):
+        """Returns player number at the given location index or None if
+        the location is open.
+
+        Args:
+            idx (int): Location index.
+        """
+        bit = 1 << idx
+        if not self._occupied & bit:
+            return None
+        for player, mask in enumerate(self._masks):
+            if mask & bit:
+                return player
+
+    def _values(self):
+        """Returns tuple of location values in row first order. The tuple
+        is built on first use and kept for the life of the board."""
+        if self._cells is None:
+            cells = [None] * (self._side*self._side)
+            for player, mask in enumerate(self._masks):
+                while mask:
+                    low = mask & -mask
+                    cells[low.bit_length() - 1] = player
+                    mask ^= low
+            self._cells = tuple(cells)
+        return self._cells
+
+    def side_len(self):
+        """Returns length of board's side."""
+        return self._side
+
+    def total_player(self):
+        """Returns number of players."""
+        return len(self._masks)
+
+    def masks(self):
+        """Returns tuple of player bit masks."""
+        return self._masks
+
+    def get(self, row, col):
+        """Returns player number at given row and column location or
+        None if the location is open.
+
+        Args:
+            row (int): Row location.
+            col (int): Column location.
+
+        Raises:
+            ValueError: game board row must be between 0 and side-1.
+            ValueError: game board column must be between 0 and side-1.
+        """
+        self._validate_row(row)
+        self._validate_col(col)
+        return self._value(row*self._side + col)
+
+    def set(self, row, col, val):
+        """Returns a new board that is a copy of the existing board
+        with the given location set to a new value.
+
+        Args:
+            row (int): Row location for new value.
+            col (int): Column location for new value.
+            val: Player number to set at the given location, or None to
+                open the location.
+
+        Raises:
+            ValueError: game board row must be between 0 and side-1.
+            ValueError: game board column must be between 0 and side-1.
+            ValueError: game board values must be None or a player number.
+        """
+        self._validate_row(row)
+        self._validate_col(col)
+
+        total_player = len(self._masks)
+        if val is not None and (not isinstance(val, int) or val < 0 or val >= total_player):
+            raise ValueError("game board values must be None or a player number.")
+
+        bit = 1 << (row*self._side + col)
+
+        if not self._occupied & bit:
+            if val is None:
+                return self
+            masks = list(self._masks)
+            masks[val] |= bit
+        else:
+            masks = [mask & ~bit for mask in self._masks]
+            if val is not None:
+                masks[val] |= bit
+
+        return BitBoard(self._side, total_player, masks)
+
+    def is_winning_move(self, row, col, win_len=None):
+        """Returns True if the value in the given location completes a
+        line of win_len locations. Returns False otherwise.
+
+        Args:
+            row (int): Row location.
+            col (int): Column location.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+
+        Raises:
+            ValueError: game board row must be between 0 and side-1.
+            ValueError: game board column must be between 0 and side-1.
+            ValueError: win_len must be between 1 and side.
+        """
+        self._validate_row(row)
+        self._validate_col(col)
+
+        idx = row*self._side + col
+        player = self._value(idx)
+        lines = cell_line_masks(self._side, win_len)[idx]
+
+        if player is None:
+            # Matches Board semantics where a line of open locations
+            # holds equal values.
+            for line in lines:
+                if not self._occupied & line:
+                    return True
+            return False
+
+        mask = self._masks[player]
+        for line in lines:
+            if mask & line == line:
+                return True
+
+        return False
+
+    def is_symmetric(self, symmetry_fn):
+        """Returns True if the board is symmetric based on the symmetry
+        function. Returns False otherwise.
+
+        Args:
+            symmetry_fn: Callable mapping a (row,col) tuple to its
+                symmetric (row,col) tuple.
+        """
+        side = self._side
+        cells = self._values()
+
+        for row in range(side):
+            for col in range(side):
+                (sym_row, sym_col) = symmetry_fn((row, col))
+                if cells[row*side + col] != cells[sym_row*side + sym_col]:
+                    return False
+
+        return True
+
+    def matching_positions(self, val):
+        """Returns list of (row,column) tuples for all board locations
+        with the given value in row first order.
+
+        Args:
+            val: Player number to match, or None to match open locations.
+        """
+        if val is None:
+            mask = ~self._occupied
+        elif isinstance(val, int) and 0 <= val < len(self._masks):
+            mask = self._masks[val]
+        else:
+            return []
+
+        side = self._side
+        return [(idx // side, idx % side)
+                for idx in range(side*side) if mask >> idx & 1]
+
+    def to_board(self):
+        """Returns a Board with the same values as this bit board."""
+        return Board(self._side, [self._value(idx)
+                                  for idx in range(self._side*self._side)])
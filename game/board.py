@@ -1,5 +1,10 @@
 """Module docstring"""
 
+import weakref
+
+from .zobrist import board_key, cell_key
+
+
 class Board(object):
     """Class used to represent a square game board with a value at each 
     location.
@@ -8,10 +13,17 @@ class Board(object):
     locations are referenced by row and column values, which range from 
     0 to the length of the side minus 1.
 
+    Boards compare equal when they have the same side length and values.
+    Boards holding only hashable values are hashable, so they can be used
+    as dictionary keys. The hash is the board's Zobrist key, which is
+    computed once per board and updated in constant time by set.
+
     Attributes:
         None
     """
 
+    __slots__ = ("_side", "_vals", "_zobrist", "__weakref__")
+
     def __init__(self, side, ivals=None):
         """Initializes a game board of the given side length and 
         initial location values.
@@ -36,14 +48,51 @@ class Board(object):
             raise ValueError("game board side must be greater than 0.")
         
         self._side = side
+        self._zobrist = None
 
         if isinstance(ivals, list) and len(ivals) > 0:
             if len(ivals) != side*side:
                 raise ValueError("game board initialization list must have a value for all locations.")
 
-            self._vals = ivals.copy()
+            self._vals = tuple(ivals)
         else:
-            self._vals = [ivals for i in range(side*side)]
+            self._vals = (ivals,) * (side*side)
+
+    @classmethod
+    def _from_values(cls, side, vals, zobrist=None):
+        """Returns a board sharing the given tuple of values in row first
+        order and optional Zobrist key without validating them."""
+        board = cls.__new__(cls)
+        board._side = side
+        board._vals = vals
+        board._zobrist = zobrist
+        return board
+
+    def __eq__(self, other):
+        """Returns True if the other board has the same side length and
+        values."""
+        if not isinstance(other, Board):
+            return NotImplemented
+        return self is other or (self._side == other._side and self._vals == other._vals)
+
+    def __hash__(self):
+        """Returns the Zobrist key of the board.
+
+        Raises:
+            TypeError: board values must be hashable.
+        """
+        return self.zobrist_key()
+
+    def zobrist_key(self):
+        """Returns the 64 bit Zobrist key of the board, the side length key
+        combined with the key of each location value by exclusive or.
+
+        Raises:
+            TypeError: board values must be hashable.
+        """
+        if self._zobrist is None:
+            self._zobrist = board_key(self._side, self._vals)
+        return self._zobrist
 
     def __str__(self):
         """Retuns a string representation of the board."""
@@ -51,7 +100,7 @@ class Board(object):
 
         for row in range(self._side):
             for col in range(self._side):
-                _strs.append(str(self.get(row, col)))
+                _strs.append(str(self._vals[row*self._side + col]))
                 if col < self._side - 1:
                     _strs.append(", ")
                 elif row < self._side - 1:
@@ -80,14 +129,11 @@ class Board(object):
             raise ValueError("game board column must be between 0 and side-1.")
 
 
-    def _idx(self, row, col):
-        """Returns list index for given row and column location.
-        
-        Args:
-            row (int): Row location.
-            col (int): Column location.
-        """
-        return row*self._side + col
+    def _values(self):
+        """Returns tuple of location values in row first order without
+        copying. For internal callers that index it directly after
+        validating locations once."""
+        return self._vals
 
 
     def side_len(self):
@@ -108,7 +154,7 @@ class Board(object):
         """
         self._validate_row(row)
         self._validate_col(col)
-        return self._vals[self._idx(row, col)]
+        return self._vals[row*self._side + col]
 
 
     def get_row(self, row):
@@ -121,7 +167,8 @@ class Board(object):
             ValueError: game board row must be between 0 and side-1.
         """
         self._validate_row(row)
-        return [self.get(row, col) for col in range(self._side)]
+        side = self._side
+        return list(self._vals[row*side:(row + 1)*side])
 
 
     def get_col(self, col):
@@ -134,20 +181,21 @@ class Board(object):
             ValueError: game board column must be between 0 and side-1.
         """
         self._validate_col(col)
-        return [self.get(row, col) for row in range(self._side)]
+        return list(self._vals[col::self._side])
 
 
     def get_ldiag(self):
         """Returns list of board values along the diagonal from location
         (0,0) to (side-1,side-1)."""
-        return [self.get(idx, idx) for idx in range(self._side)]
+        return list(self._vals[::self._side + 1])
 
 
     def get_rdiag(self):
         """Returns list of board values along the diagonal from location
         (0,side-1) to (side-1,0)."""
         side = self._side
-        return [self.get(idx, side-idx-1) for idx in range(side)]
+        vals = self._vals
+        return [vals[idx*side + side-idx-1] for idx in range(side)]
 
 
     def set(self, row, col, val):
@@ -166,8 +214,48 @@ class Board(object):
         self._validate_row(row)
         self._validate_col(col)
 
-        new_board = Board(self._side, self._vals)
-        
-        new_board._vals[self._idx(row, col)] = val
-        
-        return new_board
+        idx = row*self._side + col
+        vals = self._vals[:idx] + (val,) + self._vals[idx + 1:]
+
+        zobrist = self._zobrist
+        if zobrist is not None:
+            try:
+                zobrist ^= cell_key(self._side, idx, self._vals[idx]) ^ cell_key(self._side, idx, val)
+            except TypeError:
+                zobrist = None
+
+        return Board._from_values(self._side, vals, zobrist)
+
+
+_INTERNED = weakref.WeakValueDictionary()
+
+
+def intern_board(board):
+    """Returns the shared instance of boards equal to the given board.
+
+    The first board interned with a given side length and values becomes
+    the shared instance and is returned for every equal board interned
+    while it is still referenced elsewhere. Interning boards that are
+    built repeatedly lets them share memory and makes equality checks
+    between interned boards an identity check.
+
+    Args:
+        board (Board): Game board. Its values must be hashable.
+
+    Raises:
+        TypeError: board must be a Board object.
+        TypeError: board values must be hashable.
+    """
+    if not isinstance(board, Board):
+        raise TypeError("board must be a Board object.")
+
+    key = (board._side, board._vals)
+    try:
+        shared = _INTERNED.get(key)
+    except TypeError:
+        raise TypeError("board values must be hashable.")
+
+    if shared is None:
+        _INTERNED[key] = board
+        shared = board
+    return shared
@@ -0,0 +1,327 @@
+"""Module docstring"""
+
+import argparse
+import bisect
+import mmap
+import struct
+import sys
+
+from .bitboard import BitBoard
+from .board import Board
+from .lines import validate_win_len
+from .search import SearchState
+from .tictactoe import next_player
+
+
+_MAGIC = b"TTTDB\x00\x00\x01"
+_HEADER = struct.Struct("<8s4IQ")
+
+
+def _base(total_player):
+    """Returns the digit base of the position encoding."""
+    return total_player + 1
+
+
+def _validate_size(side, total_player):
+    """Raises ValueError if positions of the given size do not fit in a
+    64 bit key."""
+    if side <= 0:
+        raise ValueError("game board side must be greater than 0.")
+    if total_player <= 0:
+        raise ValueError("total_player must be greater than 0.")
+    if _base(total_player) ** (side*side) * total_player >= 1 << 64:
+        raise ValueError("positions must fit in a 64 bit key.")
+
+
+def position_key(board, cur_player, total_player):
+    """Returns the integer key of a position in an outcome database.
+
+    Location idx contributes digit 0 when open and player+1 otherwise,
+    weighted by (total_player+1)**idx. The player to move is the lowest
+    digit of the key.
+
+    Args:
+        board (Board or BitBoard): Game board. Locations must have the
+            value None or a player number.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be greater than 0.
+        ValueError: game board values must be None or a player number.
+    """
+    if not isinstance(board, (Board, BitBoard)):
+        raise TypeError("board must be a Board or BitBoard object.")
+    next_player(cur_player, total_player)
+
+    side = board.side_len()
+    base = _base(total_player)
+    vals = board._values()
+    code = 0
+    for idx in reversed(range(side*side)):
+        val = vals[idx]
+        if val is None:
+            digit = 0
+        elif isinstance(val, int) and 0 <= val < total_player:
+            digit = val + 1
+        else:
+            raise ValueError("game board values must be None or a player number.")
+        code = code*base + digit
+
+    return code*total_player + cur_player
+
+
+def build_database(path, side, total_player, win_len=None):
+    """Writes an outcome database holding the move_win_stats result of
+    every position reachable from the empty board with player 0 moving
+    first.
+
+    Positions where a player has already won are not stored. The file
+    holds a header, the sorted position keys and then one fixed size
+    record per key with a win vector for every location. Win vectors of
+    occupied locations are zero.
+
+    Args:
+        path (str): Output file path.
+        side (int): Length of board on one side.
+        total_player (int): Total number of players.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Returns:
+        The number of positions written.
+
+    Raises:
+        ValueError: positions must fit in a 64 bit key.
+        ValueError: win_len must be between 1 and side.
+    """
+    _validate_size(side, total_player)
+    win_len = validate_win_len(side, win_len)
+
+    state = SearchState(Board(side), total_player, win_len)
+    records = {}
+    _visit(state, 0, total_player, 0, _base(total_player), records)
+
+    keys = sorted(records.keys())
+    with open(path, "wb") as out:
+        out.write(_HEADER.pack(_MAGIC, side, total_player, win_len, 0, len(keys)))
+        out.write(struct.pack("<{}Q".format(len(keys)), *keys))
+
+        record = struct.Struct("<{}Q".format(side*side*total_player))
+        for key in keys:
+            out.write(record.pack(*records[key][0]))
+
+    return len(keys)
+
+
+def _visit(state, cur_player, total_player, code, base, records):
+    """Stores the per-location win vectors of the position and its
+    descendants in records and returns the summed win vector of the
+    position. code is the position encoding without the player digit."""
+    key = code*total_player + cur_player
+    if key in records:
+        return records[key][1]
+
+    size = state.side_len()**2
+    stats = [0] * (size*total_player)
+    wins = [0] * total_player
+    new_player = (cur_player + 1) % total_player
+    digit = cur_player + 1
+
+    for idx in range(size):
+        if state.get(idx // state.side_len(), idx % state.side_len()) is not None:
+            continue
+
+        if state.play(idx, cur_player):
+            move_wins = [0] * total_player
+            move_wins[cur_player] = 1
+        else:
+            move_wins = _visit(state, new_player, total_player,
+                               code + digit*base**idx, base, records)
+        state.undo(idx, cur_player)
+
+        for player, stat in enumerate(move_wins):
+            stats[idx*total_player + player] = stat
+            wins[player] += stat
+
+    records[key] = (stats, wins)
+    return wins
+
+
+class _KeyView(object):
+    """Class used to read the little endian position keys of an outcome
+    database on hosts whose native byte order differs.
+
+    Attributes:
+        None
+    """
+
+    _KEY = struct.Struct("<Q")
+
+    def __init__(self, buf, offset, count):
+        """Initializes a view of count keys starting at offset in buf."""
+        self._buf = buf
+        self._offset = offset
+        self._count = count
+
+    def __len__(self):
+        """Returns number of keys."""
+        return self._count
+
+    def __getitem__(self, pos):
+        """Returns the key at index pos."""
+        if pos < 0 or pos >= self._count:
+            raise IndexError("key index out of range.")
+        return self._KEY.unpack_from(self._buf, self._offset + 8*pos)[0]
+
+    def release(self):
+        """Drops the reference to the underlying buffer."""
+        self._buf = None
+
+
+class OutcomeDatabase(object):
+    """Class used to answer move_win_stats queries from a file written by
+    build_database.
+
+    The file is memory mapped, so opening it is cheap and a query is a
+    binary search over the sorted keys followed by one record read.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, path):
+        """Opens an outcome database.
+
+        Args:
+            path (str): Database file path.
+
+        Raises:
+            ValueError: file is not an outcome database.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("file is not an outcome database.")
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError("file is not an outcome database.")
+
+        (magic, side, total_player, win_len, reserved, count) = _HEADER.unpack_from(self._map)
+        record_size = 8*side*side*total_player
+        if magic != _MAGIC or len(self._map) != _HEADER.size + count*(8 + record_size):
+            self.close()
+            raise ValueError("file is not an outcome database.")
+
+        self._side = side
+        self._total_player = total_player
+        self._win_len = win_len
+        self._count = count
+        if sys.byteorder == "little":
+            self._keys = memoryview(self._map)[_HEADER.size:_HEADER.size + 8*count].cast("Q")
+        else:
+            self._keys = _KeyView(self._map, _HEADER.size, count)
+        self._records = _HEADER.size + 8*count
+        self._record = struct.Struct("<{}Q".format(side*side*total_player))
+
+    def __enter__(self):
+        """Returns the database for use in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Closes the database at the end of a with statement."""
+        self.close()
+
+    def __len__(self):
+        """Returns number of stored positions."""
+        return self._count
+
+    def close(self):
+        """Releases the memory map and file."""
+        if getattr(self, "_keys", None) is not None:
+            self._keys.release()
+            self._keys = None
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def side_len(self):
+        """Returns length of the stored boards' side."""
+        return self._side
+
+    def total_player(self):
+        """Returns number of players."""
+        return self._total_player
+
+    def win_len(self):
+        """Returns number of locations in a row needed to win."""
+        return self._win_len
+
+    def move_win_stats(self, board, cur_player, total_player, win_len=None):
+        """Returns the stored move_win_stats result for the position.
+
+        Args:
+            board (Board or BitBoard): Current game board.
+            cur_player (int): Current player number.
+            total_player (int): Total number of players.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+
+        Raises:
+            TypeError: board must be a Board or BitBoard object.
+            ValueError: cur_player must be between 0 and total_player-1.
+            ValueError: total_player must be greater than 0.
+            ValueError: position rules do not match the database.
+            ValueError: game board values must be None or a player number.
+            KeyError: position is not in the database.
+        """
+        if not isinstance(board, (Board, BitBoard)):
+            raise TypeError("board must be a Board or BitBoard object.")
+        next_player(cur_player, total_player)
+
+        side = board.side_len()
+        if side != self._side or total_player != self._total_player or \
+                validate_win_len(side, win_len) != self._win_len:
+            raise ValueError("position rules do not match the database.")
+
+        key = position_key(board, cur_player, total_player)
+        pos = bisect.bisect_left(self._keys, key)
+        if pos == self._count or self._keys[pos] != key:
+            raise KeyError("position is not in the database.")
+
+        stats = self._record.unpack_from(self._map, self._records + pos*self._record.size)
+
+        vals = board._values()
+        win_stats = {}
+        for idx in range(side*side):
+            (row, col) = (idx // side, idx % side)
+            if vals[idx] is None:
+                start = idx*total_player
+                win_stats[(row, col)] = list(stats[start:start + total_player])
+
+        return win_stats
+
+
+def _main(argv=None):
+    """Builds an outcome database from the command line."""
+    parser = argparse.ArgumentParser(description="Builds a Tic Tac Toe outcome database.")
+    parser.add_argument("path", help="output file path")
+    parser.add_argument("--side", type=int, default=3,
+                        help="length of board on one side (default: 3)")
+    parser.add_argument("--players", type=int, default=2,
+                        help="total number of players (default: 2)")
+    parser.add_argument("--win-len", type=int, default=None,
+                        help="locations in a row needed to win (default: side)")
+    args = parser.parse_args(argv)
+
+    count = build_database(args.path, args.side, args.players, args.win_len)
+    print("wrote {} positions to {}".format(count, args.path))
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,91 @@
+"""Module docstring"""
+
+
+_DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+_LINES = {}
+
+
+def validate_win_len(side, win_len):
+    """Returns the number of locations in a row needed to win, which
+    defaults to the side length when win_len is None.
+
+    Args:
+        side (int): Length of board on one side.
+        win_len (int): Number of locations in a row needed to win.
+
+    Raises:
+        ValueError: win_len must be between 1 and side.
+    """
+    if win_len is None:
+        return side
+    if win_len < 1 or win_len > side:
+        raise ValueError("win_len must be between 1 and side.")
+    return win_len
+
+
+def _build(side, win_len):
+    """Computes and caches the lines and per-location line ids for the
+    side length and win length."""
+    lines = []
+    for (drow, dcol) in _DIRECTIONS:
+        for row in range(side):
+            for col in range(side):
+                end_row = row + drow*(win_len - 1)
+                end_col = col + dcol*(win_len - 1)
+                if 0 <= end_row < side and 0 <= end_col < side:
+                    lines.append(tuple((row + drow*step)*side + col + dcol*step
+                                       for step in range(win_len)))
+
+    cell_lines = [[] for idx in range(side*side)]
+    for line_id, line in enumerate(lines):
+        for idx in line:
+            cell_lines[idx].append(line_id)
+
+    _LINES[(side, win_len)] = (tuple(lines), tuple(tuple(ids) for ids in cell_lines))
+
+
+def line_cells(side, win_len=None):
+    """Returns a tuple of winning lines for a board of the given side
+    length. Each line is a tuple of win_len location indexes.
+
+    Lines are listed as horizontal, then vertical, then diagonal segments
+    running down-right and down-left, each in row first order of their
+    first location. When win_len equals the side length these are the
+    rows, the columns and the left and right diagonals. Lines are computed
+    once per side length and win length.
+
+    Args:
+        side (int): Length of board on one side. Must be greater than 0.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Raises:
+        ValueError: game board side must be greater than 0.
+        ValueError: win_len must be between 1 and side.
+    """
+    if side <= 0:
+        raise ValueError("game board side must be greater than 0.")
+    win_len = validate_win_len(side, win_len)
+
+    if (side, win_len) not in _LINES:
+        _build(side, win_len)
+
+    return _LINES[(side, win_len)][0]
+
+
+def cell_lines(side, win_len=None):
+    """Returns a tuple indexed by location index holding the ids of the
+    lines, as numbered by line_cells, passing through each location.
+
+    Args:
+        side (int): Length of board on one side. Must be greater than 0.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Raises:
+        ValueError: game board side must be greater than 0.
+        ValueError: win_len must be between 1 and side.
+    """
+    line_cells(side, win_len)
+    return _LINES[(side, validate_win_len(side, win_len))][1]
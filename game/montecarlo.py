@@ -0,0 +1,166 @@
+"""Module docstring"""
+
+import math
+import random
+import time
+from statistics import NormalDist
+
+from .search import SearchState
+from .tictactoe import _BOARD_TYPES, _collate_symmetric_positions, next_player
+
+
+_BATCH_SIZE = 100
+
+
+def sample_move_win_stats(board, cur_player, total_player, playouts=1000, time_budget=None,
+                          seed=None, rel_tol=None, confidence=0.95, win_len=None):
+    """Returns estimated statistics of the current player winning for each
+    open move on the board assuming the rules of Tic Tac Toe.
+
+    The estimates come from random playouts after each open move. Each
+    playout is weighted by the product of the number of open positions at
+    every move it made, which makes the weighted win counts unbiased
+    estimates of the counts returned by move_win_stats. Symmetric moves
+    are sampled once and share their estimates.
+
+    Playouts are run in batches for every move until the playout budget
+    or time budget is spent, or until every confidence interval is within
+    rel_tol of the estimated number of games after that move.
+
+    Args:
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        playouts (int): Maximum number of playouts per open move. Defaults
+            to 1000. None removes the limit, which requires a time_budget.
+        time_budget (float): Maximum number of seconds to spend sampling.
+            Defaults to None, which removes the limit. At least one batch
+            is always run.
+        seed: Seed for the random number generator. Defaults to None.
+        rel_tol (float): Stop once every confidence interval half width is
+            at most rel_tol times the estimated number of games after its
+            move. Defaults to None, which disables early stopping.
+        confidence (float): Confidence level of the intervals. Defaults to
+            0.95.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Returns:
+        A (win_stats, intervals, count) tuple. win_stats has the layout
+        of move_win_stats with float estimates in place of counts.
+        intervals has the same keys and holds a list with a (low, high)
+        tuple per player. count is the number of playouts run per move.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be at most side*side.
+        ValueError: playouts or time_budget must be given.
+        ValueError: playouts must be greater than 0.
+        ValueError: confidence must be between 0 and 1.
+        ValueError: win_len must be between 1 and side.
+    """
+    if not isinstance(board, _BOARD_TYPES):
+        raise TypeError("board must be a Board or BitBoard object.")
+    next_player(cur_player, total_player)
+    if playouts is None and time_budget is None:
+        raise ValueError("playouts or time_budget must be given.")
+    if playouts is not None and playouts <= 0:
+        raise ValueError("playouts must be greater than 0.")
+    if confidence <= 0 or confidence >= 1:
+        raise ValueError("confidence must be between 0 and 1.")
+
+    state = SearchState(board, total_player, win_len)
+    rand = random.Random(seed)
+    z_score = NormalDist().inv_cdf((1 + confidence) / 2)
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+
+    open_positions = state.open_positions()
+    groups = _collate_symmetric_positions(state, open_positions)
+    sums = [[0.0 for i in range(total_player)] for group in groups]
+    squares = [[0.0 for i in range(total_player)] for group in groups]
+    count = 0
+
+    while len(groups) > 0:
+        batch = _BATCH_SIZE if playouts is None else min(_BATCH_SIZE, playouts - count)
+        for group_idx, positions in enumerate(groups):
+            for i in range(batch):
+                (winner, weight) = _playout(state, positions[-1], cur_player,
+                                            total_player, rand)
+                if winner is not None:
+                    sums[group_idx][winner] += weight
+                    squares[group_idx][winner] += weight*weight
+        count += batch
+
+        if playouts is not None and count >= playouts:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        if rel_tol is not None and _is_tight(sums, squares, count, z_score, rel_tol):
+            break
+
+    win_stats = {}
+    intervals = {}
+    for group_idx, positions in enumerate(groups):
+        means = [total / count for total in sums[group_idx]]
+        widths = [_half_width(sums[group_idx][i], squares[group_idx][i], count, z_score)
+                  for i in range(total_player)]
+        for pos in positions:
+            win_stats[pos] = means.copy()
+            intervals[pos] = [(mean - width, mean + width)
+                              for mean, width in zip(means, widths)]
+
+    return (win_stats, intervals, count)
+
+
+def _playout(state, move_pos, cur_player, total_player, rand):
+    """Plays the move and then random moves until the game ends. Returns
+    a (winner, weight) tuple where winner is None for a draw and weight is
+    the product of the number of open positions at each random move. The
+    state is restored before returning."""
+    side = state.side_len()
+    open_idxs = [row*side + col for (row, col) in state.open_positions()]
+    move_idx = move_pos[0]*side + move_pos[1]
+    open_idxs.remove(move_idx)
+
+    played = [(move_idx, cur_player)]
+    winner = cur_player if state.play(move_idx, cur_player) else None
+    player = cur_player
+    weight = 1
+
+    while winner is None and len(open_idxs) > 0:
+        player = (player + 1) % total_player
+        weight *= len(open_idxs)
+        pick = rand.randrange(len(open_idxs))
+        open_idxs[pick], open_idxs[-1] = open_idxs[-1], open_idxs[pick]
+        idx = open_idxs.pop()
+
+        played.append((idx, player))
+        if state.play(idx, player):
+            winner = player
+
+    for (idx, player) in reversed(played):
+        state.undo(idx, player)
+
+    return (winner, weight)
+
+
+def _half_width(total, square, count, z_score):
+    """Returns the confidence interval half width of a sample mean."""
+    if count < 2:
+        return math.inf
+    mean = total / count
+    variance = max(square / count - mean*mean, 0.0) * count / (count - 1)
+    return z_score * math.sqrt(variance / count)
+
+
+def _is_tight(sums, squares, count, z_score, rel_tol):
+    """Returns True if every interval half width is within rel_tol of the
+    estimated number of games after its move."""
+    for group_sums, group_squares in zip(sums, squares):
+        games = sum(group_sums) / count
+        for total, square in zip(group_sums, group_squares):
+            if _half_width(total, square, count, z_score) > rel_tol * games:
+                return False
+    return True
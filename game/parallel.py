@@ -0,0 +1,151 @@
+"""Module docstring"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .search import SearchState
+from .transposition import TranspositionTable
+
+
+_WORKER_TABLE = None
+
+
+def _init_worker(table_args):
+    """Creates the worker process's transposition table.
+
+    Args:
+        table_args: (max_entries, policy) tuple or None to disable
+            caching in the worker.
+    """
+    global _WORKER_TABLE
+    _WORKER_TABLE = None if table_args is None else TranspositionTable(*table_args)
+
+
+def _worker_table():
+    """Returns the calling process's transposition table created by
+    _init_worker."""
+    return _WORKER_TABLE
+
+
+def _worker_count(jobs):
+    """Returns the number of worker processes for jobs, which uses one
+    process per CPU when less than 1."""
+    return jobs if jobs >= 1 else os.cpu_count() or 1
+
+
+def _worker_pool(jobs, table_args):
+    """Returns a process pool of _worker_count(jobs) workers, each with a
+    transposition table created by _init_worker from table_args."""
+    return ProcessPoolExecutor(max_workers=_worker_count(jobs), initializer=_init_worker,
+                               initargs=(table_args,))
+
+
+def _solve_item(item):
+    """Returns the subtree win vector for one work item."""
+    (board, cur_player, total_player, win_len, collate_fn, key_fn, subtree_fn) = item
+    state = SearchState(board, total_player, win_len)
+    return subtree_fn(state, cur_player, total_player, collate_fn, _WORKER_TABLE, key_fn)
+
+
+def _split(state, cur_player, total_player, collate_fn, depth, items):
+    """Returns a list of (count, item index or win vector) terms whose
+    weighted sum is the subtree win vector of the position. Positions
+    depth plies below are appended to items instead of being searched."""
+    if depth == 0:
+        items.append((state.to_board(), cur_player))
+        return [(1, len(items) - 1)]
+
+    terms = []
+    side = state.side_len()
+    new_player = (cur_player + 1) % total_player
+
+    for positions in collate_fn(state, state.open_positions()):
+        move_pos = positions[-1]
+        move_idx = move_pos[0]*side + move_pos[1]
+
+        if state.play(move_idx, cur_player):
+            wins = [0 for i in range(total_player)]
+            wins[cur_player] = 1
+            terms.append((len(positions), wins))
+        else:
+            for (count, term) in _split(state, new_player, total_player, collate_fn,
+                                        depth - 1, items):
+                terms.append((count*len(positions), term))
+
+        state.undo(move_idx, cur_player)
+
+    return terms
+
+
+def parallel_orbit_stats(state, cur_player, total_player, collate_fn, key_fn, subtree_fn,
+                         table, jobs, split_depth):
+    """Returns a list of (positions, wins) tuples, one for each group of
+    collated open moves on the search state, holding the statistics of
+    the current player winning, solving subtrees in a process pool.
+
+    The tree is expanded split_depth plies below each root move. Every
+    position reached at that depth becomes an independent work item and
+    the item results are summed back into the root move they came from,
+    so the statistics are identical to a serial search.
+
+    Args:
+        state (SearchState): Root position.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        collate_fn: Position collation function.
+        key_fn: Transposition table key function.
+        subtree_fn: Function returning the summed win vector for all moves
+            of a position. Must be picklable.
+        table (TranspositionTable): Template for the table created in each
+            worker process, or None to disable caching.
+        jobs (int): Number of worker processes. Values less than 1 use one
+            process per CPU.
+        split_depth (int): Number of plies below the root moves at which
+            work items are cut. Must be 0 or greater.
+
+    Raises:
+        ValueError: split_depth must be 0 or greater.
+    """
+    if split_depth < 0:
+        raise ValueError("split_depth must be 0 or greater.")
+    open_positions = state.open_positions()
+    if len(open_positions) == 0:
+        return []
+
+    side = state.side_len()
+    new_player = (cur_player + 1) % total_player
+    items = []
+    root_terms = []
+
+    for positions in collate_fn(state, open_positions):
+        move_pos = positions[-1]
+        move_idx = move_pos[0]*side + move_pos[1]
+
+        if state.play(move_idx, cur_player):
+            wins = [0 for i in range(total_player)]
+            wins[cur_player] = 1
+            terms = [(1, wins)]
+        else:
+            terms = _split(state, new_player, total_player, collate_fn, split_depth, items)
+
+        state.undo(move_idx, cur_player)
+        root_terms.append((positions, terms))
+
+    table_args = None if table is None else (table.max_entries(), table.policy())
+    work = [(board, player, total_player, state.win_len(), collate_fn, key_fn, subtree_fn)
+            for (board, player) in items]
+
+    with _worker_pool(jobs, table_args) as executor:
+        results = list(executor.map(_solve_item, work))
+
+    orbits = []
+    for (positions, terms) in root_terms:
+        wins = [0 for i in range(total_player)]
+        for (count, term) in terms:
+            vector = results[term] if isinstance(term, int) else term
+            for idx, stat in enumerate(vector):
+                wins[idx] += count*stat
+
+        orbits.append((positions, wins))
+
+    return orbits
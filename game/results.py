@@ -0,0 +1,187 @@
+"""Module docstring"""
+
+
+class MoveWinStats(object):
+    """Class used to hold the statistics of the current player winning for
+    each open move, storing one win vector per orbit, a group of open
+    positions that board symmetry makes equivalent.
+
+    The object reads like the dictionary returned by move_win_stats. It is
+    indexed by (row,col) tuples, iterates over them in row first order and
+    returns a fresh list of win counts for each. The position index is
+    built on first access, so results that are only serialized or passed
+    between processes never expand. Totals are computed once per orbit.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, side, total_player, orbits):
+        """Initializes move statistics from orbits.
+
+        Args:
+            side (int): Length of board on one side.
+            total_player (int): Total number of players.
+            orbits: Iterable of (positions, wins) pairs where positions is
+                a sequence of (row,col) tuples sharing the list of win
+                counts wins.
+
+        Raises:
+            ValueError: wins must hold total_player counts.
+        """
+        self._side = side
+        self._total_player = total_player
+        self._positions = []
+        self._wins = []
+        self._totals = []
+        self._index = None
+
+        for positions, wins in orbits:
+            wins = tuple(wins)
+            if len(wins) != total_player:
+                raise ValueError("wins must hold total_player counts.")
+            self._positions.append(tuple(sorted(positions)))
+            self._wins.append(wins)
+            self._totals.append(sum(wins))
+
+    @classmethod
+    def from_compact(cls, data):
+        """Returns move statistics from the output of to_compact.
+
+        Args:
+            data (dict): Compact form.
+
+        Raises:
+            ValueError: wins must hold total_player counts.
+        """
+        orbits = [([tuple(pos) for pos in positions], wins) for positions, wins in data["orbits"]]
+        return cls(data["side"], data["players"], orbits)
+
+    def _orbit(self, pos):
+        """Returns the index of the orbit holding the position."""
+        if self._index is None:
+            self._index = dict((pos, orbit) for orbit, positions in enumerate(self._positions)
+                               for pos in positions)
+        return self._index[pos]
+
+    def side_len(self):
+        """Returns length of board's side."""
+        return self._side
+
+    def total_player(self):
+        """Returns number of players."""
+        return self._total_player
+
+    def orbits(self):
+        """Returns a list of (positions, wins) tuples, one per orbit, where
+        positions is a sorted tuple of (row,col) tuples and wins a list of
+        win counts."""
+        return [(positions, list(wins)) for positions, wins in zip(self._positions, self._wins)]
+
+    def total(self, pos):
+        """Returns the number of games won by any player after the move.
+
+        Args:
+            pos: (row,col) tuple of an open position.
+
+        Raises:
+            KeyError: pos is not an open position.
+        """
+        return self._totals[self._orbit(pos)]
+
+    def ratios(self, pos):
+        """Returns the list of the fraction of won games each player won
+        after the move, all 0.0 when no game is won.
+
+        Args:
+            pos: (row,col) tuple of an open position.
+
+        Raises:
+            KeyError: pos is not an open position.
+        """
+        orbit = self._orbit(pos)
+        total = self._totals[orbit]
+        if total == 0:
+            return [0.0] * self._total_player
+        return [wins / total for wins in self._wins[orbit]]
+
+    def keys(self):
+        """Returns a list of the open positions in row first order."""
+        return sorted(pos for positions in self._positions for pos in positions)
+
+    def values(self):
+        """Returns a list of the win counts of the open positions in row
+        first order."""
+        return [self[pos] for pos in self.keys()]
+
+    def items(self):
+        """Returns a list of (pos, wins) tuples in row first order."""
+        return [(pos, self[pos]) for pos in self.keys()]
+
+    def get(self, pos, default=None):
+        """Returns the win counts of the position, or default if it is not
+        an open position."""
+        if pos in self:
+            return self[pos]
+        return default
+
+    def to_dict(self):
+        """Returns the statistics as the dictionary move_win_stats
+        returns."""
+        return dict((pos, list(wins)) for positions, wins in zip(self._positions, self._wins)
+                    for pos in positions)
+
+    def to_compact(self):
+        """Returns a JSON serializable dictionary holding each orbit once.
+        The keys are "side", "players" and "orbits", a list of
+        [positions, wins] pairs with positions a list of [row, col]
+        pairs."""
+        return {"side": self._side,
+                "players": self._total_player,
+                "orbits": [[[list(pos) for pos in positions], list(wins)]
+                           for positions, wins in zip(self._positions, self._wins)]}
+
+    def __len__(self):
+        """Returns number of open positions."""
+        return sum(len(positions) for positions in self._positions)
+
+    def __iter__(self):
+        """Returns an iterator over the open positions in row first
+        order."""
+        return iter(self.keys())
+
+    def __contains__(self, pos):
+        """Returns True if the position is an open position."""
+        try:
+            self._orbit(pos)
+        except (KeyError, TypeError):
+            return False
+        return True
+
+    def __getitem__(self, pos):
+        """Returns a new list of the win counts of the position.
+
+        Raises:
+            KeyError: pos is not an open position.
+        """
+        return list(self._wins[self._orbit(pos)])
+
+    def __eq__(self, other):
+        """Returns True if the statistics of every position equal those
+        of another MoveWinStats object or move_win_stats dictionary."""
+        if isinstance(other, MoveWinStats):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        """Pickles the orbits only, leaving the position index unbuilt."""
+        return (MoveWinStats, (self._side, self._total_player,
+                               list(zip(self._positions, self._wins))))
+
+    def __repr__(self):
+        """Returns the representation of the expanded dictionary."""
+        return "MoveWinStats({!r})".format(self.to_dict())
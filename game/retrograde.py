@@ -0,0 +1,158 @@
+"""Module docstring"""
+
+from .bitboard import BitBoard
+from .board import Board
+from .lines import cell_lines, line_cells
+from .tictactoe import next_player
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+MAX_OPEN = 20
+
+
+def _require_numpy():
+    """Raises ImportError if NumPy is not installed."""
+    if np is None:
+        raise ImportError("numpy is required for the retrograde solver.")
+
+
+def _digits(codes, powers, base):
+    """Returns an (N, size) array holding the digit of every location of
+    the encoded positions."""
+    return ((codes[:, np.newaxis] // powers[np.newaxis, :]) % base).astype(np.int8)
+
+
+def _wins(digits, idx, player, lines, through):
+    """Returns a boolean array telling which positions are won by the
+    player placing a stone at the open location index."""
+    wins = np.zeros(len(digits), dtype=bool)
+    for line_id in through[idx]:
+        others = [cell for cell in lines[line_id] if cell != idx]
+        wins |= np.all(digits[:, others] == player + 1, axis=1)
+    return wins
+
+
+def retrograde_win_stats(board, cur_player, total_player, win_len=None):
+    """Returns the statistics of the current player winning for each open
+    move on the board, computed bottom up over layers of positions.
+
+    Positions reachable from the board are encoded as integers where
+    location idx contributes digit 0 when open and player+1 otherwise,
+    weighted by (total_player+1)**idx. A forward pass builds one NumPy
+    array per number of stones placed, dropping positions where the last
+    move won and deduplicating with np.unique. A backward pass then
+    propagates win vectors from the last layer to the board, so each
+    position is solved once no matter how many move orders reach it.
+
+    The result equals that of move_win_stats. Memory grows with the
+    number of distinct positions rather than the number of games.
+
+    Args:
+        board (Board or BitBoard): Current game board. Locations must
+            have the value None or a player number.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+
+    Returns:
+        A dictionary of lists keyed by (row,col) tuples for open positions
+        as returned by move_win_stats.
+
+    Raises:
+        ImportError: numpy is required for the retrograde solver.
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be greater than 0.
+        ValueError: game board values must be None or a player number.
+        ValueError: positions must fit in a 64 bit key.
+        ValueError: board must have at most MAX_OPEN open locations.
+        ValueError: win_len must be between 1 and side.
+    """
+    _require_numpy()
+    if not isinstance(board, (Board, BitBoard)):
+        raise TypeError("board must be a Board or BitBoard object.")
+    next_player(cur_player, total_player)
+
+    side = board.side_len()
+    size = side*side
+    base = total_player + 1
+    lines = line_cells(side, win_len)
+    through = cell_lines(side, win_len)
+
+    vals = board._values()
+    for val in vals:
+        if val is not None and not (isinstance(val, int) and 0 <= val < total_player):
+            raise ValueError("game board values must be None or a player number.")
+    if base ** size >= 1 << 63:
+        raise ValueError("positions must fit in a 64 bit key.")
+
+    open_count = vals.count(None)
+    if open_count > MAX_OPEN:
+        raise ValueError("board must have at most {} open locations.".format(MAX_OPEN))
+
+    powers = np.array([base ** idx for idx in range(size)], dtype=np.int64)
+    root = sum(int(powers[idx]) * (val + 1) for idx, val in enumerate(vals) if val is not None)
+
+    layers = [np.array([root], dtype=np.int64)]
+    for depth in range(open_count):
+        codes = layers[-1]
+        player = (cur_player + depth) % total_player
+        digits = _digits(codes, powers, base)
+
+        children = [np.zeros(0, dtype=np.int64)]
+        for idx in range(size):
+            rows = digits[:, idx] == 0
+            if not rows.any():
+                continue
+            wins = _wins(digits[rows], idx, player, lines, through)
+            children.append(codes[rows][~wins] + (player + 1) * powers[idx])
+        layers.append(np.unique(np.concatenate(children)))
+
+    stats = np.zeros((0, total_player), dtype=np.int64)
+    for depth in reversed(range(1, len(layers))):
+        stats = _layer_stats(layers[depth], layers[depth + 1] if depth + 1 < len(layers) else None,
+                             stats, (cur_player + depth) % total_player, total_player,
+                             powers, base, lines, through)
+
+    win_stats = {}
+    digits = _digits(layers[0], powers, base)
+    for idx in range(size):
+        if digits[0, idx] != 0:
+            continue
+        wins = [0] * total_player
+        if _wins(digits, idx, cur_player, lines, through)[0]:
+            wins[cur_player] = 1
+        else:
+            child = layers[0][0] + (cur_player + 1) * powers[idx]
+            wins = stats[np.searchsorted(layers[1], child)].tolist()
+        win_stats[(idx // side, idx % side)] = wins
+
+    return win_stats
+
+
+def _layer_stats(codes, next_codes, next_stats, player, total_player, powers, base,
+                 lines, through):
+    """Returns the (N, total_player) win counts of the positions of one
+    layer from the counts of the next layer."""
+    stats = np.zeros((len(codes), total_player), dtype=np.int64)
+    if next_codes is None or len(codes) == 0:
+        return stats
+
+    digits = _digits(codes, powers, base)
+    for idx in range(len(powers)):
+        rows = np.flatnonzero(digits[:, idx] == 0)
+        if len(rows) == 0:
+            continue
+        wins = _wins(digits[rows], idx, player, lines, through)
+        stats[rows[wins], player] += 1
+
+        rows = rows[~wins]
+        children = codes[rows] + (player + 1) * powers[idx]
+        stats[rows] += next_stats[np.searchsorted(next_codes, children)]
+
+    return stats
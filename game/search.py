@@ -0,0 +1,412 @@
+"""Module docstring"""
+
+from .board import Board
+from .bitboard import BitBoard
+from .lines import cell_lines, line_cells, validate_win_len
+from .symmetry import TRANSFORMS, _bit_tables, _permutations, _transform_mask
+from .zobrist import KEY_BITS, KEY_MASK, blocked_key, cell_key, win_len_key
+
+
+_ZOBRIST_TABLES = {}
+_SYMMETRY_TABLES = {}
+_LINE_MASKS = {}
+
+
+def _pack_keys(keys):
+    """Returns the keys packed into one integer, KEY_BITS bits per key."""
+    packed = 0
+    for shift, key in enumerate(keys):
+        packed |= key << (shift*KEY_BITS)
+    return packed
+
+
+def _zobrist_tables(side, total_player, key_players):
+    """Returns (player_keys, blocked_keys) tuples of packed Zobrist keys.
+
+    Each packed key holds one key per transform for each of the first
+    key_players players to move, the player to move major and transforms
+    in TRANSFORMS order. Each is the
+    key of the location the transform moves the location index to,
+    holding the player relabeled so that the player to move becomes
+    player 0. player_keys is indexed by idx*total_player + player and
+    blocked_keys by location index."""
+    if (side, total_player, key_players) not in _ZOBRIST_TABLES:
+        perms = [_permutations(side)[name] for name in TRANSFORMS]
+        player_keys = tuple(_pack_keys(cell_key(side, perm[idx], (player - cur) % total_player)
+                                       for cur in range(key_players) for perm in perms)
+                            for idx in range(side*side) for player in range(total_player))
+        blocked_keys = tuple(_pack_keys(blocked_key(side, perm[idx])
+                                        for cur in range(key_players) for perm in perms)
+                             for idx in range(side*side))
+        _ZOBRIST_TABLES[(side, total_player, key_players)] = (player_keys, blocked_keys)
+    return _ZOBRIST_TABLES[(side, total_player, key_players)]
+
+
+def _line_masks(side, win_len):
+    """Returns a tuple holding, for every location index, a mask with bit
+    line_id set for each line through the location."""
+    if (side, win_len) not in _LINE_MASKS:
+        _LINE_MASKS[(side, win_len)] = tuple(sum(1 << line_id for line_id in line_ids)
+                                             for line_ids in cell_lines(side, win_len))
+    return _LINE_MASKS[(side, win_len)]
+
+
+def _symmetry_tables(side):
+    """Returns a tuple of (shift, perm, tables) tuples for every transform
+    but the identity. shift is the transform's position among the packed
+    Zobrist keys, perm its location index permutation and tables its
+    mask chunk tables."""
+    if side not in _SYMMETRY_TABLES:
+        perms = _permutations(side)
+        bit_tables = dict(_bit_tables(side))
+        _SYMMETRY_TABLES[side] = tuple((shift, perms[name], bit_tables[name])
+                                       for shift, name in enumerate(TRANSFORMS)
+                                       if name != "identity")
+    return _SYMMETRY_TABLES[side]
+
+
+class SearchState(object):
+    """Class used to represent a mutable game position during a search.
+
+    Moves are applied with play and removed with undo in place. For every
+    line and player the state keeps the number of locations the player
+    holds, so a win check after a move only reads the counters of the
+    lines through the moved location. A mask per player of the lines it
+    holds a location of is saved before each move and restored by undo,
+    so moves must be undone in reverse order. The Zobrist keys of the
+    position under all eight rotations and reflections, and with the
+    players relabeled relative to each possible player to move, are
+    likewise updated with one exclusive or per move. Only the keys with
+    player 0 to move are kept until a key for another player to move is
+    first read, so searches without a transposition table never build
+    the larger tables. Lines are the segments of win_len locations given
+    by lines.line_cells. Locations holding a value other than None or a
+    player number block every line through them.
+
+    SearchState is internal to the solvers. Boards remain the public type.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, board, total_player, win_len=None):
+        """Initializes a search state from a game board.
+
+        Args:
+            board (Board or BitBoard): Game board.
+            total_player (int): Total number of players. Must be between
+                1 and side*side, or 2 on a one location board.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+
+        Raises:
+            TypeError: board must be a Board or BitBoard object.
+            ValueError: total_player must be greater than 0.
+            ValueError: total_player must be at most side*side.
+            ValueError: win_len must be between 1 and side.
+        """
+        if not isinstance(board, (Board, BitBoard)):
+            raise TypeError("board must be a Board or BitBoard object.")
+        if total_player <= 0:
+            raise ValueError("total_player must be greater than 0.")
+
+        side = board.side_len()
+        if total_player > max(side*side, 2):
+            raise ValueError("total_player must be at most side*side.")
+        win_len = validate_win_len(side, win_len)
+        lines = line_cells(side, win_len)
+
+        self._side = side
+        self._total_player = total_player
+        self._line_len = win_len
+        self._cell_lines = cell_lines(side, win_len)
+        self._line_masks = _line_masks(side, win_len)
+        self._cells = list(board._values())
+        self._counts = [0] * (len(lines)*total_player)
+        self._masks = [0] * total_player
+        self._blocked = 0
+
+        # Line masks: _free holds the lines without blocked locations,
+        # _touched the lines holding a location of each player, _seen
+        # their union and _shared the lines held by two or more players.
+        self._free = (1 << len(lines)) - 1
+        self._touched = [0] * total_player
+        self._seen = 0
+        self._shared = 0
+        self._history = []
+        self._open_count = self._cells.count(None)
+
+        for idx, val in enumerate(self._cells):
+            if val is None:
+                continue
+            line_mask = self._line_masks[idx]
+            if self._is_player(val):
+                self._add(idx, val)
+                self._shared |= line_mask & self._seen & ~self._touched[val]
+                self._seen |= line_mask
+                self._touched[val] |= line_mask
+            else:
+                self._blocked |= 1 << idx
+                self._free &= ~line_mask
+
+        self._build_keys(1)
+
+    def _build_keys(self, key_players):
+        """Computes the packed Zobrist key of the position for the first
+        key_players players to move and keeps the matching tables for
+        play and undo."""
+        side = self._side
+        total_player = self._total_player
+        (self._zobrist_keys, blocked_keys) = _zobrist_tables(side, total_player, key_players)
+        self._key_players = key_players
+
+        zobrist = _pack_keys([win_len_key(side, self._line_len)] * (len(TRANSFORMS)*key_players))
+        for idx, val in enumerate(self._cells):
+            if val is None:
+                continue
+            if self._is_player(val):
+                zobrist ^= self._zobrist_keys[idx*total_player + val]
+            else:
+                zobrist ^= blocked_keys[idx]
+        self._zobrist = zobrist
+
+    def _is_player(self, val):
+        """Returns True if the value is a player number."""
+        return isinstance(val, int) and 0 <= val < self._total_player
+
+    def _add(self, idx, player):
+        """Records the player at the location index and returns True if
+        this completes a line."""
+        total_player = self._total_player
+        counts = self._counts
+        line_len = self._line_len
+        is_win = False
+
+        self._masks[player] |= 1 << idx
+        for line_id in self._cell_lines[idx]:
+            pos = line_id*total_player + player
+            counts[pos] += 1
+            if counts[pos] == line_len:
+                is_win = True
+
+        return is_win
+
+    def side_len(self):
+        """Returns length of board's side."""
+        return self._side
+
+    def total_player(self):
+        """Returns number of players."""
+        return self._total_player
+
+    def win_len(self):
+        """Returns number of locations in a row needed to win."""
+        return self._line_len
+
+    def get(self, row, col):
+        """Returns value at the given row and column location without
+        validating the location.
+
+        Args:
+            row (int): Row location.
+            col (int): Column location.
+        """
+        return self._cells[row*self._side + col]
+
+    def open_positions(self):
+        """Returns list of (row,column) tuples for all open locations in
+        row first order."""
+        side = self._side
+        return [(idx // side, idx % side)
+                for idx, val in enumerate(self._cells) if val is None]
+
+    def play(self, idx, player):
+        """Places the player at the open location index and returns True
+        if the move completes a line for the player.
+
+        Args:
+            idx (int): Location index of an open location.
+            player (int): Player number.
+        """
+        line_mask = self._line_masks[idx]
+        touched = self._touched[player]
+        seen = self._seen
+        self._history.append((touched, seen, self._shared))
+        self._touched[player] = touched | line_mask
+        self._seen = seen | line_mask
+        self._shared |= line_mask & seen & ~touched
+
+        self._cells[idx] = player
+        self._open_count -= 1
+        self._zobrist ^= self._zobrist_keys[idx*self._total_player + player]
+        return self._add(idx, player)
+
+    def undo(self, idx, player):
+        """Removes the player from the location index, reversing the
+        most recent play.
+
+        Args:
+            idx (int): Location index played by the player.
+            player (int): Player number.
+        """
+        total_player = self._total_player
+        counts = self._counts
+
+        (self._touched[player], self._seen, self._shared) = self._history.pop()
+        self._cells[idx] = None
+        self._open_count += 1
+        self._masks[player] &= ~(1 << idx)
+        self._zobrist ^= self._zobrist_keys[idx*total_player + player]
+        for line_id in self._cell_lines[idx]:
+            counts[line_id*total_player + player] -= 1
+
+    def can_win(self, cur_player):
+        """Returns True if some player may still complete a line with the
+        player to move next. A line is winnable while it is free of
+        blocked locations and holds stones of at most one player, and
+        only players with a turn left before the board fills are
+        considered. When False, every game from the position is a draw.
+
+        Args:
+            cur_player (int): Player to move.
+        """
+        open_count = self._open_count
+        if open_count == 0:
+            return False
+        live = self._free & ~self._shared
+        if live & ~self._seen:
+            return True
+
+        total_player = self._total_player
+        touched = self._touched
+        for step in range(min(open_count, total_player)):
+            if touched[(cur_player + step) % total_player] & live:
+                return True
+        return False
+
+    def line_balance(self, player):
+        """Returns a (held, opposed) tuple counting the lines free of
+        blocked locations whose stones all belong to the player and the
+        lines whose stones all belong to a single other player.
+
+        Args:
+            player (int): Player number.
+        """
+        live = self._free & ~self._shared
+        held = bin(self._touched[player] & live).count("1")
+        return (held, bin(self._seen & live).count("1") - held)
+
+    def symmetries(self):
+        """Returns a list of the location index permutations, other than
+        the identity, that map the position onto itself. Blocked
+        locations match regardless of their value.
+
+        A transform can only fix the position if its packed Zobrist key
+        equals the untransformed one, so most transforms are rejected
+        by one comparison and the rest are confirmed on the player and
+        blocked masks."""
+        zobrist = self._zobrist
+        key = zobrist & KEY_MASK
+        masks = self._masks + [self._blocked]
+
+        perms = []
+        for shift, perm, tables in _symmetry_tables(self._side):
+            if (zobrist >> (shift*KEY_BITS)) & KEY_MASK != key:
+                continue
+            if all(_transform_mask(mask, tables) == mask for mask in masks):
+                perms.append(perm)
+        return perms
+
+    def relative_zobrist_key(self, cur_player):
+        """Returns the 64 bit Zobrist key of the position with every player
+        p relabeled (p - cur_player) % total_player. Blocked locations are
+        keyed together regardless of their value. Positions that differ
+        only by a cyclic shift of the player numbers share the key when
+        their players to move are shifted alike, since play continues in
+        the same relative order.
+
+        Args:
+            cur_player (int): Player to move.
+        """
+        if cur_player >= self._key_players:
+            self._build_keys(self._total_player)
+        return (self._zobrist >> (cur_player*len(TRANSFORMS)*KEY_BITS)) & KEY_MASK
+
+    def canonical_relative_zobrist_key(self, cur_player):
+        """Returns the smallest relative_zobrist_key of the position's
+        rotations and reflections.
+
+        Args:
+            cur_player (int): Player to move.
+        """
+        if cur_player >= self._key_players:
+            self._build_keys(self._total_player)
+        count = len(TRANSFORMS)
+        zobrist = self._zobrist >> (cur_player*count*KEY_BITS)
+        return min((zobrist >> (shift*KEY_BITS)) & KEY_MASK for shift in range(count))
+
+    def to_board(self):
+        """Returns a Board with the same values as the position."""
+        return Board(self._side, list(self._cells))
+
+
+class ProgressSearchState(SearchState):
+    """Class used to represent a mutable game position that counts the
+    moves played on it and reports progress while a search runs.
+
+    Plain SearchState objects are used when no progress is wanted, so
+    counting adds no cost to other searches.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, board, total_player, win_len=None, progress_fn=None, interval=100000):
+        """Initializes a counting search state from a game board.
+
+        Args:
+            board (Board or BitBoard): Game board.
+            total_player (int): Total number of players. Must be greater
+                than 0.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+            progress_fn: Callable taking the number of nodes visited and
+                the number of subtrees remaining. Called every interval
+                nodes. Defaults to None.
+            interval (int): Number of nodes between progress_fn calls.
+                Defaults to 100000.
+
+        Raises:
+            TypeError: board must be a Board or BitBoard object.
+            ValueError: total_player must be greater than 0.
+            ValueError: total_player must be at most side*side.
+            ValueError: win_len must be between 1 and side.
+            ValueError: interval must be greater than 0.
+        """
+        if interval <= 0:
+            raise ValueError("interval must be greater than 0.")
+
+        SearchState.__init__(self, board, total_player, win_len)
+
+        self._nodes = 0
+        self._progress_fn = progress_fn
+        self._interval = interval
+        self.remaining = 0
+
+    def nodes(self):
+        """Returns number of moves played on the state."""
+        return self._nodes
+
+    def play(self, idx, player):
+        """Places the player at the open location index and returns True
+        if the move completes a line for the player. Reports progress
+        every interval moves.
+
+        Args:
+            idx (int): Location index of an open location.
+            player (int): Player number.
+        """
+        self._nodes += 1
+        if self._progress_fn is not None and self._nodes % self._interval == 0:
+            self._progress_fn(self._nodes, self.remaining)
+        return SearchState.play(self, idx, player)
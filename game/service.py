@@ -0,0 +1,257 @@
+"""Module docstring"""
+
+import asyncio
+import json
+
+from .board import Board
+from .lines import validate_win_len
+from .parallel import _worker_pool, _worker_table
+from .symmetry import canonical_form, inverse_transform, transform_win_stats
+from .tictactoe import move_win_stats_fast, next_player
+from .transposition import TranspositionTable
+
+
+def _solve(board, cur_player, total_player, win_len):
+    """Returns move_win_stats_fast for the position using the worker
+    process's transposition table."""
+    return move_win_stats_fast(board, cur_player, total_player, _worker_table(),
+                               win_len=win_len)
+
+
+def _relative_board(board, cur_player, total_player):
+    """Returns the board with every player p relabeled
+    (p - cur_player) % total_player, so the player to move becomes
+    player 0. Other values are kept."""
+    if cur_player == 0:
+        return board
+    return Board(board.side_len(), [(val - cur_player) % total_player
+                                    if isinstance(val, int) and 0 <= val < total_player else val
+                                    for val in board._values()])
+
+
+def parse_request(line):
+    """Returns (request_id, board, cur_player, total_player, win_len) for
+    one line of the JSON lines protocol.
+
+    A request is a JSON object with the keys "board", a list of location
+    values in row first order with null for open locations, "player",
+    the current player number, and optionally "players", the total number
+    of players from 1 to side*side (default 2), "win_len", "side", which
+    must match the board, and "id", which is echoed back.
+
+    Args:
+        line (str or bytes): Request line.
+
+    Raises:
+        ValueError: request must be a JSON object.
+        ValueError: board must be a list of side*side values.
+        ValueError: game board values must be None or a player number.
+        ValueError: player and players must be integers.
+        ValueError: players must be between 1 and side*side.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be greater than 0.
+        ValueError: win_len must be between 1 and side.
+    """
+    try:
+        request = json.loads(line)
+    except ValueError:
+        raise ValueError("request must be a JSON object.")
+    if not isinstance(request, dict):
+        raise ValueError("request must be a JSON object.")
+
+    request_id = request.get("id")
+    vals = request.get("board")
+    cur_player = request.get("player", 0)
+    total_player = request.get("players", 2)
+    win_len = request.get("win_len")
+
+    side = int(len(vals) ** 0.5) if isinstance(vals, list) else 0
+    if side == 0 or side*side != len(vals) or request.get("side", side) != side:
+        raise ValueError("board must be a list of side*side values.")
+    if not all(isinstance(val, int) for val in (cur_player, total_player)):
+        raise ValueError("player and players must be integers.")
+    if not 0 < total_player <= max(side*side, 2):
+        raise ValueError("players must be between 1 and side*side.")
+    next_player(cur_player, total_player)
+    for val in vals:
+        if val is not None and not (isinstance(val, int) and 0 <= val < total_player):
+            raise ValueError("game board values must be None or a player number.")
+    win_len = validate_win_len(side, win_len)
+
+    return (request_id, Board(side, vals), cur_player, total_player, win_len)
+
+
+def format_response(request_id, win_stats=None, error=None):
+    """Returns one line of the JSON lines protocol answering a request.
+
+    The response object echoes "id" and holds either "win_stats", a list
+    of {"row", "col", "wins"} objects in row first order, or "error", a
+    message.
+    """
+    response = {"id": request_id}
+    if error is not None:
+        response["error"] = error
+    else:
+        response["win_stats"] = [{"row": row, "col": col, "wins": wins}
+                                 for (row, col), wins in sorted(win_stats.items())]
+    return json.dumps(response) + "\n"
+
+
+class QueryService(object):
+    """Class used to answer move_win_stats_fast queries from an asyncio
+    event loop.
+
+    Searches run in a process pool so the event loop never blocks.
+    Positions are keyed by the canonical form of their board with the
+    players relabeled relative to the player to move, so a query, any
+    rotation or reflection of it and any cyclic shift of its player
+    numbers and player to move share one search. Queries for a
+    position already being searched wait for that search instead of
+    starting another, and finished results are kept in a bounded least
+    recently used cache shared by every connection.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, jobs=0, cache_size=10000, table_size=100000):
+        """Initializes a query service and its process pool.
+
+        Args:
+            jobs (int): Number of worker processes. Values less than 1
+                use one process per CPU. Defaults to 0.
+            cache_size (int): Maximum number of cached results. Defaults
+                to 10000.
+            table_size (int): Maximum number of entries in each worker's
+                transposition table. Defaults to 100000.
+
+        Raises:
+            ValueError: max_entries must be greater than 0.
+            ValueError: table_size must be greater than 0.
+        """
+        if table_size <= 0:
+            raise ValueError("table_size must be greater than 0.")
+
+        self._cache = TranspositionTable(cache_size)
+        self._pending = {}
+        self._searches = 0
+        self._executor = _worker_pool(jobs, (table_size,))
+
+    def cache(self):
+        """Returns the shared result cache."""
+        return self._cache
+
+    def searches(self):
+        """Returns number of searches started in the process pool."""
+        return self._searches
+
+    def close(self):
+        """Shuts down the process pool."""
+        self._executor.shutdown()
+
+    async def query(self, board, cur_player, total_player, win_len=None):
+        """Returns the move_win_stats_fast result for the position.
+
+        Args:
+            board (Board): Current game board. Open positions must have
+                the value of None.
+            cur_player (int): Current player number.
+            total_player (int): Total number of players.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+
+        Raises:
+            ValueError: cur_player must be between 0 and total_player-1.
+            ValueError: total_player must be greater than 0.
+            ValueError: win_len must be between 1 and side.
+        """
+        next_player(cur_player, total_player)
+        (canon, transform) = canonical_form(_relative_board(board, cur_player, total_player))
+        key = (canon, 0, total_player, validate_win_len(board.side_len(), win_len))
+
+        win_stats = self._cache.get(key)
+        if win_stats is None:
+            future = self._pending.get(key)
+            if future is None:
+                future = asyncio.ensure_future(self._search(key))
+                self._pending[key] = future
+            win_stats = await asyncio.shield(future)
+
+        win_stats = transform_win_stats(win_stats, inverse_transform(transform), board.side_len())
+        return dict((pos, wins[-cur_player:] + wins[:-cur_player])
+                    for pos, wins in win_stats.items())
+
+    async def _search(self, key):
+        """Runs the search for a cache key in the process pool and caches
+        its result."""
+        self._searches += 1
+        loop = asyncio.get_running_loop()
+        try:
+            win_stats = await loop.run_in_executor(self._executor, _solve, *key)
+            self._cache.put(key, win_stats)
+            return win_stats
+        finally:
+            del self._pending[key]
+
+    async def handle_line(self, line):
+        """Returns the response line for a request line."""
+        request_id = None
+        try:
+            (request_id, board, cur_player, total_player, win_len) = parse_request(line)
+        except (TypeError, ValueError) as err:
+            return format_response(request_id, error=str(err))
+
+        # A failed search answers its own request instead of closing the
+        # connection and every other request in flight on it.
+        try:
+            win_stats = await self.query(board, cur_player, total_player, win_len)
+        except Exception as err:
+            return format_response(request_id, error=str(err) or type(err).__name__)
+
+        return format_response(request_id, win_stats)
+
+    async def handle_connection(self, reader, writer):
+        """Answers the request lines of one client connection.
+
+        Requests are answered concurrently, so responses may arrive in a
+        different order than their requests. Clients match them by id.
+        """
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            response = await self.handle_line(line)
+            async with lock:
+                writer.write(response.encode())
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    task = asyncio.ensure_future(answer(line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+
+async def start_server(service, host="127.0.0.1", port=0):
+    """Returns an asyncio server answering JSON lines requests on a local
+    TCP port with the query service.
+
+    Args:
+        service (QueryService): Service answering the requests.
+        host (str): Address to listen on. Defaults to "127.0.0.1".
+        port (int): Port to listen on. Defaults to 0, which picks a free
+            port.
+    """
+    return await asyncio.start_server(service.handle_connection, host, port)
@@ -0,0 +1,235 @@
+"""Module docstring"""
+
+import math
+import time
+
+from .search import SearchState
+
+
+class SearchStats(object):
+    """Class used to record where a move_win_stats search spends its work.
+
+    Pass an instance as the stats argument of move_win_stats or
+    move_win_stats_fast to fill it in. Searches run without one use plain
+    search states and collate functions, so recording costs nothing when
+    it is turned off. A SearchStats object accumulates over every search
+    it is passed to.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self):
+        """Initializes empty search statistics."""
+        self._nodes_by_depth = [0]
+        self._wins = 0
+        self._draws = 0
+        self._pruned = 0
+        self._win_check_time = 0.0
+        self._collate_time = 0.0
+        self._collate_calls = 0
+        self._symmetric_collapses = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._elapsed = 0.0
+
+    def nodes_by_depth(self):
+        """Returns a list holding the number of positions visited at each
+        depth, the number of moves played below the searched position.
+        Index 0 counts the searched positions themselves."""
+        return list(self._nodes_by_depth)
+
+    def nodes(self):
+        """Returns total number of positions visited."""
+        return sum(self._nodes_by_depth)
+
+    def wins(self):
+        """Returns number of moves that completed a line."""
+        return self._wins
+
+    def draws(self):
+        """Returns number of moves that filled the board without
+        completing a line. Every game below a pruned position is a draw,
+        so a pruned position with k open locations counts the k!
+        games a search without pruning would have played out below it."""
+        return self._draws
+
+    def pruned(self):
+        """Returns number of positions left unsearched because no player
+        could still complete a line."""
+        return self._pruned
+
+    def win_check_time(self):
+        """Returns seconds spent playing moves and checking them for a
+        win."""
+        return self._win_check_time
+
+    def collate_time(self):
+        """Returns seconds spent collating open positions."""
+        return self._collate_time
+
+    def collate_calls(self):
+        """Returns number of times open positions were collated."""
+        return self._collate_calls
+
+    def symmetric_collapses(self):
+        """Returns number of open positions that collation skipped because
+        they share statistics with a searched position."""
+        return self._symmetric_collapses
+
+    def cache_hits(self):
+        """Returns number of transposition table lookups that hit."""
+        return self._cache_hits
+
+    def cache_misses(self):
+        """Returns number of transposition table lookups that missed."""
+        return self._cache_misses
+
+    def cache_hit_rate(self):
+        """Returns fraction of transposition table lookups that hit, or
+        None if the table was never consulted."""
+        lookups = self._cache_hits + self._cache_misses
+        if lookups == 0:
+            return None
+        return self._cache_hits / lookups
+
+    def elapsed(self):
+        """Returns seconds spent in the recorded searches."""
+        return self._elapsed
+
+    def to_dict(self):
+        """Returns the statistics as a JSON serializable dictionary."""
+        return {"nodes": self.nodes(),
+                "nodes_by_depth": self.nodes_by_depth(),
+                "wins": self._wins,
+                "draws": self._draws,
+                "pruned": self._pruned,
+                "win_check_time": self._win_check_time,
+                "collate_time": self._collate_time,
+                "collate_calls": self._collate_calls,
+                "symmetric_collapses": self._symmetric_collapses,
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses,
+                "cache_hit_rate": self.cache_hit_rate(),
+                "elapsed": self._elapsed}
+
+    def summary(self):
+        """Returns a human readable multi-line summary."""
+        hit_rate = self.cache_hit_rate()
+        lines = [
+            "nodes: {} in {:.3f} s".format(self.nodes(), self._elapsed),
+            "nodes by depth: {}".format(" ".join(str(n) for n in self._nodes_by_depth)),
+            "terminal wins: {}, draws: {}, drawn positions pruned: {}".format(
+                self._wins, self._draws, self._pruned),
+            "win check time: {:.3f} s".format(self._win_check_time),
+            "collate time: {:.3f} s over {} calls, {} symmetric positions skipped".format(
+                self._collate_time, self._collate_calls, self._symmetric_collapses),
+            "cache hits: {}, misses: {}, hit rate: {}".format(
+                self._cache_hits, self._cache_misses,
+                "n/a" if hit_rate is None else "{:.1%}".format(hit_rate))
+        ]
+        return "\n".join(lines)
+
+    def _record_collate(self, elapsed, open_count, group_count):
+        """Adds one collate call."""
+        self._collate_time += elapsed
+        self._collate_calls += 1
+        self._symmetric_collapses += open_count - group_count
+
+
+class StatsSearchState(SearchState):
+    """Class used to represent a mutable game position that records the
+    moves played on it in a SearchStats object.
+
+    Attributes:
+        None
+    """
+
+    def __init__(self, board, total_player, win_len=None, stats=None):
+        """Initializes a recording search state from a game board.
+
+        Args:
+            board (Board or BitBoard): Game board.
+            total_player (int): Total number of players. Must be greater
+                than 0.
+            win_len (int): Number of locations in a row needed to win.
+                Defaults to None, which uses the side length.
+            stats (SearchStats): Statistics to record into.
+
+        Raises:
+            TypeError: board must be a Board or BitBoard object.
+            ValueError: total_player must be greater than 0.
+            ValueError: total_player must be at most side*side.
+            ValueError: win_len must be between 1 and side.
+            TypeError: stats must be a SearchStats object.
+        """
+        SearchState.__init__(self, board, total_player, win_len)
+        if not isinstance(stats, SearchStats):
+            raise TypeError("stats must be a SearchStats object.")
+
+        self._stats = stats
+        self._depth = 0
+        stats._nodes_by_depth[0] += 1
+
+    def play(self, idx, player):
+        """Places the player at the open location index and returns True
+        if the move completes a line for the player, recording the move.
+
+        Args:
+            idx (int): Location index of an open location.
+            player (int): Player number.
+        """
+        stats = self._stats
+        start = time.perf_counter()
+        won = SearchState.play(self, idx, player)
+        stats._win_check_time += time.perf_counter() - start
+
+        self._depth += 1
+        if self._depth == len(stats._nodes_by_depth):
+            stats._nodes_by_depth.append(0)
+        stats._nodes_by_depth[self._depth] += 1
+
+        if won:
+            stats._wins += 1
+        elif self._open_count == 0:
+            stats._draws += 1
+        return won
+
+    def undo(self, idx, player):
+        """Removes the player from the location index, reversing play.
+
+        Args:
+            idx (int): Location index played by the player.
+            player (int): Player number.
+        """
+        SearchState.undo(self, idx, player)
+        self._depth -= 1
+
+    def can_win(self, cur_player):
+        """Returns True if some player may still complete a line with the
+        player to move next, recording the position as pruned and its
+        games as draws otherwise.
+
+        Args:
+            cur_player (int): Player to move.
+        """
+        if SearchState.can_win(self, cur_player):
+            return True
+        if self._open_count > 0:
+            self._stats._pruned += 1
+            self._stats._draws += math.factorial(self._open_count)
+        return False
+
+
+def stats_collate_fn(collate_fn, stats):
+    """Returns a collate function that calls collate_fn and records its
+    time and the positions it collapsed in stats."""
+    def collate(state, positions):
+        open_count = len(positions)
+        start = time.perf_counter()
+        collated_positions = collate_fn(state, positions)
+        stats._record_collate(time.perf_counter() - start, open_count,
+                              len(collated_positions))
+        return collated_positions
+
+    return collate
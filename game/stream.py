@@ -0,0 +1,173 @@
+"""Module docstring"""
+
+import collections
+import csv
+from concurrent.futures import FIRST_COMPLETED, wait
+
+from .board import Board
+from .lines import validate_win_len
+from .parallel import _init_worker, _worker_count, _worker_pool, _worker_table
+from .service import format_response, parse_request
+from .tictactoe import move_win_orbits, next_player
+
+
+FORMATS = ("jsonl", "csv")
+CSV_FIELDS = ("id", "side", "cells", "player", "players", "win_len")
+CSV_OUTPUT_FIELDS = ("id", "row", "col", "wins", "error")
+OPEN_CELLS = ".-"
+
+
+def _evaluate(record):
+    """Returns (request_id, win_stats, error) for one parsed record."""
+    (request_id, position, error) = record
+    if error is not None:
+        return (request_id, None, error)
+
+    (board, cur_player, total_player, win_len) = position
+    win_stats = move_win_orbits(board, cur_player, total_player, _worker_table(),
+                                win_len=win_len)
+    return (request_id, win_stats, None)
+
+
+def read_jsonl(lines):
+    """Yields a (request_id, position, error) record for every non-blank
+    line of JSON lines input.
+
+    Lines are objects in the format read by service.parse_request.
+    Records without an id are numbered by line from 1. position is a
+    (board, cur_player, total_player, win_len) tuple, or None when error
+    holds the message explaining why the line was rejected.
+
+    Args:
+        lines: Iterable of str lines.
+    """
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            (request_id, board, cur_player, total_player, win_len) = parse_request(line)
+        except ValueError as err:
+            yield (number, None, str(err))
+            continue
+        yield (number if request_id is None else request_id,
+               (board, cur_player, total_player, win_len), None)
+
+
+def _csv_position(row):
+    """Returns (board, cur_player, total_player, win_len) for a CSV row."""
+    try:
+        side = int(row["side"])
+        cur_player = int(row.get("player") or 0)
+        total_player = int(row.get("players") or 2)
+        win_len = int(row["win_len"]) if row.get("win_len") else None
+    except (TypeError, ValueError):
+        raise ValueError("side, player, players and win_len must be integers.")
+
+    cells = row.get("cells") or ""
+    if side <= 0 or len(cells) != side*side:
+        raise ValueError("cells must hold side*side values.")
+    next_player(cur_player, total_player)
+
+    vals = []
+    for cell in cells:
+        if cell in OPEN_CELLS:
+            vals.append(None)
+        elif cell.isdigit() and int(cell) < total_player:
+            vals.append(int(cell))
+        else:
+            raise ValueError("game board values must be None or a player number.")
+
+    return (Board(side, vals), cur_player, total_player, validate_win_len(side, win_len))
+
+
+def read_csv(lines):
+    """Yields a (request_id, position, error) record for every row of CSV
+    input.
+
+    The first line is a header naming the CSV_FIELDS columns, of which
+    side and cells are required. cells holds one character per location
+    in row first order, "." or "-" for open locations and a digit for a
+    player. Records are numbered from 1 when the id column is missing or
+    blank.
+
+    Args:
+        lines: Iterable of str lines.
+    """
+    for number, row in enumerate(csv.DictReader(lines), 1):
+        request_id = row.get("id") or number
+        try:
+            yield (request_id, _csv_position(row), None)
+        except ValueError as err:
+            yield (request_id, None, str(err))
+
+
+def evaluate(records, jobs=1, ordered=True, table_size=100000):
+    """Yields (request_id, win_stats, error) for every record as it is
+    evaluated with move_win_orbits. win_stats is a MoveWinStats object,
+    which crosses process boundaries holding one win vector per group of
+    symmetric moves.
+
+    Records are evaluated in a pool of worker processes that live for the
+    whole stream, each with its own transposition table, so the start up
+    cost is paid once rather than per position. At most a few records per
+    worker are in flight, so input is read as results are written.
+
+    Args:
+        records: Iterable of (request_id, position, error) records as
+            yielded by read_jsonl or read_csv.
+        jobs (int): Number of worker processes. Defaults to 1, which
+            evaluates in the calling process. Values less than 1 use one
+            process per CPU.
+        ordered (bool): Yield results in input order. When False results
+            are yielded as soon as they are ready. Defaults to True.
+        table_size (int): Maximum number of entries in each transposition
+            table. Defaults to 100000.
+
+    Raises:
+        ValueError: max_entries must be greater than 0.
+    """
+    if jobs == 1:
+        _init_worker((table_size,))
+        for record in records:
+            yield _evaluate(record)
+        return
+
+    window = 4*_worker_count(jobs)
+    with _worker_pool(jobs, (table_size,)) as executor:
+        pending = collections.deque()
+        for record in records:
+            pending.append(executor.submit(_evaluate, record))
+            while len(pending) >= window:
+                for result in _finished(pending, ordered):
+                    yield result
+        while len(pending) > 0:
+            for result in _finished(pending, ordered):
+                yield result
+
+
+def _finished(pending, ordered):
+    """Removes and returns the results of finished futures, waiting for
+    the oldest one when ordered and for any one otherwise."""
+    if ordered:
+        return [pending.popleft().result()]
+
+    (done, not_done) = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+    return [future.result() for future in done]
+
+
+def write_jsonl(out, request_id, win_stats, error):
+    """Writes one result as a line in the server response format."""
+    out.write(format_response(request_id, win_stats, error))
+
+
+def write_csv(writer, request_id, win_stats, error):
+    """Writes one result to a csv.writer as one row per open location,
+    with the win counts separated by spaces, or one row holding the
+    error."""
+    if error is not None:
+        writer.writerow([request_id, "", "", "", error])
+        return
+    for (row, col), wins in sorted(win_stats.items()):
+        writer.writerow([request_id, row, col, " ".join(str(count) for count in wins), ""])
@@ -0,0 +1,247 @@
+"""Module docstring"""
+
+from .board import Board
+from .bitboard import BitBoard
+
+
+_TRANSFORM_FNS = {
+    "identity":       lambda row, col, side: (row, col),
+    "flip_lr":        lambda row, col, side: (row, side - col - 1),
+    "flip_ud":        lambda row, col, side: (side - row - 1, col),
+    "transpose":      lambda row, col, side: (col, row),
+    "anti_transpose": lambda row, col, side: (side - col - 1, side - row - 1),
+    "rot90":          lambda row, col, side: (col, side - row - 1),
+    "rot180":         lambda row, col, side: (side - row - 1, side - col - 1),
+    "rot270":         lambda row, col, side: (side - col - 1, row),
+}
+
+TRANSFORMS = tuple(_TRANSFORM_FNS.keys())
+
+_INVERSE = {name: name for name in TRANSFORMS}
+_INVERSE["rot90"] = "rot270"
+_INVERSE["rot270"] = "rot90"
+
+_PERMUTATIONS = {}
+_BIT_TABLES = {}
+
+
+def _validate_transform(transform):
+    """Raises ValueError if the transform name is invalid.
+
+    Args:
+        transform (str): Transform name.
+    """
+    if transform not in _TRANSFORM_FNS:
+        raise ValueError("transform must be one of {}.".format(", ".join(TRANSFORMS)))
+
+
+def inverse_transform(transform):
+    """Returns the name of the transform that undoes the given transform.
+
+    Args:
+        transform (str): Transform name.
+
+    Raises:
+        ValueError: transform must be one of the names in TRANSFORMS.
+    """
+    _validate_transform(transform)
+    return _INVERSE[transform]
+
+
+def transform_position(transform, pos, side):
+    """Returns the (row,col) location that the given location moves to
+    under the transform.
+
+    Args:
+        transform (str): Transform name.
+        pos: (row,col) tuple.
+        side (int): Length of board on one side.
+
+    Raises:
+        ValueError: transform must be one of the names in TRANSFORMS.
+    """
+    _validate_transform(transform)
+    return _TRANSFORM_FNS[transform](pos[0], pos[1], side)
+
+
+def _permutations(side):
+    """Returns a dictionary of location index permutations per transform.
+    Index idx of a permutation holds the index that idx moves to."""
+    if side not in _PERMUTATIONS:
+        perms = {}
+        for name, fn in _TRANSFORM_FNS.items():
+            perm = []
+            for idx in range(side*side):
+                (row, col) = fn(idx // side, idx % side, side)
+                perm.append(row*side + col)
+            perms[name] = tuple(perm)
+        _PERMUTATIONS[side] = perms
+    return _PERMUTATIONS[side]
+
+
+def _bit_tables(side):
+    """Returns a list of (transform, tables) tuples where tables holds,
+    for every 8 bit chunk of a mask, the transformed bits of each of the
+    256 chunk values."""
+    if side not in _BIT_TABLES:
+        size = side*side
+        bit_tables = []
+        for name, perm in _permutations(side).items():
+            tables = []
+            for base in range(0, size, 8):
+                table = []
+                for chunk in range(256):
+                    bits = 0
+                    for bit in range(8):
+                        if chunk >> bit & 1 and base + bit < size:
+                            bits |= 1 << perm[base + bit]
+                    table.append(bits)
+                tables.append(tuple(table))
+            bit_tables.append((name, tuple(tables)))
+        _BIT_TABLES[side] = bit_tables
+    return _BIT_TABLES[side]
+
+
+def _transform_mask(mask, tables):
+    """Returns the mask with its bits moved by the chunk tables."""
+    bits = 0
+    for table in tables:
+        bits |= table[mask & 255]
+        mask >>= 8
+    return bits
+
+
+def _cell_order(val):
+    """Returns a sort key that orders heterogeneous location values."""
+    if val is None:
+        return (0, "", "")
+    return (1, type(val).__name__, repr(val))
+
+
+def _canonical_cells(board):
+    """Returns (cells, transform) for the smallest transformed tuple of
+    Board location values."""
+    side = board.side_len()
+    vals = board._values()
+
+    best = None
+    for name, perm in _permutations(side).items():
+        cells = [None] * len(vals)
+        for idx, val in enumerate(vals):
+            cells[perm[idx]] = val
+        order = tuple(_cell_order(val) for val in cells)
+        if best is None or order < best[0]:
+            best = (order, tuple(cells), name)
+
+    return (best[1], best[2])
+
+
+def _canonical_masks(board):
+    """Returns (masks, transform) for the smallest transformed tuple of
+    BitBoard player masks."""
+    masks = board.masks()
+
+    best = None
+    for name, tables in _bit_tables(board.side_len()):
+        cells = tuple(_transform_mask(mask, tables) for mask in masks)
+        if best is None or cells < best[0]:
+            best = (cells, name)
+
+    return best
+
+
+def transform_board(board, transform):
+    """Returns a new board with every location value moved by the
+    transform.
+
+    Args:
+        board (Board or BitBoard): Game board.
+        transform (str): Transform name.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: transform must be one of the names in TRANSFORMS.
+    """
+    _validate_transform(transform)
+
+    if isinstance(board, BitBoard):
+        tables = dict(_bit_tables(board.side_len()))[transform]
+        return BitBoard(board.side_len(), board.total_player(),
+                        [_transform_mask(mask, tables) for mask in board.masks()])
+    if not isinstance(board, Board):
+        raise TypeError("board must be a Board or BitBoard object.")
+
+    side = board.side_len()
+    perm = _permutations(side)[transform]
+    vals = board._values()
+    cells = [None] * len(vals)
+    for idx, val in enumerate(vals):
+        cells[perm[idx]] = val
+    return Board(side, cells)
+
+
+def canonical_form(board):
+    """Returns the canonical representative of the board's symmetry orbit
+    and the transform that maps the board to it.
+
+    All 8 rotations and reflections of a board share one canonical
+    representative. Use transform_position with the inverse transform to
+    map locations on the canonical board back to the given board.
+
+    Args:
+        board (Board or BitBoard): Game board.
+
+    Returns:
+        A (board, transform) tuple. The board has the same type as the
+        given board.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+    """
+    if isinstance(board, BitBoard):
+        (masks, transform) = _canonical_masks(board)
+        return (BitBoard(board.side_len(), board.total_player(), masks), transform)
+    if not isinstance(board, Board):
+        raise TypeError("board must be a Board or BitBoard object.")
+
+    (cells, transform) = _canonical_cells(board)
+    return (Board(board.side_len(), list(cells)), transform)
+
+
+def canonical_key(board, cur_player, total_player):
+    """Returns a hashable key shared by every position in the board's
+    symmetry orbit with the same player to move and number of players.
+
+    Args:
+        board (Board or BitBoard): Game board.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+    """
+    if isinstance(board, BitBoard):
+        cells = _canonical_masks(board)[0]
+    elif isinstance(board, Board):
+        cells = _canonical_cells(board)[0]
+    else:
+        raise TypeError("board must be a Board or BitBoard object.")
+
+    return (type(board), board.side_len(), cells, cur_player, total_player)
+
+
+def transform_win_stats(win_stats, transform, side):
+    """Returns a copy of a move_win_stats dictionary with every location
+    key moved by the transform.
+
+    Args:
+        win_stats: Dictionary of win statistics keyed by (row,col) tuples.
+        transform (str): Transform name.
+        side (int): Length of board on one side.
+
+    Raises:
+        ValueError: transform must be one of the names in TRANSFORMS.
+    """
+    _validate_transform(transform)
+    fn = _TRANSFORM_FNS[transform]
+    return {fn(pos[0], pos[1], side): stats.copy() for pos, stats in win_stats.items()}
@@ -1,6 +1,17 @@
 """Module docstring"""
 
+import time
+
 from .board import Board
+from .bitboard import BitBoard
+from .lines import cell_lines, line_cells
+from .search import ProgressSearchState, SearchState
+from .parallel import parallel_orbit_stats
+from .results import MoveWinStats
+from .stats import StatsSearchState, stats_collate_fn
+from .symmetry import _permutations
+
+_BOARD_TYPES = (Board, BitBoard)
 
 
 def next_player(cur_player, total_player):
@@ -28,36 +39,42 @@ def next_player(cur_player, total_player):
     else:
         return cur_player + 1
 
-def is_winning_move(board, row, col):
+def is_winning_move(board, row, col, win_len=None):
     """Returns True if the value in the given location is a winning
     move based on Tic Tac Toe rules. Returns false otherwise.
 
+    A move wins when it completes a horizontal, vertical or diagonal
+    line of win_len equal values. Only the precomputed lines through the
+    given location are checked.
+
     Args:
-        board (Board): Game board with location values.
+        board (Board or BitBoard): Game board with location values.
         row (int): Row location.
         col (int): Column location.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length so that a whole
+            row, column or diagonal must match.
 
     Raises:
-        TypeError: board must be a Board object.
+        TypeError: board must be a Board or BitBoard object.
         ValueError: game board row must be between 0 and side-1.
         ValueError: game board column must be between 0 and side-1.
+        ValueError: win_len must be between 1 and side.
     """
+    if isinstance(board, BitBoard):
+        return board.is_winning_move(row, col, win_len)
     if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
+        raise TypeError("board must be a Board or BitBoard object.")
 
     val = board.get(row, col)
 
-    is_ldiag = row == col
-    is_rdiag = row == board.side_len() - col - 1
+    side = board.side_len()
+    lines = line_cells(side, win_len)
+    vals = board._values()
 
-    if all(map(lambda v: v == val, board.get_row(row))):
-        return True
-    if all(map(lambda v: v == val, board.get_col(col))):
-        return True
-    if is_ldiag and all(map(lambda v: v == val, board.get_ldiag())):
-        return True
-    if is_rdiag and all(map(lambda v: v == val, board.get_rdiag())):
-        return True
+    for line_id in cell_lines(side, win_len)[row*side + col]:
+        if all(vals[idx] == val for idx in lines[line_id]):
+            return True
 
     return False
 
@@ -65,7 +82,7 @@ def matching_positions(board, val):
     """Returns list of board locations that match the given value.
 
     Args:
-        board: Board to search for matching values
+        board (Board or BitBoard): Board to search for matching values
         val: Board value to match.
 
     Returns:
@@ -74,34 +91,39 @@ def matching_positions(board, val):
         present in the board.
 
     Raises:
-        TypeError: board must be a Board object.
+        TypeError: board must be a Board or BitBoard object.
     """
+    if isinstance(board, BitBoard):
+        return board.matching_positions(val)
     if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
+        raise TypeError("board must be a Board or BitBoard object.")
 
-    return [(row, col) 
-            for row in range(board.side_len())
-                for col in range(board.side_len()) 
-                    if board.get(row, col) == val]
+    side = board.side_len()
+    return [(idx // side, idx % side)
+            for idx, cell in enumerate(board._values()) if cell == val]
 
 def is_symmetric(board, symmetry_fn):
     """Returns true if the board is symmetric based on the symmetry function.
 
     Raises:
-        TypeError: board must be a Board object.
+        TypeError: board must be a Board or BitBoard object.
         TypeError: symmetry_fn must be callable.
     """
-    if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
+    if not isinstance(board, _BOARD_TYPES):
+        raise TypeError("board must be a Board or BitBoard object.")
     if not callable(symmetry_fn):
         raise TypeError("symmetry_fn must be callable.")
 
+    if isinstance(board, BitBoard):
+        return board.is_symmetric(symmetry_fn)
+
     side = board.side_len()
+    vals = board._values()
 
     for row in range(side):
         for col in range(side):
             (sym_row, sym_col) = symmetry_fn((row, col))
-            if board.get(row, col) != board.get(sym_row, sym_col):
+            if vals[row*side + col] != board.get(sym_row, sym_col):
                 return False
 
     return True
@@ -110,58 +132,59 @@ def _collate_positions(board, positions):
     """Returns simple collated position list.
 
     Ex: [1, 2, 3] -> [[1], [2], [3]]
-    
-    Raises:
-        TypeError: board must be a Board object.
-    """
-    if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
 
+    The collate functions are called at every node of a search and trust
+    their caller to pass a Board, BitBoard or SearchState.
+    """
     return [[pos] for pos in positions]
 
+def _symmetry_perms(board):
+    """Returns the location index permutations, other than the identity,
+    that map the board onto itself."""
+    if isinstance(board, SearchState):
+        return board.symmetries()
+
+    vals = board._values()
+    return [perm for name, perm in _permutations(board.side_len()).items()
+            if name != "identity" and all(vals[perm[idx]] == val for idx, val in enumerate(vals))]
+
 def _collate_symmetric_positions(board, positions):
     """Returns collated position list based on board symmetry.
 
     Positions are collated together if the equivalent based on board symmetry.
-
-    Raises:
-        TypeError: board must be a Board object.
+    The transforms that map the board onto itself are found once, then
+    each position is grouped with its images under them. The transforms
+    are closed under composition, so one pass over them finds every
+    position symmetric to a given one.
     """
-    if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
-
-    collated_positions = []
+    perms = _symmetry_perms(board)
+    if len(perms) == 0:
+        return [[pos] for pos in reversed(positions)]
 
     side = board.side_len()
-    symmetry_fns = [
-        lambda pos: (pos[0], side - pos[1] - 1),            # left/right
-        lambda pos: (side - pos[0] - 1, pos[1]),            # up/down
-        lambda pos: (pos[1], pos[0]),                       # left diag
-        lambda pos: (side - pos[1] - 1, side - pos[0] - 1), # right diag
-        lambda pos: (pos[1], side - pos[0] - 1),            # rotate 90
-        lambda pos: (side - pos[0] - 1, side - pos[1] - 1), # rotate 180
-        lambda pos: (side - pos[1] - 1, pos[0])             # rotate 270
-    ]
-
-    while len(positions) > 0:
-        cur_pos = positions.pop()
-
-        symmetric_positions = [cur_pos]
+    open_idxs = set(row*side + col for row, col in positions)
 
-        for symmetry_fn in symmetry_fns:
-            if is_symmetric(board, symmetry_fn):
-                sym_pos = symmetry_fn(cur_pos)
-
-                if sym_pos in positions:
-                    positions.remove(sym_pos)
-                    symmetric_positions.append(sym_pos)
+    collated_positions = []
+    for (row, col) in reversed(positions):
+        idx = row*side + col
+        if idx not in open_idxs:
+            continue
+        open_idxs.discard(idx)
+
+        symmetric_positions = [(row, col)]
+        for perm in perms:
+            sym_idx = perm[idx]
+            if sym_idx in open_idxs:
+                open_idxs.discard(sym_idx)
+                symmetric_positions.append((sym_idx // side, sym_idx % side))
 
         collated_positions.append(symmetric_positions)
 
     return collated_positions
 
 
-def move_win_stats(board, cur_player, total_player):
+def move_win_stats(board, cur_player, total_player, table=None, jobs=1, split_depth=2,
+                   win_len=None, stats=None, engine="recursive"):
     """Returns the statistics of the current player winning for each
     open move on the board assuming the rules of Tic Tac Toe.
 
@@ -169,10 +192,32 @@ def move_win_stats(board, cur_player, total_player):
     regardless of prior results or board symmetry. 
 
     Args:
-        board (Board): Current game board. Open positions must have
-            the value of None.
+        board (Board or BitBoard): Current game board. Open positions
+            must have the value of None.
         cur_player (int): Current player number.
         total_player (int): Total number of players.
+        table (TranspositionTable): Cache for the win statistics of
+            positions reached by more than one sequence of moves.
+            Entries are keyed with the players relabeled relative to
+            the player to move, so a table kept across searches also
+            serves positions whose player numbers are cyclically
+            shifted. Defaults to None, which disables caching.
+        jobs (int): Number of worker processes. Defaults to 1, which
+            searches in the calling process. Values less than 1 use one
+            process per CPU. Each worker keeps its own table with the
+            size and policy of the given table.
+        split_depth (int): Number of plies below each open move at which
+            the tree is cut into work items when jobs is not 1.
+            Defaults to 2.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        stats (SearchStats): Statistics to record the search into.
+            Defaults to None, which records nothing. Requires jobs to
+            be 1.
+        engine (str): Tree walk, "recursive" or "iterative". The
+            iterative engine keeps its frames on an explicit stack, so
+            deep trees do not reach the recursion limit. Both give the
+            same statistics. Defaults to "recursive".
 
     Returns:
         A dictionary of lists. The keys are (row,col) tuples for open
@@ -187,23 +232,56 @@ def move_win_stats(board, cur_player, total_player):
         won 3 times. The in the latter case win ratio was 10 to 2.
 
     Raises:
-        TypeError: board must be a Board object.
+        TypeError: board must be a Board or BitBoard object.
+        TypeError: stats must be a SearchStats object.
+        ValueError: split_depth must be 0 or greater.
+        ValueError: stats require jobs to be 1.
+        ValueError: engine must be "recursive" or "iterative".
+        ValueError: total_player must be at most side*side.
+        ValueError: win_len must be between 1 and side.
     """
-    return _move_win_stats(board, cur_player, total_player, _collate_positions)
+    return _expand_orbits(_move_orbits(board, cur_player, total_player, _collate_positions,
+                                       table, _position_key, jobs, split_depth, win_len, stats,
+                                       engine))
 
 
-def move_win_stats_fast(board, cur_player, total_player):
+def move_win_stats_fast(board, cur_player, total_player, table=None, jobs=1, split_depth=2,
+                        win_len=None, stats=None, engine="recursive"):
     """Returns the statistics of the current player winning for each
     open move on the board assuming the rules of Tic Tac Toe.
 
     This is a fast algorithm that utilizes board symmetry to avoid
-    replaying moves that are symmetric to already played moves.
+    replaying moves that are symmetric to already played moves. Table
+    entries are keyed on the canonical form of each position so
+    that rotations and reflections share one entry.
 
     Args:
-        board (Board): Current game board. Open positions must have
-            the value of None.
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
         cur_player (int): Current player number.
         total_player (int): Total number of players.
+        table (TranspositionTable): Cache for the win statistics of
+            positions reached by more than one sequence of moves.
+            Entries are keyed with the players relabeled relative to
+            the player to move, so a table kept across searches also
+            serves positions whose player numbers are cyclically
+            shifted. Defaults to None, which disables caching.
+        jobs (int): Number of worker processes. Defaults to 1, which
+            searches in the calling process. Values less than 1 use one
+            process per CPU. Each worker keeps its own table with the
+            size and policy of the given table.
+        split_depth (int): Number of plies below each open move at which
+            the tree is cut into work items when jobs is not 1.
+            Defaults to 2.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        stats (SearchStats): Statistics to record the search into.
+            Defaults to None, which records nothing. Requires jobs to
+            be 1.
+        engine (str): Tree walk, "recursive" or "iterative". The
+            iterative engine keeps its frames on an explicit stack, so
+            deep trees do not reach the recursion limit. Both give the
+            same statistics. Defaults to "recursive".
 
     Returns:
         A dictionary of lists. The keys are (row,col) tuples for open
@@ -218,44 +296,650 @@ def move_win_stats_fast(board, cur_player, total_player):
         won 3 times. The in the latter case win ratio was 10 to 2.
 
     Raises:
-        TypeError: board must be a Board object.
+        TypeError: board must be a Board or BitBoard object.
+        TypeError: stats must be a SearchStats object.
+        ValueError: split_depth must be 0 or greater.
+        ValueError: stats require jobs to be 1.
+        ValueError: engine must be "recursive" or "iterative".
+        ValueError: total_player must be at most side*side.
+        ValueError: win_len must be between 1 and side.
     """
-    return _move_win_stats(board, cur_player, total_player, _collate_symmetric_positions)
+    return _expand_orbits(_move_orbits(board, cur_player, total_player,
+                                       _collate_symmetric_positions, table,
+                                       _canonical_position_key, jobs, split_depth, win_len,
+                                       stats, engine))
 
 
-def _move_win_stats(board, cur_player, total_player, collate_fn):
-    """Returns the statistics of the current player winning for each
-    open move on the board assuming the rules of Tic Tac Toe.
+def move_win_orbits(board, cur_player, total_player, table=None, jobs=1, split_depth=2,
+                    win_len=None, stats=None, engine="recursive"):
+    """Returns the statistics of move_win_stats_fast as a MoveWinStats
+    object, which keeps one win vector per group of symmetric moves
+    rather than a copy per move.
+
+    Args:
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        table (TranspositionTable): Cache as for move_win_stats_fast.
+            Defaults to None, which disables caching.
+        jobs (int): Number of worker processes. Defaults to 1.
+        split_depth (int): Number of plies below each open move at which
+            the tree is cut into work items when jobs is not 1.
+            Defaults to 2.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        stats (SearchStats): Statistics to record the search into.
+            Defaults to None, which records nothing.
+        engine (str): Tree walk, "recursive" or "iterative". Defaults to
+            "recursive".
+
+    Returns:
+        A MoveWinStats object that reads like the dictionary returned by
+        move_win_stats_fast. Its to_dict method returns that dictionary.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        TypeError: stats must be a SearchStats object.
+        ValueError: split_depth must be 0 or greater.
+        ValueError: stats require jobs to be 1.
+        ValueError: engine must be "recursive" or "iterative".
+        ValueError: total_player must be at most side*side.
+        ValueError: win_len must be between 1 and side.
     """
-    if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
+    orbits = _move_orbits(board, cur_player, total_player, _collate_symmetric_positions, table,
+                          _canonical_position_key, jobs, split_depth, win_len, stats, engine)
+    return MoveWinStats(board.side_len(), total_player, orbits)
+
 
+def _position_key(state, cur_player, total_player):
+    """Returns a hashable transposition table key for the position,
+    player to move and number of players built from the position's
+    incrementally updated Zobrist key with the players relabeled
+    relative to the player to move."""
+    return (state.relative_zobrist_key(cur_player), total_player)
+
+
+def _canonical_position_key(state, cur_player, total_player):
+    """Returns a hashable transposition table key shared by every
+    rotation and reflection of the position built from its symmetric
+    relative Zobrist keys."""
+    return (state.canonical_relative_zobrist_key(cur_player), total_player)
+
+
+def _rotate_wins(wins, shift):
+    """Returns the win vector with the count of player p moved to index
+    (p - shift) % len(wins).
+
+    Table keys relabel the players relative to the player to move, so
+    table entries hold win vectors rotated by cur_player and are rotated
+    back by -cur_player when read. A position reached with a different
+    player to move but the same relative placement shares the entry."""
+    return wins[shift:] + wins[:shift]
+
+
+def _collated_moves(state, collate_fn, open_positions):
+    """Returns the collated open positions as (location index,
+    multiplicity) pairs, the last position of each group standing in for
+    the group."""
+    if len(open_positions) == 0:
+        return []
+
+    side = state.side_len()
+    return [(group[-1][0]*side + group[-1][1], len(group))
+            for group in collate_fn(state, open_positions)]
+
+
+def _subtree_wins(state, cur_player, total_player, collate_fn, table, key_fn):
+    """Returns the number of times each player won over all moves
+    available to the current player, consulting the table if given.
+
+    Win vectors are summed into one preallocated list holding
+    total_player counters per depth, which _add_subtree_wins reuses for
+    every position at that depth. Positions where no player can still
+    complete a line are not searched, as every game from them is a
+    draw."""
+    if not state.can_win(cur_player):
+        return [0] * total_player
+
+    key = None
+    if table is not None:
+        key = key_fn(state, cur_player, total_player)
+        wins = table.get(key)
+        if wins is not None:
+            return _rotate_wins(wins, -cur_player)
+
+    acc = [0] * ((len(state.open_positions()) + 1)*total_player)
+    _add_subtree_wins(state, cur_player, total_player, collate_fn, table, key_fn, acc, 0, key)
+    return acc[:total_player]
+
+
+def _add_subtree_wins(state, cur_player, total_player, collate_fn, table, key_fn, acc, base,
+                      key):
+    """Adds the subtree win vector of the position, whose table key is
+    key, to the total_player counters of acc starting at base, which
+    must be zero. Deeper positions use the counters above base."""
+    open_positions = state.open_positions()
+    new_player = (cur_player + 1) % total_player
+    child_base = base + total_player
+
+    for move_idx, count in _collated_moves(state, collate_fn, open_positions):
+        if state.play(move_idx, cur_player):
+            acc[base + cur_player] += count
+            state.undo(move_idx, cur_player)
+            continue
+        if not state.can_win(new_player):
+            state.undo(move_idx, cur_player)
+            continue
+
+        wins = None
+        child_key = None
+        if table is not None:
+            child_key = key_fn(state, new_player, total_player)
+            wins = table.get(child_key)
+            if wins is not None:
+                wins = _rotate_wins(wins, -new_player)
+        if wins is None:
+            _add_subtree_wins(state, new_player, total_player, collate_fn, table, key_fn,
+                              acc, child_base, child_key)
+            wins = acc[child_base:child_base + total_player]
+            acc[child_base:child_base + total_player] = [0] * total_player
+
+        for player, stat in enumerate(wins):
+            acc[base + player] += stat*count
+        state.undo(move_idx, cur_player)
+
+    if table is not None:
+        table.put(key, _rotate_wins(acc[base:base + total_player], cur_player),
+                  len(open_positions))
+
+
+def _iterative_subtree_wins(state, cur_player, total_player, collate_fn, table, key_fn):
+    """Returns the same win vector as _subtree_wins without recursing.
+
+    Each ply of the walk keeps a frame in parallel per-depth lists: the
+    collated moves as (location index, multiplicity) pairs, the next move
+    to try, the player to move and the table key. Win vectors are summed
+    into one preallocated list holding total_player counters per depth,
+    so no per-node dictionaries are built. Drawn positions are skipped
+    as in _subtree_wins."""
+    if not state.can_win(cur_player):
+        return [0] * total_player
+
+    if table is not None:
+        key = key_fn(state, cur_player, total_player)
+        wins = table.get(key)
+        if wins is not None:
+            return _rotate_wins(wins, -cur_player)
+    else:
+        key = None
+
+    open_positions = state.open_positions()
+    max_depth = len(open_positions) + 1
+
+    acc = [0] * (max_depth*total_player)
+    moves = [None] * max_depth
+    open_counts = [0] * max_depth
+    nexts = [0] * max_depth
+    players = [0] * max_depth
+    keys = [None] * max_depth
+
+    moves[0] = _collated_moves(state, collate_fn, open_positions)
+    open_counts[0] = len(open_positions)
+    players[0] = cur_player
+    keys[0] = key
+    depth = 0
+
+    while True:
+        level_moves = moves[depth]
+        next_move = nexts[depth]
+
+        if next_move == len(level_moves):
+            base = depth*total_player
+            wins = acc[base:base + total_player]
+            if table is not None:
+                table.put(keys[depth], _rotate_wins(wins, players[depth]), open_counts[depth])
+            if depth == 0:
+                return wins
+
+            acc[base:base + total_player] = [0] * total_player
+            depth -= 1
+            (move_idx, count) = moves[depth][nexts[depth] - 1]
+            state.undo(move_idx, players[depth])
+            base = depth*total_player
+            for player, stat in enumerate(wins):
+                acc[base + player] += stat*count
+            continue
+
+        nexts[depth] = next_move + 1
+        (move_idx, count) = level_moves[next_move]
+        player = players[depth]
+
+        if state.play(move_idx, player):
+            acc[depth*total_player + player] += count
+            state.undo(move_idx, player)
+            continue
+
+        new_player = (player + 1) % total_player
+        if not state.can_win(new_player):
+            state.undo(move_idx, player)
+            continue
+        if table is not None:
+            key = key_fn(state, new_player, total_player)
+            wins = table.get(key)
+            if wins is not None:
+                base = depth*total_player
+                for idx, stat in enumerate(_rotate_wins(wins, -new_player)):
+                    acc[base + idx] += stat*count
+                state.undo(move_idx, player)
+                continue
+
+        open_positions = state.open_positions()
+        depth += 1
+        moves[depth] = _collated_moves(state, collate_fn, open_positions)
+        open_counts[depth] = len(open_positions)
+        nexts[depth] = 0
+        players[depth] = new_player
+        keys[depth] = key
+
+
+ENGINES = ("recursive", "iterative")
+
+_SUBTREE_FNS = {"recursive": _subtree_wins, "iterative": _iterative_subtree_wins}
+
+
+def _move_orbits(board, cur_player, total_player, collate_fn, table=None,
+                 key_fn=_position_key, jobs=1, split_depth=2, win_len=None, stats=None,
+                 engine="recursive"):
+    """Returns a list of (positions, wins) tuples, one for each group of
+    open moves collated together, holding the statistics of the current
+    player winning assuming the rules of Tic Tac Toe.
+    """
+    if not isinstance(board, _BOARD_TYPES):
+        raise TypeError("board must be a Board or BitBoard object.")
+    next_player(cur_player, total_player)
+    if engine not in _SUBTREE_FNS:
+        raise ValueError('engine must be "recursive" or "iterative".')
+    subtree_fn = _SUBTREE_FNS[engine]
+
+    if stats is not None:
+        if jobs != 1:
+            raise ValueError("stats require jobs to be 1.")
+        return _recorded_orbits(board, cur_player, total_player, collate_fn, table,
+                                key_fn, win_len, stats, subtree_fn)
+
+    state = SearchState(board, total_player, win_len)
+    if jobs != 1:
+        return parallel_orbit_stats(state, cur_player, total_player, collate_fn, key_fn,
+                                    subtree_fn, table, jobs, split_depth)
+
+    return _state_orbits(state, cur_player, total_player, collate_fn, table, key_fn,
+                         subtree_fn)
+
+
+def _expand_orbits(orbits):
+    """Returns the move_win_stats dictionary for a list of (positions,
+    wins) tuples, giving each position its own list."""
     win_stats = {}
+    for positions, wins in orbits:
+        for pos in positions:
+            win_stats[pos] = wins.copy()
+    return win_stats
+
+
+def _recorded_orbits(board, cur_player, total_player, collate_fn, table, key_fn,
+                     win_len, stats, subtree_fn):
+    """Returns the orbits of _state_orbits, recording the search in
+    stats."""
+    start = time.perf_counter()
+    state = StatsSearchState(board, total_player, win_len, stats)
+    (hits, misses) = (0, 0) if table is None else (table.hits(), table.misses())
+
+    orbits = _state_orbits(state, cur_player, total_player,
+                           stats_collate_fn(collate_fn, stats), table, key_fn, subtree_fn)
+
+    if table is not None:
+        stats._cache_hits += table.hits() - hits
+        stats._cache_misses += table.misses() - misses
+    stats._elapsed += time.perf_counter() - start
+    return orbits
+
+
+def _state_orbits(state, cur_player, total_player, collate_fn, table, key_fn,
+                  subtree_fn=_subtree_wins):
+    """Returns a list of (positions, wins) tuples for the collated open
+    moves, playing and undoing moves on the search state in place.
+    subtree_fn searches the position after each move.
+    """
+    open_positions = state.open_positions()
+    if len(open_positions) == 0:
+        return []
+
+    side = state.side_len()
+    new_player = (cur_player + 1) % total_player
+
+    orbits = []
+    for positions in collate_fn(state, open_positions):
+        move_pos = positions[-1]
+        move_idx = move_pos[0]*side + move_pos[1]
+
+        if state.play(move_idx, cur_player):
+            wins = [0 for i in range(total_player)]
+            wins[cur_player] = 1
+        else:
+            wins = subtree_fn(state, new_player, total_player, collate_fn, table, key_fn)
+
+        state.undo(move_idx, cur_player)
+        orbits.append((positions, wins))
+
+    return orbits
+
+
+def iter_move_win_stats(board, cur_player, total_player, table=None, win_len=None,
+                        symmetric=True, progress_fn=None, progress_interval=100000):
+    """Yields the statistics of the current player winning for each open
+    move on the board as soon as the move's subtree has been searched.
+
+    This gives the same statistics as move_win_stats and
+    move_win_stats_fast without waiting for the whole tree or keeping
+    the results.
+
+    Args:
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        table (TranspositionTable): Cache for the win statistics of
+            positions reached by more than one sequence of moves.
+            Defaults to None, which disables caching.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        symmetric (bool): Search symmetric moves once, as
+            move_win_stats_fast does. Defaults to True.
+        progress_fn: Callable taking the number of nodes visited and the
+            number of root subtrees remaining. Called every
+            progress_interval nodes and after each root subtree. Defaults
+            to None, which disables progress reporting.
+        progress_interval (int): Number of nodes between progress_fn
+            calls. Defaults to 100000.
+
+    Yields:
+        A (positions, wins) tuple. positions is a sorted list of (row,col)
+        tuples for open positions that share the statistics, and wins is
+        the list of the number of times each player won after playing
+        any one of them.
 
-    open_positions = matching_positions(board, None)
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: win_len must be between 1 and side.
+        ValueError: interval must be greater than 0.
+    """
+    if not isinstance(board, _BOARD_TYPES):
+        raise TypeError("board must be a Board or BitBoard object.")
+
+    if symmetric:
+        (collate_fn, key_fn) = (_collate_symmetric_positions, _canonical_position_key)
+    else:
+        (collate_fn, key_fn) = (_collate_positions, _position_key)
+
+    if progress_fn is None:
+        state = SearchState(board, total_player, win_len)
+    else:
+        state = ProgressSearchState(board, total_player, win_len, progress_fn,
+                                    progress_interval)
+
+    open_positions = state.open_positions()
     if len(open_positions) == 0:
-        return win_stats
+        return
 
-    collated_positions = collate_fn(board, open_positions)
+    collated_positions = collate_fn(state, open_positions)
+    side = state.side_len()
+    new_player = next_player(cur_player, total_player)
 
-    for positions in collated_positions:
-        move_pos = positions.pop()
-        move_row = move_pos[0]
-        move_col = move_pos[1]
-        new_board = board.set(move_row, move_col, cur_player)
+    subtrees = len(collated_positions)
 
-        win_stats[move_pos] = [0 for i in range(total_player)]
+    for done, positions in enumerate(reversed(collated_positions)):
+        move_pos = positions[-1]
+        move_idx = move_pos[0]*side + move_pos[1]
+        if progress_fn is not None:
+            state.remaining = subtrees - done
 
-        if is_winning_move(new_board, move_row, move_col):
-            win_stats[move_pos][cur_player] = 1
+        if state.play(move_idx, cur_player):
+            wins = [0 for i in range(total_player)]
+            wins[cur_player] = 1
         else:
-            new_player = next_player(cur_player, total_player)
-            move_stats = _move_win_stats(new_board, new_player, total_player, collate_fn)
-            for stats in move_stats.values():
-                for idx, stat in enumerate(stats):
-                    win_stats[move_pos][idx] += stat
+            wins = _subtree_wins(state, new_player, total_player, collate_fn,
+                                 table, key_fn)
+
+        state.undo(move_idx, cur_player)
+
+        if progress_fn is not None:
+            progress_fn(state.nodes(), subtrees - done - 1)
+
+        yield (sorted(positions), wins)
+
+
+def solve(board, cur_player, total_player, max_depth=None, win_len=None, eval_fn=None):
+    """Returns the game-theoretic value of each open move on the board
+    for the current player assuming the rules of Tic Tac Toe.
+
+    Unlike move_win_stats, which counts every finished game, this
+    searches for the outcome under best play using negamax with
+    alpha-beta pruning. With more than two players the other players are
+    assumed to play together against the current player. Moves are tried
+    center and corners first, and symmetric moves are searched once.
+
+    Args:
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        max_depth (int): Number of plies below each open move to search
+            before estimating the value with eval_fn. Defaults to None,
+            which searches to the end of the game.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        eval_fn: Callable taking a Board and a player number and
+            returning the estimated value of the board for that player,
+            strictly between -1 and 1. Defaults to None, which compares
+            the lines still open to each side.
 
+    Returns:
+        A dictionary keyed by (row,col) tuples for open positions. The
+        values are 1 if the current player can force a win by playing
+        there, -1 if the other players can force a win and 0 for a draw.
+        Values strictly between -1 and 1 are estimates from eval_fn.
+        An empty dictionary is returned if there are no open moves.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be at most side*side.
+        ValueError: max_depth must be 0 or greater.
+        ValueError: win_len must be between 1 and side.
+    """
+    (state, evaluate) = _solver_state(board, cur_player, total_player, max_depth,
+                                      win_len, eval_fn)
+
+    values = {}
+    for (positions, score) in _root_scores(state, cur_player, total_player, max_depth,
+                                           evaluate, False):
         for pos in positions:
-            win_stats[pos] = win_stats[move_pos].copy()
+            values[pos] = _public_value(score)
 
-    return win_stats
+    return values
+
+
+def best_move(board, cur_player, total_player, max_depth=None, win_len=None, eval_fn=None):
+    """Returns the best open move on the board for the current player
+    assuming the rules of Tic Tac Toe.
+
+    This uses the same search as solve but only proves the value of the
+    chosen move, which prunes far more of the tree. Among moves of equal
+    value the quickest win is preferred, then center and corners.
+
+    Args:
+        board (Board or BitBoard): Current game board. Open positions must
+            have the value of None.
+        cur_player (int): Current player number.
+        total_player (int): Total number of players.
+        max_depth (int): Number of plies below each open move to search
+            before estimating the value with eval_fn. Defaults to None,
+            which searches to the end of the game.
+        win_len (int): Number of locations in a row needed to win.
+            Defaults to None, which uses the side length.
+        eval_fn: Callable taking a Board and a player number and
+            returning the estimated value of the board for that player,
+            strictly between -1 and 1. Defaults to None, which compares
+            the lines still open to each side.
+
+    Returns:
+        A ((row,col), value) tuple where value is defined as for solve,
+        or None if there are no open moves.
+
+    Raises:
+        TypeError: board must be a Board or BitBoard object.
+        ValueError: cur_player must be between 0 and total_player-1.
+        ValueError: total_player must be at most side*side.
+        ValueError: max_depth must be 0 or greater.
+        ValueError: win_len must be between 1 and side.
+    """
+    (state, evaluate) = _solver_state(board, cur_player, total_player, max_depth,
+                                      win_len, eval_fn)
+
+    best = None
+    for (positions, score) in _root_scores(state, cur_player, total_player, max_depth,
+                                           evaluate, True):
+        if best is None or score > best[1]:
+            best = (positions[-1], score)
+
+    if best is None:
+        return None
+    return (best[0], _public_value(best[1]))
+
+
+# Proven wins score above 1 so that they outrank every heuristic estimate.
+# The number of open positions left is added so that quicker wins score
+# higher.
+_WIN_SCORE = 2
+
+
+def _public_value(score):
+    """Returns a solver score clamped to the documented -1 to 1 range."""
+    if score >= _WIN_SCORE:
+        return 1
+    if score <= -_WIN_SCORE:
+        return -1
+    return score
+
+
+def _solver_state(board, cur_player, total_player, max_depth, win_len, eval_fn):
+    """Returns a (state, evaluate) tuple for the alpha-beta solvers after
+    validating the arguments."""
+    if not isinstance(board, _BOARD_TYPES):
+        raise TypeError("board must be a Board or BitBoard object.")
+    next_player(cur_player, total_player)
+    if max_depth is not None and max_depth < 0:
+        raise ValueError("max_depth must be 0 or greater.")
+
+    state = SearchState(board, total_player, win_len)
+
+    if eval_fn is None:
+        evaluate = _line_eval
+    else:
+        evaluate = lambda state, player: eval_fn(state.to_board(), player)
+
+    return (state, evaluate)
+
+
+def _line_eval(state, player):
+    """Returns the difference between the lines still open only to the
+    player and those open only to a single other player, scaled to lie
+    strictly between -1 and 1."""
+    (held, opposed) = state.line_balance(player)
+    return (held - opposed) / (held + opposed + 1)
+
+
+def _ordered_moves(state, open_positions):
+    """Returns one position from each symmetric group of open positions
+    along with the group, ordered so that locations on the most lines,
+    the center and then the corners on a 3x3 board, come first."""
+    side = state.side_len()
+    line_ids = cell_lines(side, state.win_len())
+
+    groups = _collate_symmetric_positions(state, open_positions)
+    groups.sort(key=lambda group: (-len(line_ids[group[-1][0]*side + group[-1][1]]),
+                                   group[-1]))
+    return groups
+
+
+def _root_scores(state, cur_player, total_player, max_depth, evaluate, prune_root):
+    """Yields a (positions, score) tuple for each symmetric group of open
+    moves. With prune_root, moves that cannot beat the best move so far
+    are only bounded, otherwise every score is exact."""
+    open_positions = state.open_positions()
+    if len(open_positions) == 0:
+        return
+
+    side = state.side_len()
+    open_count = len(open_positions) - 1
+    alpha = float("-inf")
+
+    for positions in _ordered_moves(state, open_positions):
+        move_pos = positions[-1]
+        move_idx = move_pos[0]*side + move_pos[1]
+        window = alpha if prune_root else float("-inf")
+
+        score = _move_score(state, move_idx, cur_player, cur_player, total_player,
+                            open_count, window, float("inf"), max_depth, evaluate)
+        alpha = max(alpha, score)
+
+        yield (positions, score)
+
+
+def _move_score(state, move_idx, player, root_player, total_player, open_count,
+                alpha, beta, depth, evaluate):
+    """Returns the negamax score of the player's move for the player's
+    side, where the root player plays against all other players."""
+    if state.play(move_idx, player):
+        score = _WIN_SCORE + open_count
+    else:
+        new_player = (player + 1) % total_player
+        if (new_player == root_player) != (player == root_player):
+            score = -_negamax(state, new_player, root_player, total_player, open_count,
+                              -beta, -alpha, depth, evaluate)
+        else:
+            score = _negamax(state, new_player, root_player, total_player, open_count,
+                             alpha, beta, depth, evaluate)
+
+    state.undo(move_idx, player)
+    return score
+
+
+def _negamax(state, player, root_player, total_player, open_count, alpha, beta,
+             depth, evaluate):
+    """Returns the alpha-beta score of the position for the side of the
+    player to move."""
+    if open_count == 0:
+        return 0
+    if depth is not None:
+        if depth == 0:
+            value = evaluate(state, root_player)
+            return value if player == root_player else -value
+        depth -= 1
+
+    side = state.side_len()
+    best = float("-inf")
+
+    for positions in _ordered_moves(state, state.open_positions()):
+        move_pos = positions[-1]
+        score = _move_score(state, move_pos[0]*side + move_pos[1], player, root_player,
+                            total_player, open_count - 1, alpha, beta, depth, evaluate)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+    return best
@@ -0,0 +1,153 @@
+"""Module docstring"""
+
+import heapq
+from collections import OrderedDict
+
+
+class TranspositionTable(object):
+    """Class used to cache search results for positions that are reached
+    by more than one sequence of moves.
+
+    The table holds at most max_entries results. When full, the lru
+    policy evicts the least recently used entry, while the depth policy
+    keeps the entries with the largest depth, which is the number of open
+    locations below the cached position and so the cost to recompute it.
+
+    Attributes:
+        None
+    """
+
+    POLICIES = ("lru", "depth")
+
+    def __init__(self, max_entries=None, policy="lru"):
+        """Initializes an empty transposition table.
+
+        Args:
+            max_entries (int): Maximum number of cached results. Defaults
+                to None, which does not limit the table size.
+            policy (str): Eviction policy, either "lru" or "depth".
+                Defaults to "lru".
+
+        Raises:
+            ValueError: max_entries must be greater than 0.
+            ValueError: policy must be "lru" or "depth".
+        """
+        if max_entries is not None and max_entries <= 0:
+            raise ValueError("max_entries must be greater than 0.")
+        if policy not in self.POLICIES:
+            raise ValueError('policy must be "lru" or "depth".')
+
+        self._max_entries = max_entries
+        self._policy = policy
+        self._entries = OrderedDict()
+        self._heap = []
+        self._seq = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self):
+        """Returns number of cached results."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Returns True if a result is cached for the key. Does not
+        update the hit and miss counters."""
+        return key in self._entries
+
+    def max_entries(self):
+        """Returns maximum number of cached results or None if the
+        table is unbounded."""
+        return self._max_entries
+
+    def policy(self):
+        """Returns eviction policy name."""
+        return self._policy
+
+    def hits(self):
+        """Returns number of lookups that found a cached result."""
+        return self._hits
+
+    def misses(self):
+        """Returns number of lookups that did not find a cached result."""
+        return self._misses
+
+    def evictions(self):
+        """Returns number of results removed to make room for new ones."""
+        return self._evictions
+
+    def get(self, key):
+        """Returns the cached result for the key or None if there is no
+        cached result.
+
+        Args:
+            key: Hashable position key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        if self._policy == "lru":
+            self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, value, depth=0):
+        """Caches a result for the key, evicting another result if the
+        table is full.
+
+        With the depth policy a result is not cached when the table is
+        full and every cached result has a greater depth.
+
+        Args:
+            key: Hashable position key.
+            value: Result to cache.
+            depth (int): Cost to recompute the result. Defaults to 0.
+        """
+        if key in self._entries:
+            self._entries.pop(key)
+        elif self._max_entries is not None and len(self._entries) >= self._max_entries:
+            if not self._evict(depth):
+                return
+
+        self._seq += 1
+        self._entries[key] = (value, depth, self._seq)
+        if self._policy == "depth":
+            heapq.heappush(self._heap, (depth, self._seq, key))
+
+    def clear(self):
+        """Removes all cached results and resets the counters."""
+        self._entries.clear()
+        self._heap = []
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _evict(self, depth):
+        """Removes one result according to the eviction policy. Returns
+        True if a result was removed.
+
+        Args:
+            depth (int): Depth of the result that needs room.
+        """
+        if self._policy == "lru":
+            self._entries.popitem(last=False)
+            self._evictions += 1
+            return True
+
+        heap = self._heap
+        while heap:
+            (min_depth, seq, key) = heap[0]
+            entry = self._entries.get(key)
+            if entry is None or entry[2] != seq:
+                heapq.heappop(heap)
+                continue
+            if min_depth > depth:
+                return False
+            heapq.heappop(heap)
+            del self._entries[key]
+            self._evictions += 1
+            return True
+
+        return False
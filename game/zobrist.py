@@ -0,0 +1,106 @@
+"""Module docstring"""
+
+import random
+
+
+SEED = 0x7A6F62726973
+KEY_BITS = 64
+KEY_MASK = (1 << KEY_BITS) - 1
+
+_CELL_KEYS = {}
+_BLOCKED_KEYS = {}
+_SIDE_KEYS = {}
+_WIN_LEN_KEYS = {}
+
+
+def _random_key(label):
+    """Returns the random key drawn for the label from the seeded
+    generator."""
+    return random.Random("{}:{}".format(SEED, label)).getrandbits(KEY_BITS)
+
+
+def cell_key(side, idx, val):
+    """Returns the Zobrist key of a value at a location index on boards
+    of the given side length.
+
+    Keys are drawn from a generator seeded with SEED, the side length,
+    the location index and the hash of the value, so equal values share
+    a key. Open locations holding None have the key 0. Keys of player
+    numbers are the same in every process. Keys of values whose hash
+    changes between processes, such as strings, do too only when
+    PYTHONHASHSEED is fixed.
+
+    Args:
+        side (int): Length of board on one side.
+        idx (int): Location index in row first order.
+        val: Location value.
+
+    Raises:
+        TypeError: board values must be hashable.
+    """
+    if val is None:
+        return 0
+
+    try:
+        return _CELL_KEYS[(side, idx, val)]
+    except KeyError:
+        key = _random_key("cell:{}:{}:{}".format(side, idx, hash(val)))
+        _CELL_KEYS[(side, idx, val)] = key
+        return key
+    except TypeError:
+        raise TypeError("board values must be hashable.")
+
+
+def blocked_key(side, idx):
+    """Returns the Zobrist key of a blocked location index, which search
+    states use for every value other than None or a player number.
+
+    Args:
+        side (int): Length of board on one side.
+        idx (int): Location index in row first order.
+    """
+    if (side, idx) not in _BLOCKED_KEYS:
+        _BLOCKED_KEYS[(side, idx)] = _random_key("blocked:{}:{}".format(side, idx))
+    return _BLOCKED_KEYS[(side, idx)]
+
+
+def side_key(side):
+    """Returns the Zobrist key folded into the key of every board with
+    the given side length, so that open boards of different sizes hash
+    apart.
+
+    Args:
+        side (int): Length of board on one side.
+    """
+    if side not in _SIDE_KEYS:
+        _SIDE_KEYS[side] = _random_key("side:{}".format(side))
+    return _SIDE_KEYS[side]
+
+
+def win_len_key(side, win_len):
+    """Returns the Zobrist key folded into the key of every search state
+    with the given side length and win length.
+
+    Args:
+        side (int): Length of board on one side.
+        win_len (int): Number of locations in a row needed to win.
+    """
+    if (side, win_len) not in _WIN_LEN_KEYS:
+        _WIN_LEN_KEYS[(side, win_len)] = _random_key("win_len:{}:{}".format(side, win_len))
+    return _WIN_LEN_KEYS[(side, win_len)]
+
+
+def board_key(side, vals):
+    """Returns the Zobrist key of a board from its values.
+
+    Args:
+        side (int): Length of board on one side.
+        vals: Sequence of location values in row first order.
+
+    Raises:
+        TypeError: board values must be hashable.
+    """
+    key = side_key(side)
+    for idx, val in enumerate(vals):
+        key ^= cell_key(side, idx, val)
+    return key
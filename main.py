@@ -1,29 +1,165 @@
 """Module docstring"""
 
+import argparse
+import csv
+import json
+import sys
+
 from game.board import Board
-from game.tictactoe import move_win_stats, move_win_stats_fast
+from game.database import OutcomeDatabase
+from game.stats import SearchStats
+from game.stream import (CSV_OUTPUT_FIELDS, FORMATS, evaluate, read_csv, read_jsonl, write_csv,
+                         write_jsonl)
+from game.results import MoveWinStats
+from game.tictactoe import iter_move_win_stats, move_win_orbits
+
+
+def _parse_args(argv=None):
+    """Returns parsed command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Displays win statistics for each position within an empty 3x3 board.")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="number of worker processes, 0 for one per CPU (default: 1)")
+    parser.add_argument("--split-depth", type=int, default=None,
+                        help="plies below each move at which work is split, with --jobs "
+                             "other than 1 (default: 2)")
+    parser.add_argument("--database", default=None,
+                        help="outcome database built by game.database to read instead of searching")
+    parser.add_argument("--progress", action="store_true",
+                        help="report nodes visited and subtrees remaining on stderr")
+    parser.add_argument("--search-stats", action="store_true",
+                        help="print node counts, timings and cache statistics on stderr")
+    parser.add_argument("--search-stats-json", default=None, metavar="PATH",
+                        help="write node counts, timings and cache statistics as JSON")
+    parser.add_argument("--batch", default=None, metavar="INPUT",
+                        help="analyze the positions in a JSON lines or CSV file, - for stdin")
+    parser.add_argument("--input-format", choices=FORMATS, default=None,
+                        help="batch input format (default: from the file extension, else jsonl)")
+    parser.add_argument("--output", default="-", metavar="PATH",
+                        help="batch output file, - for stdout (default: -)")
+    parser.add_argument("--output-format", choices=FORMATS, default="jsonl",
+                        help="batch output format (default: jsonl)")
+    parser.add_argument("--unordered", action="store_true",
+                        help="write batch results as they finish instead of in input order")
+    args = parser.parse_args(argv)
+
+    if args.search_stats or args.search_stats_json is not None:
+        if args.jobs != 1 or args.database is not None:
+            parser.error("search statistics require --jobs 1 and no --database")
+        if args.batch is not None:
+            parser.error("search statistics are not available with --batch")
+    if args.batch is not None and args.database is not None:
+        parser.error("--batch can not be used with --database")
+    if args.progress:
+        if args.jobs != 1 or args.database is not None:
+            parser.error("--progress requires --jobs 1 and no --database")
+        if args.batch is not None or args.search_stats or args.search_stats_json is not None:
+            parser.error("--progress can not be used with --batch or search statistics")
+    if args.split_depth is not None:
+        if args.jobs == 1 or args.database is not None or args.batch is not None:
+            parser.error("--split-depth requires --jobs other than 1 and no --database "
+                         "or --batch")
+    else:
+        args.split_depth = 2
+    if args.input_format is None:
+        args.input_format = "csv" if (args.batch or "").lower().endswith(".csv") else "jsonl"
+    return args
+
+
+def _print_stats(pos, stats, win_percents=None):
+    """Prints the win statistics and win ratios of a position."""
+    if win_percents is None:
+        wins_sum = sum(stats)
+        win_percents = list(map(lambda wins: wins / wins_sum, stats))
+
+    print("({},{}) -> {} -> {}".format(
+        pos[0], pos[1], stats, win_percents), flush=True)
+
+
+def _print_win_stats(win_stats):
+    """Prints the win statistics and win ratios of every position of a
+    MoveWinStats object in board order."""
+    for pos, stats in win_stats.items():
+        _print_stats(pos, stats, win_stats.ratios(pos))
 
 
-def _board_pos_idx(board): 
-    """Returns a sort function for board locations."""
-    if not isinstance(board, Board):
-        raise TypeError("board must be a Board object.")
+def _print_progress(nodes, remaining):
+    """Prints search progress to stderr."""
+    print("{} nodes visited, {} subtrees remaining".format(nodes, remaining),
+          file=sys.stderr, flush=True)
 
-    return lambda pos: pos[0]*board.side_len() + pos[1]
 
+def _open_text(path, mode):
+    """Returns the file at path opened in text mode, or stdin or stdout
+    for "-"."""
+    if path == "-":
+        return open((sys.stdin if mode == "r" else sys.stdout).fileno(), mode,
+                    newline="", closefd=False)
+    return open(path, mode, newline="")
+
+
+def _run_batch(args):
+    """Writes the win statistics of every position in the batch input as
+    each is solved."""
+    read_fn = read_csv if args.input_format == "csv" else read_jsonl
+    with _open_text(args.batch, "r") as src, _open_text(args.output, "w") as out:
+        if args.output_format == "csv":
+            writer = csv.writer(out)
+            writer.writerow(CSV_OUTPUT_FIELDS)
+            write_fn = lambda *result: write_csv(writer, *result)
+        else:
+            write_fn = lambda *result: write_jsonl(out, *result)
+
+        for result in evaluate(read_fn(src), args.jobs, ordered=not args.unordered):
+            write_fn(*result)
+            out.flush()
+
+
+def main(argv=None):
+    """Displays win statistics for each position within an empty 3x3 board.
+
+    Statistics are printed as each move's subtree is solved unless they
+    come from a database or a process pool, in which case they are
+    printed in board order once all are known.
+
+    With --batch, positions are instead read from a JSON lines or CSV
+    file and their statistics written as each is solved.
+    """
+    args = _parse_args(argv)
+    if args.batch is not None:
+        _run_batch(args)
+        return
 
-def main():
-    """Displays win statistics for each position within an empty 3x3 board."""
     board = Board(3, None)
 
-    win_stats = move_win_stats_fast(board, 0, 2)
+    if args.search_stats or args.search_stats_json is not None:
+        stats = SearchStats()
+        _print_win_stats(move_win_orbits(board, 0, 2, stats=stats))
+
+        if args.search_stats:
+            print(stats.summary(), file=sys.stderr)
+        if args.search_stats_json is not None:
+            with open(args.search_stats_json, "w") as out:
+                json.dump(stats.to_dict(), out, indent=2)
+                out.write("\n")
+        return
+
+    if args.database is None and args.jobs == 1:
+        progress_fn = _print_progress if args.progress else None
+        for positions, stats in iter_move_win_stats(board, 0, 2, progress_fn=progress_fn):
+            for pos in positions:
+                _print_stats(pos, stats)
+        return
 
-    for pos in sorted(win_stats.keys(), key=_board_pos_idx(board)):
-        wins_sum = sum(win_stats[pos])
-        win_percents = list(map(lambda wins: wins / wins_sum, win_stats[pos]))
+    if args.database is not None:
+        with OutcomeDatabase(args.database) as database:
+            win_stats = database.move_win_stats(board, 0, 2)
+        win_stats = MoveWinStats(board.side_len(), 2,
+                                 [([pos], wins) for pos, wins in win_stats.items()])
+    else:
+        win_stats = move_win_orbits(board, 0, 2, jobs=args.jobs, split_depth=args.split_depth)
 
-        print("({},{}) -> {} -> {}".format(
-            pos[0], pos[1], win_stats[pos], win_percents)) 
+    _print_win_stats(win_stats)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,46 @@
+"""Module docstring"""
+
+import argparse
+import asyncio
+
+from game.service import QueryService, start_server
+
+
+def _parse_args(argv=None):
+    """Returns parsed command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Answers move_win_stats_fast queries as JSON lines over local TCP.")
+    parser.add_argument("--host", default="127.0.0.1",
+                        help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765,
+                        help="port to listen on (default: 8765)")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="number of worker processes, 0 for one per CPU (default: 0)")
+    parser.add_argument("--cache-size", type=int, default=10000,
+                        help="results kept in the shared cache (default: 10000)")
+    parser.add_argument("--table-size", type=int, default=100000,
+                        help="transposition table entries per worker (default: 100000)")
+    return parser.parse_args(argv)
+
+
+async def _serve(args):
+    """Runs the server until it is cancelled."""
+    service = QueryService(args.jobs, args.cache_size, args.table_size)
+    try:
+        server = await start_server(service, args.host, args.port)
+        async with server:
+            print("listening on {}:{}".format(*server.sockets[0].getsockname()[:2]), flush=True)
+            await server.serve_forever()
+    finally:
+        service.close()
+
+
+def main(argv=None):
+    """Serves win statistics queries until interrupted."""
+    try:
+        asyncio.run(_serve(_parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Module docstring"""
+import json
+import pytest
+from benchmarks.bench import FORMAT_VERSION, _main, compare, run_benchmarks
+
+
+def _report(**wall_times):
+    """Returns a report holding the given wall times."""
+    return {"version": FORMAT_VERSION,
+            "results": dict((name, {"wall_time": wall_time})
+                            for name, wall_time in wall_times.items())}
+
+def test_compare():
+    """Test compare() flags benchmarks slower than the threshold."""
+    baseline = _report(a=1.0, b=1.0, c=1.0)
+    report = _report(a=1.1, b=1.3, d=5.0)
+    assert compare(report, baseline) == [("b", 1.0, 1.3)]
+    assert compare(report, baseline, 0.05) == [("a", 1.0, 1.1), ("b", 1.0, 1.3)]
+    assert compare(report, report, 0) == []
+
+def test_compare_raises_ValueError():
+    """Test compare() validates arguments."""
+    with pytest.raises(ValueError):
+        compare(_report(), _report(), -0.1)
+    with pytest.raises(ValueError):
+        compare(_report(), {"version": FORMAT_VERSION + 1, "results": {}})
+
+def test_run_benchmarks():
+    """Test run_benchmarks() reports selected benchmarks."""
+    with pytest.raises(ValueError):
+        run_benchmarks(repeat=0)
+
+    report = run_benchmarks("k3", repeat=1)
+    assert report["version"] == FORMAT_VERSION
+    assert sorted(report["results"]) == ["move_win_stats/4x4-2p-k3-filled10",
+                                         "move_win_stats_fast-iterative/4x4-2p-k3-filled10",
+                                         "move_win_stats_fast/4x4-2p-k3-filled10"]
+    for result in report["results"].values():
+        assert result["nodes"] > 0
+        assert result["wall_time"] > 0
+        assert result["peak_memory"] > 0
+        assert result["nodes_per_sec"] == result["nodes"] / result["wall_time"]
+
+    report = run_benchmarks("Board.set/3x3", repeat=1)
+    assert report["results"]["Board.set/3x3"]["ops"] > 0
+
+def test_main(tmp_path, capsys):
+    """Test the command line writes a report and checks it against a baseline."""
+    output = str(tmp_path / "report.json")
+    assert _main(["--filter", "k3", "--repeat", "1", "--output", output]) == 0
+    with open(output) as report_file:
+        report = json.load(report_file)
+    assert len(report["results"]) == 3
+
+    for result in report["results"].values():
+        result["wall_time"] /= 1000
+    baseline = str(tmp_path / "baseline.json")
+    with open(baseline, "w") as baseline_file:
+        json.dump(report, baseline_file)
+
+    assert _main(["--filter", "k3", "--repeat", "1", "--baseline", baseline]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
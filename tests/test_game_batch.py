@@ -0,0 +1,82 @@
+"""Module docstring"""
+import random
+import pytest
+from game.board import Board
+from game.tictactoe import is_winning_move, matching_positions
+
+np = pytest.importorskip("numpy")
+
+from game.batch import OPEN, batch_winners, boards_to_array
+
+
+def _reference_winner(board, total_player, win_len=None):
+    """Returns the smallest player with a winning line using is_winning_move()."""
+    for player in range(total_player):
+        for (row, col) in matching_positions(board, player):
+            if is_winning_move(board, row, col, win_len):
+                return player
+    return OPEN
+
+def _random_boards(count, side, total_player, seed):
+    """Returns a list of randomly filled boards."""
+    rand = random.Random(seed)
+    choices = [None] + list(range(total_player))
+    return [Board(side, [rand.choice(choices) for i in range(side*side)])
+            for j in range(count)]
+
+def test_boards_to_array():
+    """Test boards_to_array()."""
+    boards = [Board(2, [0, None, 1, 0]), Board(2, [None, None, None, 1])]
+    array = boards_to_array(boards)
+    assert array.shape == (2, 2, 2)
+    assert array.tolist() == [[[0, OPEN], [1, 0]], [[OPEN, OPEN], [OPEN, 1]]]
+
+def test_boards_to_array_raises():
+    """Test boards_to_array() validates arguments."""
+    with pytest.raises(TypeError):
+        boards_to_array([None])
+    with pytest.raises(ValueError):
+        boards_to_array([Board(2), Board(3)])
+    with pytest.raises(ValueError):
+        boards_to_array([Board(2, "X")])
+
+def test_batch_winners_raises_ValueError():
+    """Test batch_winners() validates arguments."""
+    with pytest.raises(ValueError):
+        batch_winners(np.zeros((2, 3, 4), dtype=np.int64))
+    with pytest.raises(ValueError):
+        batch_winners(np.zeros((2, 3, 3), dtype=np.int64), 4)
+
+def test_batch_winners_raises_TypeError():
+    """Test batch_winners() rejects non-integer arrays."""
+    with pytest.raises(TypeError):
+        batch_winners(np.zeros((2, 3, 3), dtype=np.float64))
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int32, np.int64])
+
+def test_batch_winners_dtype(dtype):
+    """Test batch_winners() gives the same winners for every integer dtype."""
+    boards = np.array([[[0, 0, 0], [1, 1, -1], [-1, -1, -1]],
+                       [[0, 1, 0], [1, 1, 0], [-1, 1, -1]],
+                       [[0, 1, 0], [-1, -1, -1], [-1, -1, 1]]], dtype=dtype)
+    assert batch_winners(boards).tolist() == [0, 1, OPEN]
+
+def test_batch_winners_empty():
+    """Test batch_winners() on an empty batch."""
+    assert batch_winners([]).shape == (0,)
+
+@pytest.mark.parametrize("side, total_player, win_len", [
+    (3, 2, None),
+    (3, 3, None),
+    (4, 2, None),
+    (4, 2, 3),
+    (6, 2, 4)
+])
+
+def test_batch_winners(side, total_player, win_len):
+    """Test batch_winners() against is_winning_move() on random boards."""
+    boards = _random_boards(200, side, total_player, side*10 + total_player)
+    expected = [_reference_winner(board, total_player, win_len) for board in boards]
+
+    assert batch_winners(boards, win_len).tolist() == expected
+    assert batch_winners(boards_to_array(boards), win_len).tolist() == expected
@@ -0,0 +1,119 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard, line_masks
+from game.tictactoe import is_winning_move, matching_positions, move_win_stats, move_win_stats_fast
+
+
+def test_bitboard_raises_ValueError():
+    """Test BitBoard constructor validates arguments."""
+    with pytest.raises(ValueError):
+        BitBoard(0, 2)
+    with pytest.raises(ValueError):
+        BitBoard(3, 0)
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [0])
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [1, 1])
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [3, 6])
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [1 << 20, 0])
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [1 << 9, 0])
+    with pytest.raises(ValueError):
+        BitBoard(3, 2, [-1, 0])
+    assert BitBoard(3, 2, [1 << 8, 1]).get(2, 2) == 0
+
+def test_from_board_raises():
+    """Test BitBoard.from_board() validates arguments."""
+    with pytest.raises(TypeError):
+        BitBoard.from_board(None, 2)
+    with pytest.raises(ValueError):
+        BitBoard.from_board(Board(3, "X"), 2)
+    with pytest.raises(ValueError):
+        BitBoard.from_board(Board(3, 2), 2)
+
+@pytest.mark.parametrize("side, count", [
+    (1, 4),
+    (3, 8),
+    (4, 10)
+])
+
+def test_line_masks(side, count):
+    """Test line_masks() covers rows, columns and both diagonals."""
+    masks = line_masks(side)
+    assert len(masks) == count
+    for mask in masks:
+        assert bin(mask).count("1") == side
+
+def test_round_trip():
+    """Test BitBoard.from_board() and BitBoard.to_board()."""
+    vals = [0, None, 1, None, 1, 0, 1, None, None]
+    bb = BitBoard.from_board(Board(3, vals), 2)
+    for row in range(3):
+        for col in range(3):
+            assert bb.get(row, col) == vals[row*3 + col]
+    assert str(bb.to_board()) == str(Board(3, vals))
+
+def test_get_set_raises_ValueError():
+    """Test BitBoard.get() and BitBoard.set() validate arguments."""
+    bb = BitBoard(3, 2)
+    with pytest.raises(ValueError):
+        bb.get(3, 0)
+    with pytest.raises(ValueError):
+        bb.get(0, -1)
+    with pytest.raises(ValueError):
+        bb.set(-1, 0, 0)
+    with pytest.raises(ValueError):
+        bb.set(0, 0, 2)
+
+def test_set_immutable():
+    """Test BitBoard.set() preserves immutable board."""
+    bb1 = BitBoard(3, 2)
+    bb2 = bb1.set(1, 1, 0).set(0, 0, 1).set(1, 1, 1).set(0, 0, None)
+    assert bb1.matching_positions(None) == matching_positions(Board(3), None)
+    assert bb2.get(1, 1) == 1
+    assert bb2.get(0, 0) is None
+    assert bb2.masks() == (0, 1 << 4)
+
+@pytest.mark.parametrize("vals, row, col, result", [
+    ([0, 0, 0, 1, 1, 1, 0, 0, 0], 1, 0, True),
+    ([0, 1, 0, 1, 1, 1, 0, 1, 0], 0, 0, False),
+    ([0, 1, 0, 0, 0, 0, 0, 1, 0], 0, 0, True),
+    ([0, 1, 0, 0, 0, 0, 0, 1, 0], 0, 1, False),
+    ([0, 0, 1, 1, 0, 1, 1, 0, 0], 2, 2, True),
+    ([1, 0, 0, 1, 0, 1, 0, 0, 1], 1, 1, True),
+    ([None, None, None, 0, 1, 0, 1, 0, 1], 0, 0, True),
+    ([None, 0, None, 0, 1, 0, 1, 0, 1], 0, 0, False)
+])
+
+def test_is_winning_move(vals, row, col, result):
+    """Test is_winning_move() gives the same result for Board and BitBoard."""
+    board = Board(3, vals)
+    bb = BitBoard.from_board(board, 2)
+    assert is_winning_move(board, row, col) == result
+    assert is_winning_move(bb, row, col) == result
+
+@pytest.mark.parametrize("val", [None, 0, 1, 2, "X"])
+
+def test_matching_positions(val):
+    """Test matching_positions() gives the same result for Board and BitBoard."""
+    board = Board(3, [0, None, 1, None, 1, 0, 1, None, None])
+    bb = BitBoard.from_board(board, 2)
+    assert matching_positions(bb, val) == matching_positions(board, val)
+
+@pytest.mark.parametrize("vals, cur_player, total_player", [
+    ([0, None, None, None, 1, None, None, None, None], 0, 2),
+    ([0, None, 1, None, None, None, None, None, 2], 1, 3),
+    ([None, 1, None, 0, None, 0, 1, None, 1, None, 0, 1, None, 0, None, 1], 0, 2)
+])
+
+def test_move_win_stats_fast(vals, cur_player, total_player):
+    """Test move_win_stats_fast() matches move_win_stats() on Board and BitBoard."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    expected = move_win_stats(board, cur_player, total_player)
+    assert move_win_stats_fast(board, cur_player, total_player) == expected
+    bb = BitBoard.from_board(board, total_player)
+    assert move_win_stats_fast(bb, cur_player, total_player) == expected
+    assert move_win_stats(bb, cur_player, total_player) == expected
@@ -1,6 +1,6 @@
 """Module docstring"""
 import pytest
-from game.board import Board
+from game.board import Board, intern_board
 
 def test_game_board_raises_ValueError():
     """Test Board constructor validates arguments."""
@@ -176,3 +176,74 @@ def test_get_rdiag(board, rdiag):
     """Test Board.get_rdiag()."""
     b = board
     assert b.get_rdiag() == rdiag
+
+def test_board_init_copies_list():
+    """Test Board keeps its values when the initialization list changes."""
+    vals = [0, 1, 2, 3]
+    b = Board(2, vals)
+    vals[0] = 9
+    assert b.get(0, 0) == 0
+
+def test_board_slots():
+    """Test Board does not carry a per-instance dictionary."""
+    b = Board(3)
+    assert not hasattr(b, "__dict__")
+    with pytest.raises(AttributeError):
+        b.extra = 1
+
+def test_board_eq():
+    """Test Board value equality."""
+    assert Board(3) == Board(3, None)
+    assert Board(3, 0).set(1, 1, 4) == Board(3, [0, 0, 0, 0, 4, 0, 0, 0, 0])
+    assert Board(3, 0) != Board(3, 1)
+    assert Board(2, 0) != Board(3, 0)
+    assert Board(3) != None
+    assert Board(3) != [None] * 9
+
+def test_board_hash():
+    """Test equal boards hash equally and can be used as dictionary keys."""
+    b = Board(3, 0).set(2, 1, "X")
+    assert hash(b) == hash(Board(3, [0, 0, 0, 0, 0, 0, 0, "X", 0]))
+    assert hash(b) == hash(b)
+    cache = {b: 1}
+    assert cache[Board(3, [0, 0, 0, 0, 0, 0, 0, "X", 0])] == 1
+    with pytest.raises(TypeError):
+        hash(Board(2, []))
+
+def test_intern_board():
+    """Test intern_board() shares one instance between equal boards."""
+    b1 = intern_board(Board(3, 0).set(0, 0, 1))
+    b2 = intern_board(Board(3, [1, 0, 0, 0, 0, 0, 0, 0, 0]))
+    assert b1 is b2
+    assert intern_board(Board(3, 1)) is not b1
+    assert intern_board(b1) is b1
+    with pytest.raises(TypeError):
+        intern_board(None)
+    with pytest.raises(TypeError):
+        intern_board(Board(2, [[], [], [], []]))
+
+def test_zobrist_key():
+    """Test Board.set() updates the Zobrist key incrementally."""
+    b = Board(3)
+    b.zobrist_key()
+    for idx, val in enumerate([0, 1, "X", None, 0, 1, 1, 0, "X"]):
+        b = b.set(idx // 3, idx % 3, val)
+        assert b.zobrist_key() == Board(3, [b.get(i // 3, i % 3) for i in range(9)]).zobrist_key()
+    assert hash(b) == hash(Board(3, [b.get(i // 3, i % 3) for i in range(9)]))
+
+    b = Board(2, 0).set(0, 0, [])
+    assert b.get(0, 0) == []
+    with pytest.raises(TypeError):
+        b.zobrist_key()
+    assert Board(2, 0).set(0, 0, [1]).set(0, 0, 1).zobrist_key() == Board(2, [1, 0, 0, 0]).zobrist_key()
+
+@pytest.mark.parametrize("side", [1, 2, 4])
+
+def test_accessors_match_get(side):
+    """Test row, column and diagonal accessors agree with Board.get()."""
+    b = Board(side, list(range(side*side)))
+    for idx in range(side):
+        assert b.get_row(idx) == [b.get(idx, col) for col in range(side)]
+        assert b.get_col(idx) == [b.get(row, idx) for row in range(side)]
+    assert b.get_ldiag() == [b.get(idx, idx) for idx in range(side)]
+    assert b.get_rdiag() == [b.get(idx, side - idx - 1) for idx in range(side)]
@@ -0,0 +1,110 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard
+from game.database import _HEADER, OutcomeDatabase, _KeyView, build_database, position_key
+from game.tictactoe import move_win_stats_fast
+from game.transposition import TranspositionTable
+
+
+@pytest.fixture(scope="module")
+def database_3x3(tmp_path_factory):
+    """Returns path of a 3x3 two player outcome database."""
+    path = str(tmp_path_factory.mktemp("database") / "tictactoe3.db")
+    assert build_database(path, 3, 2) == 4536
+    return path
+
+def test_position_key():
+    """Test position_key() encodes every location and the player to move."""
+    assert position_key(Board(2), 0, 2) == 0
+    assert position_key(Board(2), 1, 2) == 1
+    assert position_key(Board(2, [0, None, None, None]), 1, 2) == 3
+    assert position_key(Board(2, [None, 1, None, None]), 0, 2) == 12
+    board = Board(3, [0, 1, None, None, 0, None, 1, None, None])
+    assert position_key(board, 0, 2) == position_key(BitBoard.from_board(board, 2), 0, 2)
+    with pytest.raises(TypeError):
+        position_key(None, 0, 2)
+    with pytest.raises(ValueError):
+        position_key(Board(2, "X"), 0, 2)
+    with pytest.raises(ValueError):
+        position_key(Board(2), 2, 2)
+    with pytest.raises(ValueError):
+        position_key(Board(2), -1, 2)
+    with pytest.raises(ValueError):
+        position_key(Board(2), 0, 0)
+
+def test_build_database_raises_ValueError(tmp_path):
+    """Test build_database() validates arguments."""
+    with pytest.raises(ValueError):
+        build_database(str(tmp_path / "big.db"), 15, 2)
+    with pytest.raises(ValueError):
+        build_database(str(tmp_path / "bad.db"), 3, 2, 4)
+
+@pytest.mark.parametrize("vals, cur_player", [
+    ([None, None, None, None, None, None, None, None, None], 0),
+    ([None, None, None, None, 0, None, None, None, None], 1),
+    ([0, None, None, None, 1, None, None, None, None], 0),
+    ([0, 1, 0, None, 1, None, None, None, None], 0),
+    ([0, 1, 0, 1, 1, 0, None, 0, 1], 0)
+])
+
+def test_move_win_stats(database_3x3, vals, cur_player):
+    """Test OutcomeDatabase.move_win_stats() matches move_win_stats_fast()."""
+    board = Board(3, vals)
+    expected = move_win_stats_fast(board, cur_player, 2, TranspositionTable())
+    with OutcomeDatabase(database_3x3) as database:
+        assert len(database) == 4536
+        assert database.side_len() == 3
+        assert database.total_player() == 2
+        assert database.win_len() == 3
+        assert database.move_win_stats(board, cur_player, 2) == expected
+        assert database.move_win_stats(BitBoard.from_board(board, 2), cur_player, 2) == expected
+
+def test_move_win_stats_raises(database_3x3):
+    """Test OutcomeDatabase.move_win_stats() rejects unknown positions."""
+    with OutcomeDatabase(database_3x3) as database:
+        with pytest.raises(KeyError):
+            database.move_win_stats(Board(3), 1, 2)
+        with pytest.raises(KeyError):
+            database.move_win_stats(Board(3, [0, 0, 0, 1, 1, None, None, None, None]), 1, 2)
+        with pytest.raises(ValueError):
+            database.move_win_stats(Board(4), 0, 2)
+        with pytest.raises(ValueError):
+            database.move_win_stats(Board(3), 0, 3)
+        with pytest.raises(ValueError):
+            database.move_win_stats(Board(3), 0, 2, 2)
+        with pytest.raises(TypeError):
+            database.move_win_stats(None, 0, 2)
+        with pytest.raises(ValueError):
+            database.move_win_stats(Board(3), 2, 2)
+        with pytest.raises(ValueError):
+            database.move_win_stats(Board(3), -1, 2)
+
+def test_key_view(database_3x3):
+    """Test the struct based key view reads the same keys as the native
+    memory view."""
+    with OutcomeDatabase(database_3x3) as database:
+        view = _KeyView(database._map, _HEADER.size, len(database))
+        assert len(view) == len(database._keys)
+        assert [view[pos] for pos in range(len(view))] == list(database._keys)
+        with pytest.raises(IndexError):
+            view[len(view)]
+
+def test_multi_player_win_len(tmp_path):
+    """Test a three player database with win_len."""
+    path = str(tmp_path / "tictactoe3p.db")
+    build_database(path, 3, 3, 2)
+    board = Board(3, [0, None, None, None, 1, None, None, None, 2])
+    with OutcomeDatabase(path) as database:
+        assert database.move_win_stats(board, 0, 3, 2) == move_win_stats_fast(board, 0, 3, win_len=2)
+
+def test_open_raises_ValueError(tmp_path):
+    """Test OutcomeDatabase rejects other files."""
+    path = tmp_path / "other.db"
+    path.write_bytes(b"not a database at all, just some bytes")
+    with pytest.raises(ValueError):
+        OutcomeDatabase(str(path))
+    empty = tmp_path / "empty.db"
+    empty.write_bytes(b"")
+    with pytest.raises(ValueError):
+        OutcomeDatabase(str(empty))
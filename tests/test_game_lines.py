@@ -0,0 +1,115 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard
+from game.lines import cell_lines, line_cells
+from game.search import SearchState
+from game.tictactoe import (is_winning_move, matching_positions, move_win_stats,
+                            move_win_stats_fast, next_player)
+
+
+def test_line_cells_raises_ValueError():
+    """Test line_cells() validates arguments."""
+    with pytest.raises(ValueError):
+        line_cells(0)
+    with pytest.raises(ValueError):
+        line_cells(3, 0)
+    with pytest.raises(ValueError):
+        line_cells(3, 4)
+
+@pytest.mark.parametrize("side, win_len, count", [
+    (3, None, 8),
+    (3, 3, 8),
+    (4, 3, 24),
+    (6, 4, 54),
+    (15, 5, 572)
+])
+
+def test_line_cells(side, win_len, count):
+    """Test line_cells() lists every segment of win_len locations."""
+    lines = line_cells(side, win_len)
+    assert len(lines) == count
+    assert len(set(lines)) == count
+    for line in lines:
+        assert len(line) == (win_len or side)
+
+def test_cell_lines():
+    """Test cell_lines() lists the segments through each location."""
+    lines = line_cells(4, 3)
+    for idx, line_ids in enumerate(cell_lines(4, 3)):
+        assert sorted(line_ids) == [line_id for line_id, line in enumerate(lines) if idx in line]
+    assert len(cell_lines(4, 3)[0]) == 3
+    assert len(cell_lines(4, 3)[5]) == 7
+
+@pytest.mark.parametrize("vals, row, col, win_len, result", [
+    ([0, 0, 0, None,
+      1, 1, None, None,
+      None, None, None, None,
+      None, None, None, None], 0, 1, 3, True),
+    ([0, 0, 0, None,
+      1, 1, None, None,
+      None, None, None, None,
+      None, None, None, None], 0, 1, 4, False),
+    ([None, 0, None, None,
+      None, None, 0, None,
+      None, None, None, 0,
+      None, None, None, None], 1, 2, 3, True),
+    ([None, None, None, 1,
+      None, None, 1, None,
+      None, 0, None, None,
+      None, None, None, None], 1, 2, 3, False),
+    ([None, None, None, 1,
+      None, None, 1, None,
+      None, 1, None, None,
+      None, None, None, None], 2, 1, 3, True)
+])
+
+def test_is_winning_move_win_len(vals, row, col, win_len, result):
+    """Test is_winning_move() with win_len on Board, BitBoard and SearchState."""
+    board = Board(4, vals)
+    assert is_winning_move(board, row, col, win_len) == result
+    assert is_winning_move(BitBoard.from_board(board, 2), row, col, win_len) == result
+
+    player = board.get(row, col)
+    state = SearchState(board.set(row, col, None), 2, win_len)
+    assert state.play(row*4 + col, player) == result
+
+def test_is_winning_move_raises_ValueError():
+    """Test is_winning_move() validates win_len."""
+    with pytest.raises(ValueError):
+        is_winning_move(Board(3), 0, 0, 4)
+    with pytest.raises(ValueError):
+        is_winning_move(BitBoard(3, 2), 0, 0, 0)
+    with pytest.raises(ValueError):
+        move_win_stats(Board(3), 0, 2, win_len=4)
+
+def _reference_win_stats(board, cur_player, total_player, win_len):
+    """Returns move_win_stats() computed directly from is_winning_move()."""
+    win_stats = {}
+    for (row, col) in matching_positions(board, None):
+        new_board = board.set(row, col, cur_player)
+        win_stats[(row, col)] = [0 for i in range(total_player)]
+        if is_winning_move(new_board, row, col, win_len):
+            win_stats[(row, col)][cur_player] = 1
+        else:
+            new_player = next_player(cur_player, total_player)
+            for stats in _reference_win_stats(new_board, new_player, total_player, win_len).values():
+                for idx, stat in enumerate(stats):
+                    win_stats[(row, col)][idx] += stat
+    return win_stats
+
+@pytest.mark.parametrize("vals, cur_player, total_player, win_len", [
+    ([None, None, None, None, None, None, None, None, None], 0, 2, 2),
+    ([0, None, None, None, 1, None, None, None, None], 0, 2, 2),
+    ([None, 1, None, 0, None, 0, 1, None, None, None, 0, 1, None, 0, None, 1], 0, 2, 3),
+    ([None, 1, None, 0, 0, 2, 1, None, None, None, 0, 1, None, 2, None, 1], 1, 3, 3)
+])
+
+def test_move_win_stats_win_len(vals, cur_player, total_player, win_len):
+    """Test move_win_stats() and move_win_stats_fast() with win_len."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    expected = _reference_win_stats(board, cur_player, total_player, win_len)
+    assert move_win_stats(board, cur_player, total_player, win_len=win_len) == expected
+    assert move_win_stats_fast(board, cur_player, total_player, win_len=win_len) == expected
+    assert move_win_stats_fast(board, cur_player, total_player, jobs=2, split_depth=1,
+                               win_len=win_len) == expected
@@ -0,0 +1,70 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.montecarlo import sample_move_win_stats
+from game.tictactoe import move_win_stats_fast
+
+
+def test_sample_move_win_stats_raises():
+    """Test sample_move_win_stats() validates arguments."""
+    with pytest.raises(TypeError):
+        sample_move_win_stats(None, 0, 2)
+    with pytest.raises(ValueError):
+        sample_move_win_stats(Board(3), 2, 2)
+    with pytest.raises(ValueError):
+        sample_move_win_stats(Board(3), 0, 2, playouts=None)
+    with pytest.raises(ValueError):
+        sample_move_win_stats(Board(3), 0, 2, playouts=0)
+    with pytest.raises(ValueError):
+        sample_move_win_stats(Board(3), 0, 2, confidence=1)
+
+def test_sample_move_win_stats_seed():
+    """Test sample_move_win_stats() is repeatable with a seed."""
+    board = Board(3, [0, None, None, None, 1, None, None, None, None])
+    assert sample_move_win_stats(board, 0, 2, playouts=200, seed=7) == \
+        sample_move_win_stats(board, 0, 2, playouts=200, seed=7)
+
+@pytest.mark.parametrize("board, cur_player, total_player", [
+    (Board(3), 0, 2),
+    (Board(3, [0, None, None, None, 1, None, None, None, None]), 0, 2),
+    (Board(3, [0, None, 1, None, None, None, None, None, 2]), 1, 3)
+])
+
+def test_sample_move_win_stats(board, cur_player, total_player):
+    """Test sample_move_win_stats() estimates move_win_stats()."""
+    exact = move_win_stats_fast(board, cur_player, total_player)
+    (win_stats, intervals, count) = sample_move_win_stats(
+        board, cur_player, total_player, playouts=2000, seed=1)
+
+    assert count == 2000
+    assert win_stats.keys() == exact.keys()
+    for pos, stats in exact.items():
+        games = sum(stats)
+        for player, wins in enumerate(stats):
+            (low, high) = intervals[pos][player]
+            assert low <= win_stats[pos][player] <= high
+            assert abs(win_stats[pos][player] - wins) <= 0.1 * games
+
+def test_sample_move_win_stats_immediate_win():
+    """Test sample_move_win_stats() is exact for a winning move."""
+    board = Board(3, [0, 0, None, 1, 1, None, None, None, None])
+    (win_stats, intervals, count) = sample_move_win_stats(board, 0, 2, playouts=100, seed=1)
+    assert win_stats[(0, 2)] == [1.0, 0.0]
+    assert intervals[(0, 2)] == [(1.0, 1.0), (0.0, 0.0)]
+
+def test_sample_move_win_stats_rel_tol():
+    """Test sample_move_win_stats() stops early once intervals are tight."""
+    board = Board(3, [0, None, None, None, 1, None, None, None, None])
+    (win_stats, intervals, count) = sample_move_win_stats(
+        board, 0, 2, playouts=100000, seed=1, rel_tol=0.2)
+    assert count < 100000
+    for pos, stats in win_stats.items():
+        for (low, high) in intervals[pos]:
+            assert (high - low) / 2 <= 0.2 * sum(stats)
+
+def test_sample_move_win_stats_time_budget():
+    """Test sample_move_win_stats() runs at least one batch within a time budget."""
+    (win_stats, intervals, count) = sample_move_win_stats(
+        Board(5), 0, 2, playouts=None, time_budget=0, seed=1)
+    assert count > 0
+    assert len(win_stats) == 25
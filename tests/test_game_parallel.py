@@ -0,0 +1,45 @@
+"""Module docstring"""
+import os
+import pytest
+from game.board import Board
+from game.parallel import _worker_count
+from game.transposition import TranspositionTable
+from game.tictactoe import move_win_stats, move_win_stats_fast
+
+
+@pytest.mark.parametrize("vals, cur_player, total_player, split_depth", [
+    ([0, None, None, None, 1, None, None, None, None], 0, 2, 0),
+    ([0, None, None, None, 1, None, None, None, None], 0, 2, 2),
+    ([0, None, 1, None, None, None, None, None, 2], 1, 3, 1),
+    ([0, 1, 0, 1, 1, 0, None, None, None], 0, 2, 3),
+    ([0, 1, 0, 1, 1, 0, 0, 1, 0], 0, 2, 1)
+])
+
+def test_parallel_matches_serial(vals, cur_player, total_player, split_depth):
+    """Test jobs option gives the same statistics as a serial search."""
+    board = Board(3, vals)
+    expected = move_win_stats(board, cur_player, total_player)
+
+    assert move_win_stats(board, cur_player, total_player,
+                          jobs=2, split_depth=split_depth) == expected
+    assert move_win_stats_fast(board, cur_player, total_player,
+                               jobs=2, split_depth=split_depth) == expected
+    assert move_win_stats_fast(board, cur_player, total_player, TranspositionTable(),
+                               jobs=2, split_depth=split_depth) == expected
+    assert move_win_stats_fast(board, cur_player, total_player, TranspositionTable(),
+                               jobs=2, split_depth=split_depth, engine="iterative") == expected
+
+def test_parallel_raises_ValueError():
+    """Test jobs option validates split_depth."""
+    with pytest.raises(ValueError):
+        move_win_stats_fast(Board(3), 0, 2, jobs=2, split_depth=-1)
+
+def test_worker_count(monkeypatch):
+    """Test _worker_count() uses one process per CPU for jobs less than 1
+    and one process when the CPU count is unknown."""
+    assert _worker_count(3) == 3
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    assert _worker_count(0) == 4
+    monkeypatch.setattr(os, "cpu_count", lambda: None)
+    assert _worker_count(0) == 1
+    assert _worker_count(-1) == 1
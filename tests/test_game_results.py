@@ -0,0 +1,93 @@
+"""Module docstring"""
+import json
+import pickle
+import pytest
+from game.board import Board
+from game.results import MoveWinStats
+from game.tictactoe import move_win_orbits, move_win_stats_fast
+from game.transposition import TranspositionTable
+
+
+@pytest.fixture
+def win_stats():
+    """Returns statistics with one orbit of four positions and one of one."""
+    return MoveWinStats(3, 2, [([(0, 0), (2, 2), (0, 2), (2, 0)], [3, 1]),
+                               ([(1, 1)], [0, 0])])
+
+def test_move_win_stats_raises_ValueError():
+    """Test MoveWinStats() validates win vector lengths."""
+    with pytest.raises(ValueError):
+        MoveWinStats(3, 2, [([(0, 0)], [1, 2, 3])])
+
+def test_mapping(win_stats):
+    """Test MoveWinStats reads like a dictionary in row first order."""
+    assert len(win_stats) == 5
+    assert list(win_stats) == [(0, 0), (0, 2), (1, 1), (2, 0), (2, 2)]
+    assert win_stats.keys() == list(win_stats)
+    assert win_stats.values() == [[3, 1], [3, 1], [0, 0], [3, 1], [3, 1]]
+    assert win_stats.items()[2] == ((1, 1), [0, 0])
+    assert (2, 2) in win_stats
+    assert (0, 1) not in win_stats
+    assert [0, 1] not in win_stats
+    assert win_stats.get((0, 1)) is None
+    assert win_stats.get((0, 2)) == [3, 1]
+    with pytest.raises(KeyError):
+        win_stats[(0, 1)]
+
+def test_getitem_returns_new_list(win_stats):
+    """Test MoveWinStats returns a list the caller may change."""
+    win_stats[(0, 0)][0] = 100
+    assert win_stats[(0, 0)] == [3, 1]
+    assert win_stats[(2, 2)] == [3, 1]
+
+def test_totals_and_ratios(win_stats):
+    """Test MoveWinStats precomputes totals and win ratios."""
+    assert win_stats.total((2, 0)) == 4
+    assert win_stats.ratios((2, 0)) == [0.75, 0.25]
+    assert win_stats.total((1, 1)) == 0
+    assert win_stats.ratios((1, 1)) == [0.0, 0.0]
+    with pytest.raises(KeyError):
+        win_stats.ratios((0, 1))
+
+def test_orbits(win_stats):
+    """Test MoveWinStats keeps one win vector per orbit."""
+    assert win_stats.orbits() == [(((0, 0), (0, 2), (2, 0), (2, 2)), [3, 1]), (((1, 1),), [0, 0])]
+    assert (win_stats.side_len(), win_stats.total_player()) == (3, 2)
+
+def test_to_dict(win_stats):
+    """Test MoveWinStats expands to and compares with a dictionary."""
+    expanded = win_stats.to_dict()
+    assert expanded == {(0, 0): [3, 1], (0, 2): [3, 1], (2, 0): [3, 1], (2, 2): [3, 1],
+                        (1, 1): [0, 0]}
+    assert win_stats == expanded
+    expanded[(1, 1)] = [0, 1]
+    assert win_stats != expanded
+    assert win_stats != [(0, 0)]
+
+def test_compact_round_trip(win_stats):
+    """Test MoveWinStats serializes each orbit once."""
+    compact = json.loads(json.dumps(win_stats.to_compact()))
+    assert len(compact["orbits"]) == 2
+    assert MoveWinStats.from_compact(compact) == win_stats
+
+def test_pickle(win_stats):
+    """Test MoveWinStats pickles without its position index."""
+    assert win_stats[(0, 0)] == [3, 1]
+    copy = pickle.loads(pickle.dumps(win_stats))
+    assert copy == win_stats
+    assert copy.ratios((0, 0)) == [0.75, 0.25]
+
+@pytest.mark.parametrize("board, cur_player, total_player, jobs", [
+    (Board(3), 0, 2, 1),
+    (Board(3, [0, None, 1, None, None, None, None, None, 2]), 1, 3, 1),
+    (Board(3, [None, None, None, None, 0, None, None, None, None]), 1, 2, 2),
+    (Board(3, [0, 1, 0, 1, 1, 0, 0, 1, 0]), 0, 2, 1)
+])
+
+def test_move_win_orbits(board, cur_player, total_player, jobs):
+    """Test move_win_orbits() matches move_win_stats_fast()."""
+    expected = move_win_stats_fast(board, cur_player, total_player)
+    result = move_win_orbits(board, cur_player, total_player, TranspositionTable(), jobs=jobs)
+    assert result == expected
+    assert result.to_dict() == expected
+    assert len(result.orbits()) <= len(expected)
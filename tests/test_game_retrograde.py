@@ -0,0 +1,49 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard
+from game.tictactoe import move_win_stats_fast
+from game.transposition import TranspositionTable
+
+np = pytest.importorskip("numpy")
+
+from game.retrograde import retrograde_win_stats
+
+
+def test_retrograde_win_stats_raises():
+    """Test retrograde_win_stats() validates arguments."""
+    with pytest.raises(TypeError):
+        retrograde_win_stats(None, 0, 2)
+    with pytest.raises(ValueError):
+        retrograde_win_stats(Board(3), 2, 2)
+    with pytest.raises(ValueError):
+        retrograde_win_stats(Board(3, "X"), 0, 2)
+    with pytest.raises(ValueError):
+        retrograde_win_stats(Board(3), 0, 2, 4)
+    with pytest.raises(ValueError):
+        retrograde_win_stats(Board(5), 0, 2)
+    with pytest.raises(ValueError):
+        retrograde_win_stats(Board(7, 0), 0, 2)
+
+@pytest.mark.parametrize("vals, cur_player, total_player, win_len", [
+    ([None, None, None, None, None, None, None, None, None], 0, 2, None),
+    ([0, None, 1, None, None, None, None, None, 2], 1, 3, None),
+    ([0, 1, 0, 1, 1, 0, 0, 1, 0], 0, 2, None),
+    ([0, 0, 0, 1, 1, None, None, None, None], 1, 2, None),
+    ([None, None, None, None, None, None, None, None, None], 0, 2, 2),
+    ([0, 1, 0, 1, 1, 0, 1, 0, None, None, None, None, None, None, None, None], 0, 2, None),
+    ([0, 1, None, None, 1, 0, None, 0, None, 1, 0, 1, None, 0, None, 1], 0, 2, 3)
+])
+
+def test_retrograde_win_stats(vals, cur_player, total_player, win_len):
+    """Test retrograde_win_stats() matches move_win_stats_fast()."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    expected = move_win_stats_fast(board, cur_player, total_player, TranspositionTable(),
+                                   win_len=win_len)
+    assert retrograde_win_stats(board, cur_player, total_player, win_len) == expected
+
+def test_retrograde_win_stats_bitboard():
+    """Test retrograde_win_stats() accepts a BitBoard."""
+    board = Board(3, [0, None, None, None, 1, None, None, None, None])
+    assert retrograde_win_stats(BitBoard.from_board(board, 2), 0, 2) == \
+        retrograde_win_stats(board, 0, 2)
@@ -0,0 +1,188 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.search import SearchState, line_cells
+from game.symmetry import TRANSFORMS, _permutations, transform_board
+from game.tictactoe import is_winning_move, matching_positions, move_win_stats, move_win_stats_fast
+
+
+def test_search_state_raises():
+    """Test SearchState constructor validates arguments."""
+    with pytest.raises(TypeError):
+        SearchState(None, 2)
+    with pytest.raises(ValueError):
+        SearchState(Board(3), 0)
+    with pytest.raises(ValueError):
+        SearchState(Board(3), 10)
+
+def test_line_cells():
+    """Test line_cells() lists rows, columns and diagonals."""
+    assert line_cells(3) == ((0, 1, 2), (3, 4, 5), (6, 7, 8),
+                             (0, 3, 6), (1, 4, 7), (2, 5, 8),
+                             (0, 4, 8), (2, 4, 6))
+    with pytest.raises(ValueError):
+        line_cells(0)
+
+@pytest.mark.parametrize("vals", [
+    [None, None, None, None, None, None, None, None, None],
+    [0, None, 1, None, 0, None, 1, None, None],
+    [0, "X", None, 1, None, 0, None, None, 1],
+    [None, 1, None, 0, None, 0, 1, None, 1, None, 0, 1, None, 0, None, 1]
+])
+
+def test_play_matches_is_winning_move(vals):
+    """Test SearchState.play() agrees with is_winning_move() for every
+    open location and player, and SearchState.undo() restores the state."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    state = SearchState(board, 2)
+    zobrist = (state.relative_zobrist_key(0), state.canonical_relative_zobrist_key(0))
+    side = board.side_len()
+
+    assert state.open_positions() == matching_positions(board, None)
+
+    for (row, col) in matching_positions(board, None):
+        for player in range(2):
+            is_win = state.play(row*side + col, player)
+            assert is_win == is_winning_move(board.set(row, col, player), row, col)
+            assert state.get(row, col) == player
+            state.undo(row*side + col, player)
+            assert (state.relative_zobrist_key(0),
+                    state.canonical_relative_zobrist_key(0)) == zobrist
+
+    assert str(state.to_board()) == str(board)
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+
+def test_canonical_relative_zobrist_key(transform):
+    """Test SearchState.canonical_relative_zobrist_key() is shared by
+    rotations and reflections."""
+    board = Board(3, [0, "X", None, 1, None, None, None, 0, None])
+    sym_board = transform_board(board, transform)
+    assert SearchState(board, 2).canonical_relative_zobrist_key(0) == \
+        SearchState(sym_board, 2).canonical_relative_zobrist_key(0)
+
+def test_zobrist_key():
+    """Test SearchState.relative_zobrist_key() is updated by play() and
+    separates positions, blocked values aside."""
+    def key(board, win_len=None):
+        return SearchState(board, 2, win_len).relative_zobrist_key(0)
+
+    board = Board(3, [0, "X", None, None, None, None, None, None, 1])
+    state = SearchState(board, 2)
+    state.play(4, 0)
+    assert state.relative_zobrist_key(0) == key(board.set(1, 1, 0))
+    assert state.relative_zobrist_key(0) != key(board.set(1, 1, 1))
+    assert key(board) == key(board.set(0, 1, "Y"))
+    assert key(board) != key(board.set(0, 1, None).set(0, 2, "X"))
+    assert key(board) != key(board, 2)
+    assert key(board) != key(board.set(0, 1, None))
+    assert key(Board(3)) != key(Board(4))
+    assert key(board) != key(transform_board(board, "flip_lr"))
+
+@pytest.mark.parametrize("vals, transforms", [
+    ([None] * 9, set(TRANSFORMS) - {"identity"}),
+    ([None, None, None, None, 0, None, None, None, None], set(TRANSFORMS) - {"identity"}),
+    ([0, None, None, None, None, None, None, None, None], {"transpose"}),
+    ([0, None, 0, None, 1, None, None, None, None], {"flip_lr"}),
+    (["X", None, None, None, None, None, None, None, "Y"], {"transpose", "anti_transpose",
+                                                          "rot180"}),
+    ([0, 1, None, None, None, None, None, None, None], set())
+])
+
+def test_symmetries(vals, transforms):
+    """Test SearchState.symmetries() finds the transforms that map the
+    position onto itself, before and after moves."""
+    board = Board(3, vals)
+    perms = [_permutations(3)[name] for name in TRANSFORMS if name in transforms]
+    state = SearchState(board, 2)
+    assert state.symmetries() == perms
+
+    state.play(1, 1)
+    state.undo(1, 1)
+    assert state.symmetries() == perms
+
+@pytest.mark.parametrize("vals, total_player, cur_players", [
+    ([None] * 9, 2, [0, 1]),
+    ([0, 1, 0, 0, 1, 1, 1, 0, None], 2, []),
+    ([0, 1, 0, 1, 1, 0, 0, None, 1], 2, [1]),
+    ([0, 1, 0, 1, 1, 0, 0, None, 1], 3, [1]),
+    ([0, 1, 0, 1, 1, 0, None, None, 2], 3, [0, 1, 2]),
+    ([0, 1, 0, 1, 1, 0, None, 2, 2], 3, [2]),
+    ([0, 1, 0, 1, "X", 0, 0, None, 1], 2, []),
+    ([0, 1, 0, 0, 1, 1, 1, 0, 1], 2, [])
+])
+
+def test_can_win(vals, total_player, cur_players):
+    """Test SearchState.can_win() tells whether a player with a turn left
+    still has a line free of other players' stones."""
+    state = SearchState(Board(3, vals), total_player)
+    assert [player for player in range(total_player) if state.can_win(player)] == cur_players
+
+    for idx in [idx for idx, val in enumerate(vals) if val is None]:
+        state.play(idx, 0)
+        state.undo(idx, 0)
+    assert [player for player in range(total_player) if state.can_win(player)] == cur_players
+
+def test_can_win_after_moves():
+    """Test SearchState.can_win() follows play() and undo()."""
+    state = SearchState(Board(3, [0, 1, 0, 0, 1, 1, None, 0, None]), 2)
+    assert state.can_win(0)
+    state.play(6, 1)
+    assert not state.can_win(0)
+    assert not state.can_win(1)
+    state.undo(6, 1)
+    assert state.can_win(0)
+
+def test_relative_zobrist_key_built_on_demand():
+    """Test keys for other players to move are built when first read and
+    then kept up to date by play() and undo()."""
+    board = Board(3, [0, "X", None, 2, None, None, None, 1, None])
+    state = SearchState(board, 3)
+    key = state.relative_zobrist_key(0)
+    assert state._key_players == 1
+    relative_key = state.relative_zobrist_key(2)
+    assert state._key_players == 3
+    assert state.relative_zobrist_key(0) == key
+
+    state.play(4, 1)
+    assert state.relative_zobrist_key(1) == \
+        SearchState(board.set(1, 1, 1), 3).relative_zobrist_key(1)
+    state.undo(4, 1)
+    assert state.relative_zobrist_key(2) == relative_key
+
+def test_relative_zobrist_key():
+    """Test SearchState.relative_zobrist_key() is shared by positions whose
+    players and player to move are cyclically shifted alike."""
+    board = Board(3, [0, "X", None, 2, None, None, None, 1, None])
+    shifted = Board(3, [1, "X", None, 0, None, None, None, 2, None])
+    state = SearchState(board, 3)
+    assert state.relative_zobrist_key(0) == SearchState(shifted, 3).relative_zobrist_key(1)
+    assert state.relative_zobrist_key(2) == SearchState(shifted, 3).relative_zobrist_key(0)
+    assert state.relative_zobrist_key(0) != SearchState(shifted, 3).relative_zobrist_key(0)
+    assert state.relative_zobrist_key(1) != state.relative_zobrist_key(0)
+
+    swapped = Board(3, [0, "X", None, 1, None, None, None, 2, None])
+    assert state.relative_zobrist_key(0) != SearchState(swapped, 3).relative_zobrist_key(0)
+
+    state.play(4, 1)
+    assert state.relative_zobrist_key(2) == \
+        SearchState(shifted.set(1, 1, 2), 3).relative_zobrist_key(0)
+    assert state.canonical_relative_zobrist_key(2) == \
+        SearchState(transform_board(shifted.set(1, 1, 2), "rot90"), 3) \
+        .canonical_relative_zobrist_key(0)
+
+@pytest.mark.parametrize("vals, cur_player, total_player, result", [
+    ([0, "X", None, None, None, None, None, 1, None], 0, 2,
+     {(0, 2): [48, 42], (1, 0): [48, 34], (1, 1): [60, 22],
+      (1, 2): [44, 34], (2, 0): [52, 12], (2, 2): [52, 24]}),
+    ([None, 3, None, 0, None, None, 1, None, None], 1, 3,
+     {(0, 0): [12, 0, 0], (0, 2): [12, 12, 0], (1, 1): [0, 12, 0],
+      (1, 2): [0, 0, 0], (2, 1): [8, 12, 0], (2, 2): [8, 12, 0]})
+])
+
+def test_move_win_stats_blocked(vals, cur_player, total_player, result):
+    """Test move_win_stats() treats values other than player numbers as
+    blocked locations."""
+    board = Board(3, vals)
+    assert move_win_stats(board, cur_player, total_player) == result
+    assert move_win_stats_fast(board, cur_player, total_player) == result
@@ -0,0 +1,148 @@
+"""Module docstring"""
+import asyncio
+import json
+import pytest
+from game.board import Board
+from game.service import QueryService, format_response, parse_request, start_server
+from game.symmetry import transform_board
+from game.tictactoe import move_win_stats_fast
+
+
+@pytest.fixture(scope="module")
+def service():
+    """Returns a query service with one worker process."""
+    query_service = QueryService(jobs=1, cache_size=100)
+    yield query_service
+    query_service.close()
+
+def _request(vals, player=0, request_id=None, **options):
+    """Returns a request line."""
+    request = {"id": request_id, "board": vals, "player": player}
+    request.update(options)
+    return json.dumps(request) + "\n"
+
+async def _exchange(port, lines):
+    """Returns the responses to the request lines sent over one connection."""
+    (reader, writer) = await asyncio.open_connection("127.0.0.1", port)
+    writer.write("".join(lines).encode())
+    await writer.drain()
+    responses = [json.loads(await reader.readline()) for line in lines]
+    writer.close()
+    await writer.wait_closed()
+    return responses
+
+def _serve(service, clients):
+    """Runs the clients, each a list of request lines, against a local
+    server and returns their responses."""
+    async def run():
+        server = await start_server(service)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(*[_exchange(port, lines) for lines in clients])
+    return asyncio.run(run())
+
+def _win_stats(response):
+    """Returns the win statistics dictionary of a response."""
+    return dict(((entry["row"], entry["col"]), entry["wins"]) for entry in response["win_stats"])
+
+def test_parse_request():
+    """Test parse_request() reads a request line."""
+    (request_id, board, cur_player, total_player, win_len) = parse_request(
+        _request([0, None, None, 1], 0, "a", players=3, win_len=1))
+    assert (request_id, cur_player, total_player, win_len) == ("a", 0, 3, 1)
+    assert board == Board(2, [0, None, None, 1])
+    assert parse_request('{"board": [null]}')[1:] == (Board(1), 0, 2, 1)
+
+@pytest.mark.parametrize("line", [
+    "not json",
+    "[1, 2]",
+    '{"board": [null, null, null]}',
+    '{"board": []}',
+    '{"board": "XXXX"}',
+    '{"board": [null, null, null, 2]}',
+    '{"board": [null, null, null, null], "player": 2}',
+    '{"board": [null, null, null, null], "player": "0"}',
+    '{"board": [null, null, null, null], "win_len": 3}',
+    '{"board": [null, null, null, null], "players": 0}',
+    '{"board": [null, null, null, null], "players": 5}',
+    '{"board": [null, null, null, null], "players": 100000000000000000000}'
+])
+
+def test_parse_request_raises_ValueError(line):
+    """Test parse_request() rejects malformed requests."""
+    with pytest.raises(ValueError):
+        parse_request(line)
+
+def test_format_response():
+    """Test format_response() lists moves in row first order."""
+    assert json.loads(format_response(7, {(1, 0): [1, 2], (0, 1): [3, 4]})) == \
+        {"id": 7, "win_stats": [{"row": 0, "col": 1, "wins": [3, 4]},
+                                {"row": 1, "col": 0, "wins": [1, 2]}]}
+    assert json.loads(format_response(None, error="bad.")) == {"id": None, "error": "bad."}
+
+def test_server_answers_queries(service):
+    """Test the server answers requests and reports errors by id."""
+    vals = [0, None, None, None, 1, None, None, None, None]
+    responses = _serve(service, [[_request(vals, 0, 1), "oops\n",
+                                  _request([None] * 4, 1, 3, players=3, win_len=2)]])[0]
+    responses = dict((response["id"], response) for response in responses)
+
+    assert _win_stats(responses[1]) == move_win_stats_fast(Board(3, vals), 0, 2)
+    assert responses[None]["error"] == "request must be a JSON object."
+    assert _win_stats(responses[3]) == move_win_stats_fast(Board(2), 1, 3, win_len=2)
+
+def test_server_coalesces_and_caches(service):
+    """Test identical and symmetric queries share one search."""
+    vals = [0, 1, None, None, None, None, None, None, None]
+    sym_vals = [0, None, None, 1, None, None, None, None, None]
+    (board, sym_board) = (Board(3, vals), Board(3, sym_vals))
+    assert transform_board(board, "transpose") == sym_board
+    lines = [_request(vals, 0, idx) for idx in range(3)]
+    sym_line = _request(sym_vals, 0, "sym")
+
+    searches = service.searches()
+    responses = _serve(service, [lines, lines, [sym_line]])
+    assert service.searches() == searches + 1
+
+    expected = move_win_stats_fast(board, 0, 2)
+    for response in responses[0] + responses[1]:
+        assert _win_stats(response) == expected
+    assert _win_stats(responses[2][0]) == move_win_stats_fast(sym_board, 0, 2)
+
+    _serve(service, [[sym_line]])
+    assert service.searches() == searches + 1
+
+def test_server_shares_shifted_players(service):
+    """Test queries whose players and player to move are cyclically
+    shifted share one search."""
+    vals = [0, None, 1, None, 2, None, None, None, None]
+    shifted_vals = [2, None, 0, None, 1, None, None, None, None]
+    searches = service.searches()
+    responses = _serve(service, [[_request(vals, 1, "a", players=3)],
+                                 [_request(shifted_vals, 0, "b", players=3)]])
+    assert service.searches() == searches + 1
+    assert _win_stats(responses[0][0]) == move_win_stats_fast(Board(3, vals), 1, 3)
+    assert _win_stats(responses[1][0]) == move_win_stats_fast(Board(3, shifted_vals), 0, 3)
+
+def test_handle_line_reports_search_errors(service, monkeypatch):
+    """Test a request whose search fails is answered with an error while
+    other requests on the connection are still answered."""
+    query = service.query
+
+    async def failing_query(board, cur_player, total_player, win_len=None):
+        if cur_player == 1:
+            raise OverflowError("search failed")
+        return await query(board, cur_player, total_player, win_len)
+
+    monkeypatch.setattr(service, "query", failing_query)
+    responses = _serve(service, [[_request([None] * 4, 1, "a"), _request([None] * 4, 0, "b")]])[0]
+    responses = dict((response["id"], response) for response in responses)
+    assert responses["a"] == {"id": "a", "error": "search failed"}
+    assert _win_stats(responses["b"]) == move_win_stats_fast(Board(2), 0, 2)
+
+def test_query_service_raises_ValueError():
+    """Test QueryService validates arguments."""
+    with pytest.raises(ValueError):
+        QueryService(jobs=1, cache_size=0)
+    with pytest.raises(ValueError):
+        QueryService(jobs=1, table_size=0)
@@ -0,0 +1,94 @@
+"""Module docstring"""
+import json
+import pytest
+from game.board import Board
+from game.search import SearchState
+from game.stats import SearchStats, StatsSearchState, stats_collate_fn
+from game.tictactoe import move_win_stats, move_win_stats_fast
+from game.transposition import TranspositionTable
+
+
+def test_search_stats_empty():
+    """Test a new SearchStats object is empty."""
+    stats = SearchStats()
+    assert stats.nodes() == 0
+    assert stats.nodes_by_depth() == [0]
+    assert stats.cache_hit_rate() is None
+    assert json.loads(json.dumps(stats.to_dict()))["nodes"] == 0
+    assert "hit rate: n/a" in stats.summary()
+
+def test_stats_search_state():
+    """Test StatsSearchState records moves, wins and draws."""
+    with pytest.raises(TypeError):
+        StatsSearchState(Board(2), 2, stats=None)
+
+    stats = SearchStats()
+    state = StatsSearchState(Board(2, [0, 1, None, None]), 2, stats=stats)
+    assert isinstance(state, SearchState)
+    assert state.play(2, 0)
+    state.undo(2, 0)
+    assert state.play(3, 1)
+    state.undo(3, 1)
+    assert stats.nodes_by_depth() == [1, 2]
+    assert stats.wins() == 2
+    assert stats.draws() == 0
+
+    state = StatsSearchState(Board(3, [0, 1, 0, 0, 1, 1, 1, 0, None]), 2, stats=stats)
+    assert not state.play(8, 0)
+    assert stats.nodes_by_depth() == [2, 3]
+    assert stats.draws() == 1
+
+def test_stats_collate_fn():
+    """Test stats_collate_fn() records collapsed positions."""
+    stats = SearchStats()
+    collate = stats_collate_fn(lambda state, positions: [positions[:2], positions[2:]], stats)
+    assert collate(None, [1, 2, 3]) == [[1, 2], [3]]
+    assert stats.collate_calls() == 1
+    assert stats.symmetric_collapses() == 1
+    assert stats.collate_time() >= 0
+
+def test_move_win_stats_stats():
+    """Test move_win_stats() counts every game of an empty 3x3 board."""
+    board = Board(3, [0, None, None, None, None, None, None, None, None])
+    stats = SearchStats()
+    assert move_win_stats(board, 1, 2, stats=stats) == move_win_stats(board, 1, 2)
+    assert stats.nodes_by_depth()[:5] == [1, 8, 56, 336, 1680]
+    assert stats.wins() == sum(sum(wins) for wins in move_win_stats(board, 1, 2).values())
+    assert stats.draws() > 0
+    assert stats.pruned() > 0
+    assert stats.symmetric_collapses() == 0
+    assert stats.elapsed() >= stats.win_check_time() > 0
+
+def test_move_win_stats_draws():
+    """Test draws() counts the games below pruned positions, matching the
+    46080 drawn games of an empty 3x3 board."""
+    stats = SearchStats()
+    move_win_stats(Board(3), 0, 2, stats=stats)
+    assert stats.pruned() > 0
+    assert (stats.wins(), stats.draws()) == (209088, 46080)
+
+@pytest.mark.parametrize("board, cur_player, total_player", [
+    (Board(3), 0, 2),
+    (Board(3, [0, None, 1, None, None, None, None, None, 2]), 1, 3)
+])
+
+def test_move_win_stats_fast_stats(board, cur_player, total_player):
+    """Test move_win_stats_fast() records collation and cache statistics."""
+    table = TranspositionTable()
+    stats = SearchStats()
+    expected = move_win_stats_fast(board, cur_player, total_player, TranspositionTable())
+    assert move_win_stats_fast(board, cur_player, total_player, table, stats=stats) == expected
+    assert stats.cache_hits() == table.hits()
+    assert stats.cache_misses() == table.misses()
+    assert 0 < stats.cache_hit_rate() < 1
+    assert 0 < stats.collate_calls() <= stats.cache_misses() + 1
+    assert stats.nodes() == sum(stats.nodes_by_depth())
+
+    nodes = stats.nodes()
+    move_win_stats_fast(board, cur_player, total_player, table, stats=stats)
+    assert stats.nodes() > nodes
+
+def test_move_win_stats_stats_raises_ValueError():
+    """Test stats cannot be recorded by worker processes."""
+    with pytest.raises(ValueError):
+        move_win_stats_fast(Board(3), 0, 2, jobs=2, stats=SearchStats())
@@ -0,0 +1,102 @@
+"""Module docstring"""
+import csv
+import io
+import json
+import pytest
+from game.board import Board
+from game.stream import (CSV_OUTPUT_FIELDS, evaluate, read_csv, read_jsonl, write_csv,
+                         write_jsonl)
+from game.tictactoe import move_win_stats_fast
+
+
+POSITIONS = [
+    (Board(3, [0, None, None, None, 1, None, None, None, None]), 0, 2, None),
+    (Board(2), 1, 2, None),
+    (Board(3, [0, 1, None, None, None, None, None, None, None]), 2, 3, 2),
+    (Board(1), 0, 1, None),
+    (Board(3, [None, None, None, None, 0, None, None, None, None]), 1, 2, None)
+]
+
+def _records():
+    """Returns records holding POSITIONS and one error."""
+    records = [(idx, position, None) for idx, position in enumerate(POSITIONS)]
+    records.insert(2, ("bad", None, "board must be a list of side*side values."))
+    return records
+
+def _expected():
+    """Returns the results expected for _records()."""
+    return [(request_id, None, error) if error is not None
+            else (request_id, move_win_stats_fast(*position[:3], win_len=position[3]), None)
+            for request_id, position, error in _records()]
+
+def test_read_jsonl():
+    """Test read_jsonl() parses lines and numbers records without an id."""
+    lines = ['{"id": "a", "board": [0, null, null, 1], "player": 0, "players": 3}\n',
+             "\n",
+             '{"board": [null], "win_len": 1}\n',
+             '{"board": [null, null, null]}\n',
+             '{"board": [null, null, null, null], "side": 3}\n']
+    records = list(read_jsonl(lines))
+    assert records[0] == ("a", (Board(2, [0, None, None, 1]), 0, 3, 2), None)
+    assert records[1] == (3, (Board(1), 0, 2, 1), None)
+    assert records[2] == (4, None, "board must be a list of side*side values.")
+    assert records[3] == (5, None, "board must be a list of side*side values.")
+
+def test_read_csv():
+    """Test read_csv() parses rows and numbers records without an id."""
+    lines = ["id,side,cells,player,players,win_len\n",
+             "a,2,0..1,0,3,\n",
+             ",3,-0-----1-,1,,2\n",
+             "b,2,0.2.,0,2,\n",
+             "c,2,0..,0,2,\n",
+             "d,x,0...,0,2,\n",
+             "e,2,....,2,2,\n"]
+    records = list(read_csv(lines))
+    assert records[0] == ("a", (Board(2, [0, None, None, 1]), 0, 3, 2), None)
+    assert records[1] == (2, (Board(3, [None, 0, None, None, None, None, None, 1, None]),
+                              1, 2, 2), None)
+    assert records[2] == ("b", None, "game board values must be None or a player number.")
+    assert records[3] == ("c", None, "cells must hold side*side values.")
+    assert records[4] == ("d", None, "side, player, players and win_len must be integers.")
+    assert records[5] == ("e", None, "cur_player must be between 0 and total_player-1.")
+
+@pytest.mark.parametrize("jobs", [
+
+    1,
+    2
+])
+def test_evaluate_ordered(jobs):
+    """Test evaluate() yields results in input order."""
+    assert list(evaluate(iter(_records()), jobs)) == _expected()
+
+def test_evaluate_unordered():
+    """Test evaluate() yields every result when unordered."""
+    results = list(evaluate(iter(_records() * 3), 2, ordered=False, table_size=10))
+    assert sorted(results, key=repr) == sorted(_expected() * 3, key=repr)
+
+def test_evaluate_raises():
+    """Test evaluate() raises for bad table sizes."""
+    with pytest.raises(ValueError):
+        list(evaluate(_records(), 1, table_size=0))
+
+def test_write_jsonl():
+    """Test write_jsonl() writes one response line per result."""
+    out = io.StringIO()
+    write_jsonl(out, 1, {(0, 1): [1, 0], (0, 0): [2, 1]}, None)
+    write_jsonl(out, "bad", None, "oops")
+    lines = out.getvalue().splitlines()
+    assert json.loads(lines[0]) == {"id": 1, "win_stats": [{"row": 0, "col": 0, "wins": [2, 1]},
+                                                           {"row": 0, "col": 1, "wins": [1, 0]}]}
+    assert json.loads(lines[1]) == {"id": "bad", "error": "oops"}
+
+def test_write_csv():
+    """Test write_csv() writes one row per open location."""
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(CSV_OUTPUT_FIELDS)
+    write_csv(writer, 1, {(0, 1): [1, 0], (0, 0): [2, 1]}, None)
+    write_csv(writer, "bad", None, "oops")
+    rows = list(csv.DictReader(io.StringIO(out.getvalue())))
+    assert [tuple(row.values()) for row in rows] == [("1", "0", "0", "2 1", ""),
+                                                     ("1", "0", "1", "1 0", ""),
+                                                     ("bad", "", "", "", "oops")]
@@ -0,0 +1,92 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.bitboard import BitBoard
+from game.symmetry import (TRANSFORMS, canonical_form, canonical_key, inverse_transform,
+                           transform_board, transform_position, transform_win_stats)
+from game.tictactoe import move_win_stats
+
+
+def _board_3x3_Indexes():
+    """Returns 3x3 board initialized to location index values."""
+    return Board(3, [0, 1, 2, 3, 4, 5, 6, 7, 8])
+
+def _values(board):
+    """Returns list of board values in row first order."""
+    return [val for row in range(board.side_len()) for val in board.get_row(row)]
+
+def test_transform_raises():
+    """Test transform functions validate arguments."""
+    with pytest.raises(ValueError):
+        inverse_transform("rot45")
+    with pytest.raises(ValueError):
+        transform_position("rot45", (0, 0), 3)
+    with pytest.raises(ValueError):
+        transform_board(Board(3), "rot45")
+    with pytest.raises(TypeError):
+        transform_board(None, "identity")
+    with pytest.raises(TypeError):
+        canonical_form(None)
+    with pytest.raises(TypeError):
+        canonical_key(None, 0, 2)
+
+@pytest.mark.parametrize("transform, values", [
+    ("identity", [0, 1, 2, 3, 4, 5, 6, 7, 8]),
+    ("flip_lr", [2, 1, 0, 5, 4, 3, 8, 7, 6]),
+    ("flip_ud", [6, 7, 8, 3, 4, 5, 0, 1, 2]),
+    ("transpose", [0, 3, 6, 1, 4, 7, 2, 5, 8]),
+    ("anti_transpose", [8, 5, 2, 7, 4, 1, 6, 3, 0]),
+    ("rot90", [6, 3, 0, 7, 4, 1, 8, 5, 2]),
+    ("rot180", [8, 7, 6, 5, 4, 3, 2, 1, 0]),
+    ("rot270", [2, 5, 8, 1, 4, 7, 0, 3, 6])
+])
+
+def test_transform_board(transform, values):
+    """Test transform_board()."""
+    assert _values(transform_board(_board_3x3_Indexes(), transform)) == values
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+
+def test_inverse_transform(transform):
+    """Test inverse_transform() undoes the transform."""
+    inverse = inverse_transform(transform)
+    board = _board_3x3_Indexes()
+    assert _values(transform_board(transform_board(board, transform), inverse)) == _values(board)
+    for pos in [(0, 0), (0, 1), (1, 2), (2, 2)]:
+        assert transform_position(inverse, transform_position(transform, pos, 3), 3) == pos
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+
+def test_canonical_form(transform):
+    """Test canonical_form() is shared by every board in the orbit."""
+    board = Board(4, [0, None, 1, None, None, 1, None, None, 0, None, None, None, None, None, 0, 1])
+    sym_board = transform_board(board, transform)
+
+    (canon, canon_transform) = canonical_form(board)
+    (sym_canon, sym_transform) = canonical_form(sym_board)
+    assert _values(canon) == _values(sym_canon)
+    assert _values(transform_board(board, canon_transform)) == _values(canon)
+    assert canonical_key(board, 0, 2) == canonical_key(sym_board, 0, 2)
+
+    bb = BitBoard.from_board(board, 2)
+    sym_bb = BitBoard.from_board(sym_board, 2)
+    (bb_canon, bb_transform) = canonical_form(bb)
+    assert bb_canon.masks() == canonical_form(sym_bb)[0].masks()
+    assert transform_board(bb, bb_transform).masks() == bb_canon.masks()
+    assert canonical_key(bb, 0, 2) == canonical_key(sym_bb, 0, 2)
+
+def test_canonical_key_differs():
+    """Test canonical_key() separates boards from different orbits."""
+    board = Board(3, [0, None, None, None, None, None, None, None, None])
+    other = Board(3, [None, 0, None, None, None, None, None, None, None])
+    assert canonical_key(board, 1, 2) != canonical_key(other, 1, 2)
+    assert canonical_key(board, 1, 2) != canonical_key(board, 0, 2)
+
+@pytest.mark.parametrize("transform", TRANSFORMS)
+
+def test_transform_win_stats(transform):
+    """Test transform_win_stats() maps stats to the transformed board."""
+    board = Board(3, [0, None, 1, None, 0, None, None, 1, None])
+    win_stats = move_win_stats(board, 0, 2)
+    sym_stats = move_win_stats(transform_board(board, transform), 0, 2)
+    assert transform_win_stats(win_stats, transform, 3) == sym_stats
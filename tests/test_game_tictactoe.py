@@ -1,6 +1,11 @@
 """Module docstring"""
+import sys
 import pytest
-from game.tictactoe import next_player, is_winning_move, matching_positions, is_symmetric
+from game.tictactoe import next_player, is_winning_move, matching_positions, is_symmetric, solve, best_move
+from game.tictactoe import iter_move_win_stats, move_win_stats, move_win_stats_fast
+from game.tictactoe import _collate_symmetric_positions
+from game.search import SearchState
+from game.transposition import TranspositionTable
 from game.board import Board
 
 
@@ -91,19 +96,6 @@ def test_matching_positions(board, val, matches):
     assert matching_positions(board, val) == matches
 
 
-def _is_match(board1, board2):
-    """Returns True if the boards have the same size and values. 
-    Otherwise, returns False."""
-    if board1.side_len() != board2.side_len():
-        return False
-
-    for row in range(board1.side_len()):
-        for col in range(board2.side_len()):
-            if board1.get(row, col) != board2.get(row, col):
-                return False
-    
-    return True
-
 def test_is_symmetric_raises_TypeError():
     """Tests is_symmetric raises TypeError."""
     with pytest.raises(TypeError):
@@ -134,3 +126,222 @@ def test_is_symmetric_raises_TypeError():
 def test_is_symmetric(board, symmetry_fn, result):
     """Tests is_symmetric."""
     assert is_symmetric(board, symmetry_fn) == result
+
+
+def test_solve_raises():
+    """Tests solve() and best_move() validate arguments."""
+    with pytest.raises(TypeError):
+        solve(None, 0, 2)
+    with pytest.raises(ValueError):
+        solve(Board(3), 2, 2)
+    with pytest.raises(ValueError):
+        best_move(Board(3), 0, 2, max_depth=-1)
+    with pytest.raises(ValueError):
+        best_move(Board(3), 0, 2, win_len=4)
+
+def _minimax(board, cur_player, root_player, total_player):
+    """Returns the outcome of plain minimax for the root player."""
+    values = []
+    for (row, col) in matching_positions(board, None):
+        new_board = board.set(row, col, cur_player)
+        if is_winning_move(new_board, row, col):
+            values.append(1 if cur_player == root_player else -1)
+        else:
+            values.append(_minimax(new_board, next_player(cur_player, total_player),
+                                   root_player, total_player))
+    if len(values) == 0:
+        return 0
+    return max(values) if cur_player == root_player else min(values)
+
+@pytest.mark.parametrize("board, cur_player, total_player", [
+    (Board(3, [0, None, None, None, 1, None, None, None, None]), 0, 2),
+    (Board(3, [None, 0, None, None, None, None, None, None, None]), 1, 2),
+    (Board(3, [0, 0, None, None, 1, 1, None, None, None]), 0, 2),
+    (Board(3, [0, 0, None, None, 1, 1, None, None, None]), 1, 2),
+    (Board(3, [0, None, 1, None, 2, None, None, None, None]), 0, 3),
+    (Board(3, [0, 1, 0, 1, 1, 0, 0, 1, 0]), 0, 2)
+])
+
+def test_solve(board, cur_player, total_player):
+    """Tests solve() and best_move() agree with plain minimax."""
+    values = solve(board, cur_player, total_player)
+    assert sorted(values.keys()) == matching_positions(board, None)
+
+    for (row, col), value in values.items():
+        new_board = board.set(row, col, cur_player)
+        if is_winning_move(new_board, row, col):
+            expected = 1
+        else:
+            expected = _minimax(new_board, next_player(cur_player, total_player),
+                                cur_player, total_player)
+        assert value == expected
+
+    move = best_move(board, cur_player, total_player)
+    if len(values) == 0:
+        assert move is None
+    else:
+        assert move[1] == max(values.values())
+        assert values[move[0]] == move[1]
+
+def test_best_move_prefers_center():
+    """Tests best_move() tries the center first on an empty board."""
+    assert best_move(Board(3), 0, 2) == ((1, 1), 0)
+
+def test_solve_max_depth():
+    """Tests solve() estimates values at the depth limit."""
+    values = solve(Board(4), 0, 2, max_depth=1)
+    for value in values.values():
+        assert -1 < value < 1
+    assert values[(1, 1)] > values[(0, 1)]
+
+    values = solve(Board(3), 0, 2, max_depth=0, eval_fn=lambda board, player: 0.5)
+    assert set(values.values()) == {0.5}
+
+def test_iter_move_win_stats_raises():
+    """Tests iter_move_win_stats() validates arguments."""
+    with pytest.raises(TypeError):
+        list(iter_move_win_stats(None, 0, 2))
+    with pytest.raises(ValueError):
+        list(iter_move_win_stats(Board(3), 0, 2, win_len=4))
+    with pytest.raises(ValueError):
+        list(iter_move_win_stats(Board(3), 0, 2, progress_fn=print, progress_interval=0))
+
+@pytest.mark.parametrize("board, cur_player, total_player, symmetric", [
+    (Board(3, [0, None, None, None, 1, None, None, None, None]), 0, 2, True),
+    (Board(3, [0, None, None, None, 1, None, None, None, None]), 0, 2, False),
+    (Board(3, [0, None, 1, None, None, None, None, None, 2]), 1, 3, True),
+    (Board(3, [0, 1, 0, 1, 1, 0, None, 0, 1]), 0, 2, True)
+])
+
+def test_iter_move_win_stats(board, cur_player, total_player, symmetric):
+    """Tests iter_move_win_stats() streams the move_win_stats() result."""
+    expected = move_win_stats(board, cur_player, total_player)
+    win_stats = {}
+    for positions, wins in iter_move_win_stats(board, cur_player, total_player,
+                                               TranspositionTable(), symmetric=symmetric):
+        assert positions == sorted(positions)
+        if not symmetric:
+            assert len(positions) == 1
+        for pos in positions:
+            assert pos not in win_stats
+            win_stats[pos] = wins
+    assert win_stats == expected
+
+def test_iter_move_win_stats_progress():
+    """Tests iter_move_win_stats() reports progress down to no remaining subtrees."""
+    board = Board(3, [0, None, None, None, None, None, None, None, None])
+    events = []
+    results = list(iter_move_win_stats(board, 1, 2, progress_fn=lambda nodes, remaining:
+                                       events.append((nodes, remaining)), progress_interval=50))
+
+    assert events[-1][1] == 0
+    assert [nodes for nodes, remaining in events] == sorted(nodes for nodes, remaining in events)
+    assert [remaining for nodes, remaining in events] == \
+        sorted((remaining for nodes, remaining in events), reverse=True)
+    assert len(events) > len(results)
+    assert dict((pos, wins) for positions, wins in results for pos in positions) == \
+        move_win_stats_fast(board, 1, 2)
+
+def test_move_win_stats_raises_ValueError():
+    """Tests move_win_stats() validates the players once at the boundary."""
+    with pytest.raises(ValueError):
+        move_win_stats(Board(3), 2, 2)
+    with pytest.raises(ValueError):
+        move_win_stats_fast(Board(2, 0), 0, 0)
+    with pytest.raises(TypeError):
+        move_win_stats_fast(None, 0, 2)
+
+def test_is_symmetric_raises_ValueError():
+    """Tests is_symmetric() validates the symmetric locations."""
+    with pytest.raises(ValueError):
+        is_symmetric(Board(3), lambda pos: (pos[0] - 1, pos[1]))
+
+@pytest.mark.parametrize("vals, cur_player, total_player, win_len", [
+    ([0, None, None, None, None, None, None, None, None], 1, 2, None),
+    ([0, None, 1, None, None, None, None, None, 2], 1, 3, None),
+    ([0, "X", None, None, None, None, None, 1, None], 0, 2, None),
+    ([0, 1, 0, 1, 1, 0, 0, 1, 0], 0, 2, None),
+    ([0, 1, None, None, 1, 0, None, 0, None, 1, 0, 1, None, 0, None, 1], 0, 2, 3)
+])
+
+def test_iterative_engine(vals, cur_player, total_player, win_len):
+    """Tests the iterative engine gives the same statistics as the recursive one."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    expected = move_win_stats(board, cur_player, total_player, win_len=win_len)
+
+    for search in (move_win_stats, move_win_stats_fast):
+        assert search(board, cur_player, total_player, win_len=win_len,
+                      engine="iterative") == expected
+        assert search(board, cur_player, total_player, TranspositionTable(), win_len=win_len,
+                      engine="iterative") == expected
+
+@pytest.mark.parametrize("search", [
+    move_win_stats,
+    move_win_stats_fast
+])
+
+def test_table_shares_shifted_players(search):
+    """Tests a table kept across searches serves positions whose players
+    and player to move are cyclically shifted."""
+    board = Board(3, [0, None, 1, None, None, None, None, None, 2])
+    shifted = Board(3, [1, None, 2, None, None, None, None, None, 0])
+    table = TranspositionTable()
+    assert search(board, 1, 3, table) == move_win_stats(board, 1, 3)
+
+    (hits, misses) = (table.hits(), table.misses())
+    result = search(shifted, 2, 3, table)
+    assert result == move_win_stats(shifted, 2, 3)
+    assert table.misses() == misses
+    assert table.hits() > hits
+
+@pytest.mark.parametrize("vals", [
+    [None] * 9,
+    [0, None, None, None, 1, None, None, None, None],
+    [None, 0, None, 1, None, 1, None, 0, None],
+    [None] * 16,
+    [0, None, None, 0, None, 1, None, None, None, None, 1, None, 0, None, None, 0]
+])
+
+def test_collate_symmetric_positions(vals):
+    """Tests symmetric collation groups a Board's and a SearchState's open
+    positions into the same orbits."""
+    board = Board(int(len(vals) ** 0.5), vals)
+    open_positions = SearchState(board, 2).open_positions()
+    groups = _collate_symmetric_positions(board, list(open_positions))
+    state_groups = _collate_symmetric_positions(SearchState(board, 2), list(open_positions))
+    assert sorted(sorted(group) for group in groups) == \
+        sorted(sorted(group) for group in state_groups)
+    assert sorted(pos for group in groups for pos in group) == sorted(open_positions)
+
+    if board.side_len() == 3:
+        win_stats = move_win_stats(board, 0, 2)
+        for group in groups:
+            assert all(win_stats[pos] == win_stats[group[-1]] for pos in group)
+
+def _stack_depth():
+    """Returns the current recursion depth."""
+    def probe(calls):
+        try:
+            return probe(calls + 1)
+        except RecursionError:
+            return calls
+    return sys.getrecursionlimit() - probe(0)
+
+def test_iterative_engine_recursion_limit():
+    """Tests the iterative engine's stack depth does not grow with the tree."""
+    board = Board(3, [None, 1, None, None, None, None, None, None, None])
+    expected = move_win_stats_fast(board, 0, 2)
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(_stack_depth() + 10)
+    try:
+        result = move_win_stats_fast(board, 0, 2, engine="iterative")
+        with pytest.raises(RecursionError):
+            move_win_stats_fast(board, 0, 2, engine="recursive")
+    finally:
+        sys.setrecursionlimit(limit)
+    assert result == expected
+
+def test_engine_raises_ValueError():
+    """Tests move_win_stats() validates engine."""
+    with pytest.raises(ValueError):
+        move_win_stats(Board(3), 0, 2, engine="stack")
@@ -0,0 +1,72 @@
+"""Module docstring"""
+import pytest
+from game.board import Board
+from game.transposition import TranspositionTable
+from game.tictactoe import move_win_stats, move_win_stats_fast
+
+
+def test_transposition_table_raises_ValueError():
+    """Test TranspositionTable constructor validates arguments."""
+    with pytest.raises(ValueError):
+        TranspositionTable(0)
+    with pytest.raises(ValueError):
+        TranspositionTable(10, "fifo")
+
+def test_get_put():
+    """Test TranspositionTable.get() and TranspositionTable.put() counters."""
+    table = TranspositionTable()
+    assert table.get("a") is None
+    table.put("a", [1, 2])
+    assert table.get("a") == [1, 2]
+    assert "a" in table
+    assert len(table) == 1
+    assert table.hits() == 1
+    assert table.misses() == 1
+    table.clear()
+    assert len(table) == 0
+    assert table.hits() == 0
+
+def test_lru_eviction():
+    """Test lru policy evicts the least recently used entry."""
+    table = TranspositionTable(2, "lru")
+    table.put("a", 1)
+    table.put("b", 2)
+    table.get("a")
+    table.put("c", 3)
+    assert "a" in table
+    assert "b" not in table
+    assert "c" in table
+    assert table.evictions() == 1
+
+def test_depth_eviction():
+    """Test depth policy keeps the deepest entries."""
+    table = TranspositionTable(2, "depth")
+    table.put("a", 1, 5)
+    table.put("b", 2, 3)
+    table.put("c", 3, 1)
+    assert "c" not in table
+    table.put("d", 4, 4)
+    assert "a" in table
+    assert "b" not in table
+    assert "d" in table
+    assert len(table) == 2
+
+@pytest.mark.parametrize("vals, cur_player, total_player", [
+    ([0, None, None, None, 1, None, None, None, None], 0, 2),
+    ([0, None, 1, None, None, None, None, None, 2], 1, 3),
+    (["X", None, 0, None, None, None, 1, None, None], 0, 2)
+])
+
+def test_move_win_stats_table(vals, cur_player, total_player):
+    """Test move_win_stats() results do not depend on the table."""
+    board = Board(3, vals)
+    expected = move_win_stats(board, cur_player, total_player)
+
+    for table in [TranspositionTable(), TranspositionTable(8, "lru"), TranspositionTable(8, "depth")]:
+        assert move_win_stats(board, cur_player, total_player, table) == expected
+        assert move_win_stats_fast(board, cur_player, total_player, table) == expected
+        assert table.max_entries() is None or len(table) <= table.max_entries()
+
+    table = TranspositionTable()
+    move_win_stats(board, cur_player, total_player, table)
+    assert table.hits() > 0
@@ -0,0 +1,30 @@
+"""Module docstring"""
+import pytest
+from game.zobrist import KEY_MASK, blocked_key, board_key, cell_key, side_key, win_len_key
+
+
+def test_cell_key():
+    """Test cell_key() is repeatable and separates locations and values."""
+    assert cell_key(3, 0, None) == 0
+    assert cell_key(3, 4, 1) == cell_key(3, 4, 1)
+    assert 0 < cell_key(3, 4, 1) <= KEY_MASK
+    assert cell_key(3, 4, 1) == cell_key(3, 4, 1.0)
+    keys = set(cell_key(side, idx, val) for side in (3, 4) for idx in range(9)
+               for val in (0, 1, "X"))
+    assert len(keys) == 2*9*3
+    with pytest.raises(TypeError):
+        cell_key(3, 0, [])
+
+def test_board_key():
+    """Test board_key() combines the side and location keys."""
+    assert board_key(3, [None]*9) == side_key(3)
+    assert board_key(3, [0, None, 1] + [None]*6) == \
+        side_key(3) ^ cell_key(3, 0, 0) ^ cell_key(3, 2, 1)
+    assert board_key(3, [None]*9) != board_key(4, [None]*16)
+
+def test_blocked_and_win_len_keys():
+    """Test blocked_key() and win_len_key() give distinct keys."""
+    keys = [blocked_key(3, idx) for idx in range(9)] + \
+        [win_len_key(3, win_len) for win_len in range(1, 4)] + [win_len_key(4, 3)]
+    assert len(set(keys)) == len(keys)
+    assert blocked_key(3, 0) == blocked_key(3, 0)